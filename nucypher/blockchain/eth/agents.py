@@ -18,12 +18,22 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import math
 import random
-from typing import Generator, List, Tuple, Union
+import time
+from bisect import bisect_right
+from collections import namedtuple
+from itertools import accumulate
+from typing import Generator, Iterable, List, Tuple, Union
 
+import requests
 from constant_sorrow.constants import NO_CONTRACT_AVAILABLE
+from eth_abi import decode_abi
+from eth_utils import to_bytes
 from eth_utils.address import to_checksum_address
 from twisted.logger import Logger
-from web3.contract import Contract
+from web3 import HTTPProvider
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract import Contract, ContractFunction
 
 from nucypher.blockchain.eth.constants import (
     DISPATCHER_CONTRACT_NAME,
@@ -66,6 +76,38 @@ class ContractAgency:
             return agent
 
 
+#
+# JSON-RPC Batches
+#
+# web3 doesn't support batch requests, so this is the only place where its private helpers
+# for encoding calls and decoding their results are used.  Batches are posted directly to the
+# HTTP endpoint, bypassing web3's middleware, so they only carry plain eth_calls.
+#
+
+def _supports_batch_requests(provider) -> bool:
+    return isinstance(provider, HTTPProvider)
+
+
+def _post_batch_request(provider: HTTPProvider, payload: List[dict]) -> List[dict]:
+    response = requests.post(provider.endpoint_uri, json=payload, **provider.get_request_kwargs())
+    response.raise_for_status()
+    return response.json()
+
+
+def _encode_eth_call(function: ContractFunction) -> dict:
+    return dict(to=function.address, data=function._encode_transaction_data())
+
+
+def _decode_eth_call_result(function: ContractFunction, result: str):
+    """Decodes raw eth_call output the same way ContractFunction.call does."""
+    output_types = get_abi_output_types(function.abi)
+    decoded = decode_abi(output_types, to_bytes(hexstr=result))
+    normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+    if len(normalized) == 1:
+        return normalized[0]
+    return normalized
+
+
 class EthereumContractAgent:
     """
     Base class for ethereum contract wrapper types that interact with blockchain contract instances
@@ -78,9 +120,14 @@ class EthereumContractAgent:
     # TODO - #842: Gas Management
     DEFAULT_TRANSACTION_GAS_LIMITS = {}
 
+    MAX_BATCH_SIZE = 200  # contract calls per JSON-RPC batch request
+
     class ContractNotDeployed(Exception):
         pass
 
+    class BatchCallFailed(RuntimeError):
+        pass
+
     def __init__(self,
                  registry: BaseContractRegistry,
                  provider_uri: str = None,
@@ -139,6 +186,38 @@ class EthereumContractAgent:
             return None
         return self.contract.functions.owner().call()
 
+    def batch_call(self, contract_functions: Iterable[ContractFunction]) -> list:
+        """
+        Calls several read-only contract functions, returning their results in order.
+
+        Over an HTTP provider the calls are coalesced into JSON-RPC batch requests of up to
+        MAX_BATCH_SIZE calls each, all made against the same block; other providers
+        don't support batches, so the calls are made one by one.
+        """
+        contract_functions = list(contract_functions)
+        provider = self.blockchain.w3.provider
+        if len(contract_functions) < 2 or not _supports_batch_requests(provider):
+            return [function.call() for function in contract_functions]
+
+        block_identifier = hex(self.blockchain.w3.eth.blockNumber)
+        results = list()
+        for start in range(0, len(contract_functions), self.MAX_BATCH_SIZE):
+            batch = contract_functions[start:start+self.MAX_BATCH_SIZE]
+            payload = [dict(jsonrpc='2.0',
+                            id=request_id,
+                            method='eth_call',
+                            params=[_encode_eth_call(function), block_identifier])
+                       for request_id, function in enumerate(batch)]
+            responses = {r['id']: r for r in _post_batch_request(provider, payload)}
+            for request_id, function in enumerate(batch):
+                try:
+                    result = responses[request_id]['result']
+                except KeyError:
+                    error = responses.get(request_id, dict()).get('error', 'no response')
+                    raise self.BatchCallFailed(f"{function.fn_name} failed in batch call: {error}")
+                results.append(_decode_eth_call_result(function=function, result=result))
+        return results
+
     @validate_checksum_address
     def transfer_ownership(self, sender_address: str, checksum_address: str, transaction_gas_limit: int = None) -> dict:
         contract_function = self.contract.functions.transferOwnership(checksum_address)
@@ -188,9 +267,25 @@ class StakingEscrowAgent(EthereumContractAgent):
 
     DEFAULT_PAGINATION_SIZE = 30    # TODO: Use dynamic pagination size (see #1424)
 
+    StakerDetails = namedtuple('StakerDetails', ('owned_tokens',
+                                                 'locked_tokens',
+                                                 'last_active_period',
+                                                 'worker',
+                                                 'is_restaking',
+                                                 'is_restaking_locked',
+                                                 'restake_lock_period'))
+
+    SAMPLING_PERIOD_REFRESH_INTERVAL = 60  # seconds between checks of the current period on-chain when sampling
+
     class NotEnoughStakers(Exception):
         pass
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__sampling_distributions = dict()  # duration -> (period, stakers, cumulative locked tokens)
+        self.__sampling_period = None
+        self.__sampling_period_checked_at = None
+
     #
     # Staker Network Status
     #
@@ -206,7 +301,7 @@ class StakingEscrowAgent(EthereumContractAgent):
     def get_stakers(self) -> List[str]:
         """Returns a list of stakers"""
         num_stakers = self.get_staker_population()
-        stakers = [self.contract.functions.stakers(i).call() for i in range(num_stakers)]
+        stakers = self.batch_call(self.contract.functions.stakers(i) for i in range(num_stakers))
         return stakers
 
     def partition_stakers_by_activity(self) -> Tuple[List[str], List[str], List[str]]:
@@ -215,13 +310,12 @@ class StakingEscrowAgent(EthereumContractAgent):
         The second, stakers that confirmed for current period but haven't confirmed next yet.
         The third contains stakers that have missed activity confirmation before current period"""
 
-        num_stakers = self.get_staker_population()
+        stakers = self.get_stakers()
         current_period = self.get_current_period()
+        last_active_periods = self.batch_call(self.contract.functions.getLastActivePeriod(staker) for staker in stakers)
 
         active_stakers, pending_stakers, missing_stakers = [], [], []
-        for i in range(num_stakers):
-            staker = self.contract.functions.stakers(i).call()
-            last_active_period = self.get_last_active_period(staker)
+        for staker, last_active_period in zip(stakers, last_active_periods):
             if last_active_period == current_period + 1:
                 active_stakers.append(staker)
             elif last_active_period == current_period:
@@ -292,6 +386,42 @@ class StakingEscrowAgent(EthereumContractAgent):
     def get_staker_info(self, staker_address: str):
         return self.contract.functions.stakerInfo(staker_address).call()
 
+    @staticmethod
+    def _restake_flag(staker_info) -> bool:
+        return bool(staker_info[3])  # TODO: #1348 Use constant or enum
+
+    @staticmethod
+    def _restake_lock_period(staker_info) -> int:
+        return int(staker_info[4])  # TODO: #1348 Use constant or enum
+
+    def get_stakers_details(self, stakers: List[str]) -> List['StakingEscrowAgent.StakerDetails']:
+        """
+        Returns what there is to know at a glance about each of these stakers, in order,
+        reading it for all of them in as few requests as possible.
+        """
+        functions = self.contract.functions
+        calls_per_staker = 6
+        results = self.batch_call(function
+                                  for staker in stakers
+                                  for function in (functions.getAllTokens(staker),
+                                                   functions.getLockedTokens(staker, 0),
+                                                   functions.getLastActivePeriod(staker),
+                                                   functions.getWorkerFromStaker(staker),
+                                                   functions.stakerInfo(staker),
+                                                   functions.isReStakeLocked(staker)))
+
+        stakers_details = list()
+        for start in range(0, len(results), calls_per_staker):
+            owned, locked, last_active_period, worker, staker_info, restake_locked = results[start:start+calls_per_staker]
+            stakers_details.append(self.StakerDetails(owned_tokens=owned,
+                                                      locked_tokens=locked,
+                                                      last_active_period=int(last_active_period),
+                                                      worker=to_checksum_address(worker),
+                                                      is_restaking=self._restake_flag(staker_info),
+                                                      is_restaking_locked=restake_locked,
+                                                      restake_lock_period=self._restake_lock_period(staker_info)))
+        return stakers_details
+
     @validate_checksum_address
     def get_locked_tokens(self, staker_address: str, periods: int = 0) -> int:
         """
@@ -417,8 +547,7 @@ class StakingEscrowAgent(EthereumContractAgent):
     @validate_checksum_address
     def is_restaking(self, staker_address: str) -> bool:
         staker_info = self.get_staker_info(staker_address)
-        restake_flag = bool(staker_info[3])  # TODO: #1348 Use constant or enum
-        return restake_flag
+        return self._restake_flag(staker_info)
 
     @validate_checksum_address
     def is_restaking_locked(self, staker_address: str) -> bool:
@@ -447,8 +576,7 @@ class StakingEscrowAgent(EthereumContractAgent):
     @validate_checksum_address
     def get_restake_unlock_period(self, staker_address: str) -> int:
         staker_info = self.get_staker_info(staker_address)
-        restake_unlock_period = int(staker_info[4])  # TODO: #1348 Use constant or enum
-        return restake_unlock_period
+        return self._restake_lock_period(staker_info)
 
     def staking_parameters(self) -> Tuple:
         parameter_signatures = (
@@ -485,9 +613,45 @@ class StakingEscrowAgent(EthereumContractAgent):
 
         """
 
-        for index in range(self.get_staker_population()):
-            staker_address = self.contract.functions.stakers(index).call()
-            yield staker_address
+        population = self.get_staker_population()
+        for start in range(0, population, self.MAX_BATCH_SIZE):
+            indices = range(start, min(start + self.MAX_BATCH_SIZE, population))
+            yield from self.batch_call(self.contract.functions.stakers(index) for index in indices)
+
+    def get_sampling_distribution(self, duration: int, pagination_size: int = None) -> Tuple[List[str], List[int]]:
+        """
+        Returns the active stakers with tokens locked for at least `duration` periods,
+        along with the running total of their locked tokens, as used for sampling.
+
+        The set of active stakers only changes from one period to the next,
+        so this is fetched once per period and duration; the current period itself
+        is checked at most every SAMPLING_PERIOD_REFRESH_INTERVAL seconds.
+        """
+        current_period = self.__current_sampling_period()
+        try:
+            period, stakers, cumulative_tokens = self.__sampling_distributions[duration]
+            if period == current_period:
+                return stakers, cumulative_tokens
+        except KeyError:
+            pass
+
+        _n_tokens, active_stakers = self.get_all_active_stakers(periods=duration, pagination_size=pagination_size)
+        active_stakers = [(staker, tokens) for staker, tokens in active_stakers if tokens > 0]
+        stakers = [to_checksum_address(staker) for staker, _tokens in active_stakers]
+        cumulative_tokens = list(accumulate(tokens for _staker, tokens in active_stakers))
+
+        # Distributions of past periods are of no use anymore.
+        self.__sampling_distributions = {d: distribution for d, distribution in self.__sampling_distributions.items()
+                                         if distribution[0] == current_period}
+        self.__sampling_distributions[duration] = (current_period, stakers, cumulative_tokens)
+        return stakers, cumulative_tokens
+
+    def __current_sampling_period(self) -> int:
+        checked_at = self.__sampling_period_checked_at
+        if checked_at is None or time.monotonic() - checked_at >= self.SAMPLING_PERIOD_REFRESH_INTERVAL:
+            self.__sampling_period = self.get_current_period()
+            self.__sampling_period_checked_at = time.monotonic()
+        return self.__sampling_period
 
     def sample(self,
                quantity: int,
@@ -518,34 +682,19 @@ class StakingEscrowAgent(EthereumContractAgent):
         """
 
         system_random = random.SystemRandom()
-        n_tokens, stakers = self.get_all_active_stakers(periods=duration, pagination_size=pagination_size)
+        stakers, cumulative_tokens = self.get_sampling_distribution(duration=duration, pagination_size=pagination_size)
+        n_tokens = cumulative_tokens[-1] if cumulative_tokens else 0
         if n_tokens == 0:
             raise self.NotEnoughStakers('There are no locked tokens for duration {}.'.format(duration))
 
         sample_size = quantity
         for _ in range(attempts):
             sample_size = math.ceil(sample_size * additional_ursulas)
-            points = sorted(system_random.randrange(n_tokens) for _ in range(sample_size))
+            points = [system_random.randrange(n_tokens) for _ in range(sample_size)]
             self.log.debug(f"Sampling {sample_size} stakers with random points: {points}")
 
-            addresses = set()
-
-            point_index = 0
-            sum_of_locked_tokens = 0
-            staker_index = 0
-            stakers_len = len(stakers)
-            while staker_index < stakers_len and point_index < sample_size:
-                current_staker = stakers[staker_index][0]
-                staker_tokens = stakers[staker_index][1]
-                next_sum_value = sum_of_locked_tokens + staker_tokens
-
-                point = points[point_index]
-                if sum_of_locked_tokens <= point < next_sum_value:
-                    addresses.add(to_checksum_address(current_staker))
-                    point_index += 1
-                else:
-                    staker_index += 1
-                    sum_of_locked_tokens = next_sum_value
+            # The staker whose stake covers a point is the first whose cumulative stake exceeds it.
+            addresses = set(stakers[bisect_right(cumulative_tokens, point)] for point in points)
 
             self.log.debug(f"Sampled {len(addresses)} stakers: {list(addresses)}")
             if len(addresses) >= quantity:
@@ -620,8 +769,17 @@ class PolicyManagerAgent(EthereumContractAgent):
 
     @validate_checksum_address
     def get_reward_amount(self, staker_address: str) -> int:
-        reward_amount = self.contract.functions.nodes(staker_address).call()[0]
-        return reward_amount
+        node_info = self.contract.functions.nodes(staker_address).call()
+        return self._reward_amount(node_info)
+
+    def get_reward_amounts(self, stakers: List[str]) -> List[int]:
+        """Returns the unclaimed reward of each of these stakers, in order, reading them in as few requests as possible."""
+        nodes_info = self.batch_call(self.contract.functions.nodes(staker) for staker in stakers)
+        return [self._reward_amount(node_info) for node_info in nodes_info]
+
+    @staticmethod
+    def _reward_amount(node_info) -> int:
+        return node_info[0]
 
 
 class PreallocationEscrowAgent(EthereumContractAgent):
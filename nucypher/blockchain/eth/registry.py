@@ -20,6 +20,7 @@ import os
 import shutil
 import tempfile
 from abc import ABC, abstractmethod
+from collections import defaultdict, namedtuple
 from json import JSONDecodeError
 from os.path import dirname, abspath
 from typing import Union, Iterator, List, Dict, Type
@@ -221,8 +222,12 @@ class BaseContractRegistry(ABC):
     class CantOverwriteRegistry(RegistryError):
         pass
 
+    # Parsed registry contents, along with their id and lookup indices
+    _Snapshot = namedtuple('Snapshot', ('state', 'data', 'id', 'records_by_name', 'records_by_address'))
+
     def __init__(self, source=NO_REGISTRY_SOURCE, *args, **kwargs):
         self.__source = source
+        self.__snapshot = None
         self.log = Logger("registry")
 
     def __eq__(self, other) -> bool:
@@ -237,10 +242,49 @@ class BaseContractRegistry(ABC):
     @property
     def id(self) -> str:
         """Returns a hexstr of the registry contents."""
-        blake = hashlib.blake2b()
-        blake.update(json.dumps(self.read()).encode())
-        digest = blake.digest().hex()
-        return digest
+        return self._snapshot().id
+
+    def _state(self):
+        """
+        Identifies the current state of the registry's backing storage, so that changes made behind
+        our back can be noticed.  Changes made through this instance also call _invalidate.
+        """
+        return None
+
+    def _invalidate(self) -> None:
+        self.__snapshot = None
+
+    def _snapshot(self) -> 'BaseContractRegistry._Snapshot':
+        """
+        Returns the parsed registry contents, reading them only if they have changed since last time.
+        The returned data is shared; use read() to get a copy that can be modified.
+        """
+        state = self._state()
+        snapshot = self.__snapshot
+        if snapshot is None or snapshot.state != state:
+            registry_data = self.read()
+
+            blake = hashlib.blake2b()
+            blake.update(json.dumps(registry_data).encode())
+            digest = blake.digest().hex()
+
+            records_by_name, records_by_address = defaultdict(list), defaultdict(list)
+            if self._multi_contract:
+                try:
+                    for name, address, abi in registry_data:
+                        record = (name, address, abi)
+                        records_by_name[name].append(record)
+                        records_by_address[address].append(record)
+                except ValueError:
+                    records_by_name = records_by_address = None  # Corrupted; reported upon search.
+
+            snapshot = self._Snapshot(state=state,
+                                      data=registry_data,
+                                      id=digest,
+                                      records_by_name=records_by_name,
+                                      records_by_address=records_by_address)
+            self.__snapshot = snapshot
+        return snapshot
 
     @abstractmethod
     def _destroy(self) -> None:
@@ -309,18 +353,17 @@ class BaseContractRegistry(ABC):
         if not (bool(contract_name) ^ bool(contract_address)):
             raise ValueError("Pass contract_name or contract_address, not both.")
 
-        contracts = list()
-        registry_data = self.read()
-
-        try:
-            for name, addr, abi in registry_data:
-                if contract_name == name or contract_address == addr:
-                    contracts.append((name, addr, abi))
-        except ValueError:
+        snapshot = self._snapshot()
+        if snapshot.records_by_name is None:
             message = "Missing or corrupted registry data"
             self.log.critical(message)
             raise self.InvalidRegistry(message)
 
+        if contract_name:
+            contracts = snapshot.records_by_name.get(contract_name, list())
+        else:
+            contracts = snapshot.records_by_address.get(contract_address, list())
+
         if not contracts:
             raise self.UnknownContract(contract_name)
 
@@ -352,8 +395,16 @@ class LocalContractRegistry(BaseContractRegistry):
 
     def _swap_registry(self, filepath: str) -> bool:
         self.__filepath = filepath
+        self._invalidate()
         return True
 
+    def _state(self):
+        try:
+            stat = os.stat(self.__filepath)
+        except FileNotFoundError:
+            return None
+        return self.__filepath, stat.st_mtime_ns, stat.st_size
+
     def read(self) -> Union[list, dict]:
         """
         Reads the registry file and parses the JSON and returns a list.
@@ -396,9 +447,11 @@ class LocalContractRegistry(BaseContractRegistry):
             registry_file.seek(0)
             registry_file.write(json.dumps(registry_data))
             registry_file.truncate()
+        self._invalidate()
 
     def _destroy(self) -> None:
         os.remove(self.filepath)
+        self._invalidate()
 
     @classmethod
     def from_dict(cls, payload: dict, **overrides) -> 'LocalContractRegistry':
@@ -421,6 +474,7 @@ class TemporaryContractRegistry(LocalContractRegistry):
         self.log.info("Cleared temporary registry at {}".format(self.filepath))
         with open(self.filepath, 'w') as registry_file:
             registry_file.write('')
+        self._invalidate()
 
     def commit(self, filepath) -> str:
         """writes the current state of the registry to a file"""
@@ -446,12 +500,14 @@ class InMemoryContractRegistry(BaseContractRegistry):
 
     def clear(self):
         self.__registry_data = None
+        self._invalidate()
 
     def _swap_registry(self, filepath: str) -> bool:
         raise NotImplementedError
 
     def write(self, registry_data: list) -> None:
         self.__registry_data = json.dumps(registry_data)
+        self._invalidate()
 
     def read(self) -> list:
         try:
@@ -480,6 +536,7 @@ class InMemoryContractRegistry(BaseContractRegistry):
 
     def _destroy(self) -> None:
         self.__registry_data = dict()
+        self._invalidate()
 
 
 class AllocationRegistry(LocalContractRegistry):
@@ -510,7 +567,7 @@ class AllocationRegistry(LocalContractRegistry):
                              f"Got {beneficiary_address} and {contract_address}.")
 
         try:
-            allocation_data = self.read()
+            allocation_data = self._snapshot().data
         except BaseContractRegistry.NoRegistry:
             raise self.NoAllocationRegistry
 
@@ -571,12 +628,17 @@ class InMemoryAllocationRegistry(AllocationRegistry):
 
     def clear(self):
         self.__registry_data = None
+        self._invalidate()
 
     def _swap_registry(self, filepath: str) -> bool:
         raise NotImplementedError
 
+    def _state(self):
+        return None
+
     def write(self, registry_data: dict) -> None:
         self.__registry_data = json.dumps(registry_data)
+        self._invalidate()
 
     def read(self) -> dict:
         try:
@@ -132,6 +132,15 @@ class BobJSONController(BobInterface, CharacterControllerBase):
         response_data = self.serializer.dump_retrieve_output(response=result)
         return response_data
 
+    @character_control_interface
+    def retrieve_many(self, request):
+        """
+        Character control endpoint for re-encrypting and decrypting several message kits of the same policy at once.
+        """
+        result = super().retrieve_many(**self.serializer.load_retrieve_many_input(request=request))
+        response_data = self.serializer.dump_retrieve_many_output(response=result)
+        return response_data
+
     @character_control_interface
     def public_keys(self, request):
         """
@@ -1,4 +1,5 @@
 import functools
+from typing import List
 
 import maya
 from umbral.keys import UmbralPublicKey
@@ -215,6 +216,35 @@ class BobInterface(CharacterPublicInterface, BobSpecification):
         response_data = {'cleartexts': plaintexts}
         return response_data
 
+    def retrieve_many(self,
+                      label: bytes,
+                      policy_encrypting_key: bytes,
+                      alice_verifying_key: bytes,
+                      message_kits: List[bytes]):
+        """
+        Character control endpoint for re-encrypting and decrypting several message kits of the same policy at once.
+        """
+        from nucypher.characters.lawful import Enrico
+
+        policy_encrypting_key = UmbralPublicKey.from_bytes(policy_encrypting_key)
+        alice_verifying_key = UmbralPublicKey.from_bytes(alice_verifying_key)
+        message_kits = [UmbralMessageKit.from_bytes(message_kit)  # TODO #846: May raise UnknownOpenSSLError and InvalidTag.
+                        for message_kit in message_kits]
+
+        data_sources = [Enrico.from_public_keys(verifying_key=message_kit.sender_verifying_key,
+                                                policy_encrypting_key=policy_encrypting_key,
+                                                label=label)
+                        for message_kit in message_kits]
+
+        self.bob.join_policy(label=label, alice_verifying_key=alice_verifying_key)
+        plaintexts = self.bob.retrieve_many(message_kits=message_kits,
+                                            data_sources=data_sources,
+                                            alice_verifying_key=alice_verifying_key,
+                                            label=label)
+
+        response_data = {'cleartexts': plaintexts}
+        return response_data
+
     def public_keys(self):
         """
         Character control endpoint for getting Bob's encrypting and signing public keys
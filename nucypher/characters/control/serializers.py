@@ -178,6 +178,16 @@ class BobControlJSONSerializer(CharacterControlJSONSerializer, MessageHandlerMix
         response_data = {'cleartexts': cleartexts}
         return response_data
 
+    def load_retrieve_many_input(self, request: dict):
+        parsed_input = dict(label=request['label'].encode(),
+                            policy_encrypting_key=bytes.fromhex(request['policy_encrypting_key']),
+                            alice_verifying_key=bytes.fromhex(request['alice_verifying_key']),
+                            message_kits=[self.decode(message_kit) for message_kit in request['message_kits']])
+        return parsed_input
+
+    def dump_retrieve_many_output(self, response: dict):
+        return self.dump_retrieve_output(response=response)
+
     @staticmethod
     def dump_public_keys_output(response: dict):
         encrypting_key_hex = response['bob_encrypting_key'].to_bytes().hex()
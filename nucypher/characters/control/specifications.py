@@ -104,11 +104,15 @@ class BobSpecification(CharacterSpecification):
     __retrieve = {'input': ('label', 'policy_encrypting_key', 'alice_verifying_key', 'message_kit'),
                   'output': ('cleartexts', )}
 
+    __retrieve_many = {'input': ('label', 'policy_encrypting_key', 'alice_verifying_key', 'message_kits'),
+                       'output': ('cleartexts', )}
+
     __public_keys = {'input': (),
                      'output': ('bob_encrypting_key', 'bob_verifying_key')}
 
     _specifications = {'join_policy': __join_policy,
                        'retrieve': __retrieve,
+                       'retrieve_many': __retrieve_many,
                        'public_keys': __public_keys}
 
 
@@ -24,7 +24,6 @@ from json.decoder import JSONDecodeError
 from typing import Dict, Iterable, List, Set, Tuple, Union
 
 import maya
-import requests
 import time
 from bytestring_splitter import BytestringKwargifier, BytestringSplittingError
 from bytestring_splitter import BytestringSplitter, VariableLengthBytestring
@@ -38,7 +37,6 @@ from eth_utils import to_checksum_address
 from flask import request, Response
 from twisted.internet import threads
 from twisted.logger import Logger
-from umbral import pre
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
 from umbral.pre import UmbralCorrectnessError
@@ -57,12 +55,14 @@ from nucypher.characters.control.controllers import (
     EnricoJSONController,
     WebController
 )
-from nucypher.config.storages import NodeStorage, ForgetfulNodeStorage
+from nucypher.config.storages import NodeStorage
 from nucypher.crypto.api import keccak_digest, encrypt_and_sign
 from nucypher.crypto.constants import PUBLIC_KEY_LENGTH, PUBLIC_ADDRESS_LENGTH
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import SigningPower, DecryptingPower, DelegatingPower, TransactingPower, PowerUpError
+from nucypher.crypto.reencryption import ReencryptionEngine, ReencryptionResultCache
 from nucypher.crypto.signing import InvalidSignature
+from nucypher.keystore.journal import WorkOrderJournal
 from nucypher.keystore.keypairs import HostingKeypair
 from nucypher.keystore.threading import ThreadedSession
 from nucypher.network.exceptions import NodeSeemsToBeDown
@@ -70,7 +70,10 @@ from nucypher.network.middleware import RestMiddleware, UnexpectedResponse, NotF
 from nucypher.network.nicknames import nickname_from_seed
 from nucypher.network.nodes import Teacher
 from nucypher.network.protocols import InterfaceInfo, parse_node_uri
-from nucypher.network.server import ProxyRESTServer, TLSHostingPower, make_rest_app
+from nucypher.network.reaper import PolicyReaper
+from nucypher.network.server import KFragCache, ProxyRESTServer, TLSHostingPower, TreasureMapStore, make_rest_app
+from nucypher.utilities.caches import LRUCache
+from nucypher.utilities.concurrency import WorkerPool
 
 
 class Alice(Character, BlockchainPolicyAuthor):
@@ -442,6 +445,11 @@ class Bob(Character):
 
     _default_crypto_powerups = [SigningPower, DecryptingPower]
 
+    MAX_CONCURRENT_TREASURE_MAP_REQUESTS = 5
+    TREASURE_MAP_MISS_TTL = 60  # seconds during which a node which didn't have a TreasureMap isn't asked again
+    MAX_TREASURE_MAP_MISSES = 1000  # map IDs for which Bob remembers which nodes didn't have the TreasureMap
+    EXTRA_WORK_ORDERS = 2  # Work orders in flight beyond the m needed, to hedge against slow Ursulas
+
     class IncorrectCFragsReceived(Exception):
         """
         Raised when Bob detects incorrect CFrags returned by some Ursulas
@@ -457,6 +465,7 @@ class Bob(Character):
 
         from nucypher.policy.collections import WorkOrderHistory  # Need a bigger strategy to avoid circulars.
         self._saved_work_orders = WorkOrderHistory()
+        self._treasure_map_misses = LRUCache(max_entries=self.MAX_TREASURE_MAP_MISSES)  # map_id -> {checksum_address: time of the 404}
 
         self.log = Logger(self.__class__.__name__)
         self.log.info(self.banner)
@@ -571,31 +580,60 @@ class Bob(Character):
 
     def get_treasure_map_from_known_ursulas(self, network_middleware, map_id):
         """
-        Iterate through the nodes we know, asking for the TreasureMap.
-        Return the first one who has it.
+        Ask the nodes we know for the TreasureMap, starting with the TreasureMap.RESPONSIBLE_NODES
+        which are supposed to store it (see TreasureMap.rank_nodes) and moving on to the next
+        ones in line only if none of those have it.  Return the first valid one; requests which
+        are still outstanding at that point are abandoned.
+
+        Nodes which recently told us they don't have this TreasureMap aren't asked again
+        until TREASURE_MAP_MISS_TTL has passed.
         """
         from nucypher.policy.collections import TreasureMap
-        for node in self.known_nodes.shuffled():
+
+        now = time.monotonic()
+        misses = {checksum_address: missed_at
+                  for checksum_address, missed_at in self._treasure_map_misses.get(map_id, dict()).items()
+                  if now - missed_at <= self.TREASURE_MAP_MISS_TTL}
+        self._treasure_map_misses.put(map_id, misses)
+
+        def ask_for_treasure_map(node):
             try:
                 response = network_middleware.get_treasure_map_from_node(node=node, map_id=map_id)
-            except NodeSeemsToBeDown:
-                continue
+            except NotFound:
+                misses[node.checksum_address] = time.monotonic()
+                return None
 
             if response.status_code == 200 and response.content:
                 try:
-                    treasure_map = TreasureMap.from_bytes(response.content)
+                    return TreasureMap.from_bytes(response.content)
                 except InvalidSignature:
                     # TODO: What if a node gives a bunk TreasureMap?
                     raise
-                break
-            else:
-                continue  # TODO: Actually, handle error case here.
-        else:
-            # TODO: Work out what to do in this scenario -
-            #       if Bob can't get the TreasureMap, he needs to rest on the learning mutex or something.
-            raise TreasureMap.NowhereToBeFound
-
-        return treasure_map
+            elif response.status_code == 404:
+                misses[node.checksum_address] = time.monotonic()
+            return None  # TODO: Actually, handle error case here.
+
+        ranked_nodes = TreasureMap.rank_nodes(map_id=map_id, nodes=self.known_nodes)
+        for first in range(0, len(ranked_nodes), TreasureMap.RESPONSIBLE_NODES):
+            candidates = [node for node in ranked_nodes[first:first + TreasureMap.RESPONSIBLE_NODES]
+                          if node.checksum_address not in misses]
+            if not candidates:
+                continue
+            worker_pool = WorkerPool(worker=ask_for_treasure_map, max_workers=self.MAX_CONCURRENT_TREASURE_MAP_REQUESTS)
+            outcomes = worker_pool.as_completed(candidates)
+            for _node, treasure_map, error in outcomes:
+                if error:
+                    if isinstance(error, NodeSeemsToBeDown):
+                        continue
+                    raise error
+                if treasure_map:
+                    outcomes.close()
+                    self._treasure_map_misses.pop(map_id)
+                    return treasure_map
+
+        # TODO: Work out what to do in this scenario -
+        #       if Bob can't get the TreasureMap, he needs to rest on the learning mutex or something.
+        raise TreasureMap.NowhereToBeFound
 
     def generate_work_orders(self, map_id, *capsules, num_ursulas=None, cache=False):
         from nucypher.policy.collections import WorkOrder  # Prevent circular import
@@ -626,9 +664,9 @@ class Bob(Character):
                 work_order = WorkOrder.construct_by_bob(
                     arrangement_id, capsules_to_include, ursula, self)
                 generated_work_orders[node_id] = work_order
-                # TODO: Fix this. It's always taking the last capsule
                 if cache:
-                    self._saved_work_orders[node_id][capsule] = work_order
+                    for capsule in capsules_to_include:
+                        self._saved_work_orders[node_id][capsule] = work_order
 
             if num_ursulas == len(generated_work_orders):
                 break
@@ -649,74 +687,115 @@ class Bob(Character):
         treasure_map = self.get_treasure_map(alice_verifying_key, label)
         self.follow_treasure_map(treasure_map=treasure_map, block=block)
 
-    def retrieve(self, message_kit, data_source, alice_verifying_key, label, cache=False):
+    def retrieve(self, message_kit, data_source, alice_verifying_key, label, cache=False, extra_work_orders=None):
+        cleartexts = self.retrieve_many(message_kits=[message_kit],
+                                        data_sources=[data_source],
+                                        alice_verifying_key=alice_verifying_key,
+                                        label=label,
+                                        cache=cache,
+                                        extra_work_orders=extra_work_orders)
+        return cleartexts
+
+    def retrieve_many(self,
+                      message_kits: List[UmbralMessageKit],
+                      data_sources: List['Enrico'],
+                      alice_verifying_key,
+                      label: bytes,
+                      cache: bool = False,
+                      extra_work_orders: int = None
+                      ) -> List[bytes]:
+        """
+        Retrieves the cleartexts of several MessageKits encrypted under the same policy,
+        one data source per MessageKit.  All the capsules go to each Ursula in a single WorkOrder,
+        so the cost in round trips is the same as retrieving a single MessageKit.
+        """
+        if len(message_kits) != len(data_sources):
+            raise ValueError(f"Got {len(message_kits)} MessageKits but {len(data_sources)} data sources.")
+
         # Try our best to get an UmbralPublicKey from input
         alice_verifying_key = UmbralPublicKey.from_bytes(bytes(alice_verifying_key))
 
-        capsule = message_kit.capsule  # TODO: generalize for WorkOrders with more than one capsule
-
         hrac, map_id = self.construct_hrac_and_map_id(alice_verifying_key, label)
         _unknown_ursulas, _known_ursulas, m = self.follow_treasure_map(map_id=map_id, block=True)
 
-        already_retrieved = len(message_kit.capsule._attached_cfrags) >= m
+        capsules_to_retrieve = OrderedDict()
+        for message_kit, data_source in zip(message_kits, data_sources):
+            capsule = message_kit.capsule
 
-        if already_retrieved:
-            if cache:
-                must_do_new_retrieval = False
+            already_retrieved = len(capsule._attached_cfrags) >= m
+            if already_retrieved:
+                if not cache:
+                    raise TypeError("Not using cached retrievals, but the MessageKit's capsule has attached CFrags.  Not sure what to do.")
             else:
-                raise TypeError("Not using cached retrievals, but the MessageKit's capsule has attached CFrags.  Not sure what to do.")
-        else:
-            must_do_new_retrieval = True
-
-        capsule.set_correctness_keys(
-            delegating=data_source.policy_pubkey,
-            receiving=self.public_keys(DecryptingPower),
-            verifying=alice_verifying_key)
-
-        cleartexts = []
-
-        if must_do_new_retrieval:
-            # TODO: Consider blocking until map is done being followed. #1114 
-
-            work_orders = self.generate_work_orders(map_id, capsule, cache=cache)
-            the_airing_of_grievances = []
+                capsules_to_retrieve[id(capsule)] = capsule
+
+            capsule.set_correctness_keys(
+                delegating=data_source.policy_pubkey,
+                receiving=self.public_keys(DecryptingPower),
+                verifying=alice_verifying_key)
+
+        if capsules_to_retrieve:
+            # TODO: Consider blocking until map is done being followed. #1114
+            self._reencrypt_capsules(map_id=map_id,
+                                     capsules=list(capsules_to_retrieve.values()),
+                                     m=m,
+                                     cache=cache,
+                                     extra_work_orders=extra_work_orders)
+
+        cleartexts = [self.verify_from(data_source, message_kit, decrypt=True)
+                      for message_kit, data_source in zip(message_kits, data_sources)]
+        return cleartexts
 
-            # TODO: Of course, it's possible that we have cached CFrags for one of these and thus need to retrieve for one WorkOrder and not another.
-            for work_order in work_orders.values():
-                try:
-                    cfrags = self.get_reencrypted_cfrags(work_order)
-                except requests.exceptions.ConnectTimeout:
+    def _reencrypt_capsules(self, map_id, capsules, m, cache=False, extra_work_orders=None):
+        work_orders = self.generate_work_orders(map_id, *capsules, cache=cache)
+        the_airing_of_grievances = []
+
+        def capsules_are_opened():
+            return all(len(capsule._attached_cfrags) >= m for capsule in capsules)
+
+        # Work orders go out m + k at a time; as soon as every capsule has m CFrags attached,
+        # the rest are abandoned and the ones which haven't been sent yet are cancelled.
+        if extra_work_orders is None:
+            extra_work_orders = self.EXTRA_WORK_ORDERS
+        worker_pool = WorkerPool(worker=self.get_reencrypted_cfrags, max_workers=m + extra_work_orders)
+        outcomes = worker_pool.as_completed(work_orders.values())
+
+        # TODO: Of course, it's possible that we have cached CFrags for one of these and thus need to retrieve for one WorkOrder and not another.
+        for work_order, cfrags, error in outcomes:
+            if error:
+                if isinstance(error, NodeSeemsToBeDown + (WorkerPool.TimedOut,)):
+                    # This Ursula is down or too slow; the extra work orders are there to cover for her.
+                    self.log.info(f"{work_order.ursula} didn't answer {work_order}: {error}")
                     continue
-                except NotFound:
+                if isinstance(error, NotFound):
                     # This Ursula claims not to have a matching KFrag.  Maybe this has been revoked?
                     # TODO: What's the thing to do here?  Do we want to track these Ursulas in some way in case they're lying?
                     continue
+                raise error
 
-                cfrag = cfrags[0]  # TODO: generalize for WorkOrders with more than one capsule/task
+            for task, cfrag in zip(work_order.tasks, cfrags):
+                if len(task.capsule._attached_cfrags) >= m:
+                    continue
                 try:
-                    message_kit.capsule.attach_cfrag(cfrag)
-                    if len(message_kit.capsule._attached_cfrags) >= m:
-                        break
+                    task.capsule.attach_cfrag(cfrag)
                 except UmbralCorrectnessError:
-                    task = work_order.tasks[0]  # TODO: generalize for WorkOrders with more than one capsule/task
                     from nucypher.policy.collections import IndisputableEvidence
                     evidence = IndisputableEvidence(task=task, work_order=work_order)
                     # I got a lot of problems with you people ...
                     the_airing_of_grievances.append(evidence)
-            else:
-                raise Ursula.NotEnoughUrsulas("Unable to snag m cfrags.")
-
-            if the_airing_of_grievances:
-                # ... and now you're gonna hear about it!
-                raise self.IncorrectCFragsReceived(the_airing_of_grievances)
-                # TODO: Find a better strategy for handling incorrect CFrags #500
-                #  - There maybe enough cfrags to still open the capsule
-                #  - This line is unreachable when NotEnoughUrsulas
 
-        delivered_cleartext = self.verify_from(data_source, message_kit, decrypt=True)
-        cleartexts.append(delivered_cleartext)
+            if capsules_are_opened():
+                outcomes.close()
+                break
+        else:
+            raise Ursula.NotEnoughUrsulas("Unable to snag m cfrags.")
 
-        return cleartexts
+        if the_airing_of_grievances:
+            # ... and now you're gonna hear about it!
+            raise self.IncorrectCFragsReceived(the_airing_of_grievances)
+            # TODO: Find a better strategy for handling incorrect CFrags #500
+            #  - There maybe enough cfrags to still open the capsule
+            #  - This line is unreachable when NotEnoughUrsulas
 
     def make_web_controller(drone_bob, crash_on_error: bool = False):
 
@@ -759,6 +838,14 @@ class Bob(Character):
             """
             return controller(interface=controller._internal_controller.retrieve, control_request=request)
 
+        @bob_control.route('/retrieve_many', methods=['POST'])
+        def retrieve_many():
+            """
+            Character control endpoint for re-encrypting and decrypting several
+            message kits of the same policy at once.
+            """
+            return controller(interface=controller._internal_controller.retrieve_many, control_request=request)
+
         return controller
 
 
@@ -793,6 +880,8 @@ class Ursula(Teacher, Character, Worker):
                  is_me: bool = True,
                  interface_signature=None,
                  timestamp=None,
+                 reencryption_processes: int = 0,
+                 reencryption_queue_depth: int = None,
 
                  # Blockchain
                  decentralized_identity_evidence: bytes = constants.NOT_SIGNED,
@@ -840,6 +929,19 @@ class Ursula(Teacher, Character, Worker):
         self.log.debug(f"URSULA worker: {worker_address}, staker {checksum_address}")
         if is_me is True:  # TODO: #340
             self._stored_treasure_maps = dict()
+            self.work_order_journal = None  # Until there is a datastore to write to
+            self.policy_reaper = None
+
+            # Re-encryptions run on the request thread unless worker processes are asked for (None means one per core);
+            # configured Ursulas ask for them, see UrsulaConfiguration.
+            signing_keypair = self._crypto_power.power_ups(SigningPower).keypair
+            self.reencryption_engine = ReencryptionEngine(signing_keypair=signing_keypair,
+                                                          processes=reencryption_processes,
+                                                          queue_depth=reencryption_queue_depth)
+            self.reencryption_results = ReencryptionResultCache()
+
+            # Ready-to-use re-encryption material, bounded and pruned as policies expire
+            self.kfrag_cache = KFragCache()
 
             #
             # Ursula is a Decentralized Worker
@@ -881,6 +983,11 @@ class Ursula(Teacher, Character, Worker):
                     db_filepath=db_filepath,
                     serving_domains=domains,
                 )
+                self.work_order_journal = WorkOrderJournal(datastore=datastore)
+                self.treasure_maps = TreasureMapStore(datastore=datastore)
+                self.policy_reaper = PolicyReaper(datastore=datastore,
+                                                  kfrags=self.kfrag_cache,
+                                                  treasure_maps=self.treasure_maps)
 
                 # TODO: attach status app to rest_app
 
@@ -971,6 +1078,19 @@ class Ursula(Teacher, Character, Worker):
     def rest_server_certificate(self):
         return self._crypto_power.power_ups(TLSHostingPower).keypair.certificate
 
+    def stop(self) -> None:
+        """
+        Stops everything this Ursula runs in the background: learning, reaping expired policies,
+        writing work orders behind, and the re-encryption worker processes.
+        """
+        if self._learning_task.running:
+            self.stop_learning_loop(reason="Ursula is stopping")
+        if self.policy_reaper is not None:
+            self.policy_reaper.stop()
+        if self.work_order_journal is not None:
+            self.work_order_journal.stop()
+        self.reencryption_engine.stop()
+
     def __bytes__(self):
 
         version = self.TEACHER_VERSION.to_bytes(2, "big")
@@ -1005,9 +1125,13 @@ class Ursula(Teacher, Character, Worker):
                       port: int,
                       certificate_filepath,
                       federated_only: bool,
-                      *args, **kwargs
+                      *args,
+                      certificate: Certificate = None,
+                      **kwargs
                       ):
-        response_data = network_middleware.node_information(host, port, certificate_filepath=certificate_filepath)
+        response_data = network_middleware.node_information(host, port,
+                                                            certificate_filepath=certificate_filepath,
+                                                            certificate=certificate)
 
         stranger_ursula_from_public_keys = cls.from_bytes(response_data,
                                                           federated_only=federated_only,
@@ -1084,17 +1208,14 @@ class Ursula(Teacher, Character, Worker):
         certificate = network_middleware.get_certificate(host=host, port=port)
         real_host = certificate.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value
 
-        # Create a temporary certificate storage area
-        temp_node_storage = ForgetfulNodeStorage(federated_only=federated_only)
-        temp_certificate_filepath = temp_node_storage.store_node_certificate(certificate=certificate)
-
-        # Load the host as a potential seed node
+        # Load the host as a potential seed node, pinned to the certificate it just presented
         potential_seed_node = cls.from_rest_url(
             registry=registry,
             host=real_host,
             port=port,
             network_middleware=network_middleware,
-            certificate_filepath=temp_certificate_filepath,
+            certificate_filepath=None,
+            certificate=certificate,
             federated_only=federated_only,
             *args,
             **kwargs
@@ -1109,15 +1230,11 @@ class Ursula(Teacher, Character, Worker):
 
         # Verify the node's TLS certificate
         try:
-            potential_seed_node.verify_node(network_middleware=network_middleware,
-                                            registry=registry,
-                                            certificate_filepath=temp_certificate_filepath)
+            potential_seed_node.verify_node(network_middleware=network_middleware, registry=registry)
         except potential_seed_node.InvalidNode:
             # TODO: What if our seed node fails verification?
             raise
 
-        # OK - everyone get out
-        temp_node_storage.forget()
         return potential_seed_node
 
     @classmethod
@@ -1256,6 +1373,8 @@ class Ursula(Teacher, Character, Worker):
     #
 
     def work_orders(self, bob=None) -> List['WorkOrder']:
+        if self.work_order_journal is not None:
+            self.work_order_journal.flush()  # Include the ones which haven't been written yet
         with ThreadedSession(self.datastore.engine):
             if not bob:  # All
                 return self.datastore.get_workorders()
@@ -1264,29 +1383,23 @@ class Ursula(Teacher, Character, Worker):
                 return work_orders_from_bob
 
     def _reencrypt(self, kfrag: KFrag, work_order: 'WorkOrder', alice_verifying_key: UmbralPublicKey):
-        
-        # Prepare a bytestring for concatenating re-encrypted
-        # capsule data for each work order task.
-        cfrag_byte_stream = bytes()
-        for task in work_order.tasks:
-
-            # Ursula signs on top of Bob's signature of each task.
-            # Now both are committed to the same task.  See #259.
-            reencryption_metadata = bytes(self.stamp(bytes(task.signature)))
-
-            # Ursula sets Alice's verifying key for capsule correctness verification.
-            capsule = task.capsule
-            capsule.set_correctness_keys(verifying=alice_verifying_key)
-
-            # Then re-encrypts the fragment.
-            cfrag = pre.reencrypt(kfrag, capsule, metadata=reencryption_metadata)  # <--- pyUmbral
-            self.log.info(f"Re-encrypted capsule {capsule} -> made {cfrag}.")
-
-            # Next, Ursula signs to commit to her results.
-            reencryption_signature = self.stamp(bytes(cfrag))
-            cfrag_byte_stream += VariableLengthBytestring(cfrag) + reencryption_signature
-
-        # ... and finally returns all the re-encrypted bytes
+        # Tasks we've already done (e.g. Bob is retrying) are answered with the same results as before.
+        task_ids = [self.reencryption_results.task_id(work_order.arrangement_id, task) for task in work_order.tasks]
+        results = [self.reencryption_results.get(task_id) for task_id in task_ids]
+
+        pending = [index for index, result in enumerate(results) if result is None]
+        if pending:
+            tasks = [(work_order.tasks[index].capsule, work_order.tasks[index].signature) for index in pending]
+            new_results = self.reencryption_engine.reencrypt(kfrag=kfrag,
+                                                             alice_verifying_key=alice_verifying_key,
+                                                             tasks=tasks)
+            for index, result in zip(pending, new_results):
+                results[index] = result
+                self.reencryption_results.put(task_ids[index], result)
+            self.log.info(f"Re-encrypted {len(pending)} capsule(s) for {work_order}.")
+
+        # Concatenate the re-encrypted capsule data for each work order task.
+        cfrag_byte_stream = bytes().join(results)
         return cfrag_byte_stream
 
 
@@ -60,6 +60,8 @@ def alice():
 @click.option('--n', help="N-Total KFrags", type=click.INT)
 @click.option('--rate', help="Policy rate per period in wei", type=click.FLOAT)
 @click.option('--duration-periods', help="Policy duration in periods", type=click.FLOAT)
+@click.option('--teachers-per-round', help="How many teachers to learn from concurrently each learning round",
+              type=click.IntRange(min=1))
 @nucypher_click_config
 def init(click_config,
 
@@ -73,7 +75,7 @@ def init(click_config,
          registry_filepath,
 
          # Other
-         config_root, poa, light, m, n, rate, duration_periods):
+         config_root, poa, light, m, n, rate, duration_periods, teachers_per_round):
     """
     Create a brand new persistent Alice.
     """
@@ -121,7 +123,8 @@ def init(click_config,
                                                    m=m,
                                                    n=n,
                                                    duration_periods=duration_periods,
-                                                   rate=rate)
+                                                   rate=rate,
+                                                   teachers_per_round=teachers_per_round)
 
     painting.paint_new_installation_help(emitter, new_configuration=new_alice_config)
 
@@ -174,6 +177,8 @@ def destroy(click_config,
 @click.option('--controller-port', help="The host port to run Alice HTTP services on", type=NETWORK_PORT,
               default=AliceConfiguration.DEFAULT_CONTROLLER_PORT)
 @click.option('--dry-run', '-x', help="Execute normally without actually starting the node", is_flag=True)
+@click.option('--teachers-per-round', help="How many teachers to learn from concurrently each learning round",
+              type=click.IntRange(min=1))
 @nucypher_click_config
 def run(click_config,
 
@@ -182,7 +187,7 @@ def run(click_config,
         config_file, discovery_port, hw_wallet, teacher_uri, min_stake,
 
         # Other
-        controller_port, dry_run):
+        controller_port, dry_run, teachers_per_round):
     """
     Start Alice's controller.
     """
@@ -191,7 +196,8 @@ def run(click_config,
     emitter = _setup_emitter(click_config)
 
     alice_config, provider_uri = _get_alice_config(click_config, config_file, dev, discovery_port, federated_only,
-                                                   geth, network, pay_with, provider_uri, registry_filepath)
+                                                   geth, network, pay_with, provider_uri, registry_filepath,
+                                                   teachers_per_round=teachers_per_round)
     #############
 
     ALICE = _create_alice(alice_config, click_config, dev, emitter, hw_wallet, teacher_uri, min_stake)
@@ -394,7 +400,7 @@ def _setup_emitter(click_config):
 
 
 def _get_alice_config(click_config, config_file, dev, discovery_port, federated_only, geth, network, pay_with,
-                      provider_uri, registry_filepath):
+                      provider_uri, registry_filepath, teachers_per_round=None):
     if federated_only and geth:
         raise click.BadOptionUsage(option_name="--geth", message="Federated only cannot be used with the --geth flag")
     #
@@ -407,19 +413,21 @@ def _get_alice_config(click_config, config_file, dev, discovery_port, federated_
 
     # Get config
     alice_config = _get_or_create_alice_config(click_config, dev, network, ETH_NODE, provider_uri,
-                                               config_file, discovery_port, pay_with, registry_filepath)
+                                               config_file, discovery_port, pay_with, registry_filepath,
+                                               teachers_per_round=teachers_per_round)
     return alice_config, provider_uri
 
 
 def _get_or_create_alice_config(click_config, dev, network, eth_node, provider_uri, config_file,
-                                discovery_port, pay_with, registry_filepath):
+                                discovery_port, pay_with, registry_filepath, teachers_per_round=None):
     if dev:
         alice_config = AliceConfiguration(dev_mode=True,
                                           network_middleware=click_config.middleware,
                                           domains={network},
                                           provider_process=eth_node,
                                           provider_uri=provider_uri,
-                                          federated_only=True)
+                                          federated_only=True,
+                                          teachers_per_round=teachers_per_round)
 
     else:
         try:
@@ -432,7 +440,8 @@ def _get_or_create_alice_config(click_config, dev, network, eth_node, provider_u
                 checksum_address=pay_with,
                 provider_process=eth_node,
                 provider_uri=provider_uri,
-                registry_filepath=registry_filepath)
+                registry_filepath=registry_filepath,
+                teachers_per_round=teachers_per_round)
         except FileNotFoundError:
             return actions.handle_missing_configuration_file(character_config_class=AliceConfiguration,
                                                              config_file=config_file)
@@ -52,6 +52,8 @@ def bob():
 @_admin_options
 @click.option('--federated-only', '-F', help="Connect only to federated nodes", is_flag=True)
 @click.option('--config-root', help="Custom configuration directory", type=click.Path())
+@click.option('--teachers-per-round', help="How many teachers to learn from concurrently each learning round",
+              type=click.IntRange(min=1))
 @nucypher_click_config
 def init(click_config,
 
@@ -59,7 +61,7 @@ def init(click_config,
          provider_uri, network, registry_filepath, checksum_address,
 
          # Other
-         federated_only, config_root):
+         federated_only, config_root, teachers_per_round):
 
     """
     Create a brand new persistent Bob.
@@ -77,7 +79,8 @@ def init(click_config,
                                                domains={network} if network else None,
                                                federated_only=federated_only,
                                                registry_filepath=registry_filepath,
-                                               provider_uri=provider_uri)
+                                               provider_uri=provider_uri,
+                                               teachers_per_round=teachers_per_round)
     return painting.paint_new_installation_help(emitter, new_configuration=new_bob_config)
 
 
@@ -86,6 +89,8 @@ def init(click_config,
 @click.option('--controller-port', help="The host port to run Bob HTTP services on", type=NETWORK_PORT,
               default=BobConfiguration.DEFAULT_CONTROLLER_PORT)
 @click.option('--dry-run', '-x', help="Execute normally without actually starting the node", is_flag=True)
+@click.option('--teachers-per-round', help="How many teachers to learn from concurrently each learning round",
+              type=click.IntRange(min=1))
 @nucypher_click_config
 def run(click_config,
 
@@ -94,7 +99,7 @@ def run(click_config,
         teacher_uri, min_stake,
 
         # Other
-        controller_port, dry_run):
+        controller_port, dry_run, teachers_per_round):
     """
     Start Bob's controller.
     """
@@ -103,7 +108,7 @@ def run(click_config,
     emitter = _setup_emitter(click_config)
 
     bob_config = _get_bob_config(click_config, dev, provider_uri, network, registry_filepath, checksum_address,
-                                 config_file, discovery_port)
+                                 config_file, discovery_port, teachers_per_round=teachers_per_round)
     #############
 
     BOB = actions.make_cli_character(character_config=bob_config,
@@ -272,15 +277,68 @@ def retrieve(click_config,
     return response
 
 
+@bob.command(name='retrieve-many')
+@_api_options
+@click.option('--label', help="The label for a policy", type=click.STRING)
+@click.option('--policy-encrypting-key', help="Encrypting Public Key for Policy as hexadecimal string",
+              type=click.STRING)
+@click.option('--alice-verifying-key', help="Alice's verifying key as a hexadecimal string", type=click.STRING)
+@click.option('--message-kit', 'message_kits', help="A message kit unicode string encoded in base64; repeat for each message kit",
+              type=click.STRING, multiple=True)
+@nucypher_click_config
+def retrieve_many(click_config,
+
+                  # API Options
+                  provider_uri, network, registry_filepath, checksum_address, dev, config_file, discovery_port,
+                  teacher_uri, min_stake,
+
+                  # Other
+                  label, policy_encrypting_key, alice_verifying_key, message_kits):
+    """
+    Obtain plaintexts from several pieces of encrypted data under the same policy, if access was granted.
+    """
+
+    ### Setup ###
+    _setup_emitter(click_config)
+
+    bob_config = _get_bob_config(click_config, dev, provider_uri, network, registry_filepath, checksum_address,
+                                 config_file, discovery_port)
+    #############
+
+    BOB = actions.make_cli_character(character_config=bob_config,
+                                     click_config=click_config,
+                                     dev=dev,
+                                     teacher_uri=teacher_uri,
+                                     min_stake=min_stake)
+
+    # Validate
+    if not all((label, policy_encrypting_key, alice_verifying_key, message_kits)):
+        input_specification, output_specification = BOB.control.get_specifications(interface_name='retrieve_many')
+        required_fields = ', '.join(input_specification)
+        raise click.BadArgumentUsage(f'{required_fields} are required flags to retrieve-many')
+
+    # Request
+    bob_request_data = {
+        'label': label,
+        'policy_encrypting_key': policy_encrypting_key,
+        'alice_verifying_key': alice_verifying_key,
+        'message_kits': list(message_kits),
+    }
+
+    response = BOB.controller.retrieve_many(request=bob_request_data)
+    return response
+
+
 def _get_bob_config(click_config, dev, provider_uri, network, registry_filepath, checksum_address, config_file,
-                    discovery_port):
+                    discovery_port, teachers_per_round=None):
     if dev:
         bob_config = BobConfiguration(dev_mode=True,
                                       domains={network},
                                       provider_uri=provider_uri,
                                       federated_only=True,
                                       checksum_address=checksum_address,
-                                      network_middleware=click_config.middleware)
+                                      network_middleware=click_config.middleware,
+                                      teachers_per_round=teachers_per_round)
     else:
 
         try:
@@ -291,7 +349,8 @@ def _get_bob_config(click_config, dev, provider_uri, network, registry_filepath,
                 rest_port=discovery_port,
                 provider_uri=provider_uri,
                 registry_filepath=registry_filepath,
-                network_middleware=click_config.middleware)
+                network_middleware=click_config.middleware,
+                teachers_per_round=teachers_per_round)
         except FileNotFoundError:
             return actions.handle_missing_configuration_file(character_config_class=BobConfiguration,
                                                              config_file=config_file)
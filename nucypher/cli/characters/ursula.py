@@ -19,7 +19,7 @@ import functools
 
 import click
 from constant_sorrow.constants import NO_BLOCKCHAIN_CONNECTION
-from twisted.internet import stdio
+from twisted.internet import reactor, stdio
 
 from nucypher.blockchain.eth.utils import datetime_at_period
 from nucypher.characters.banners import URSULA_BANNER
@@ -94,6 +94,8 @@ def ursula():
 @_admin_options
 @click.option('--force', help="Don't ask for confirmation", is_flag=True)
 @click.option('--config-root', help="Custom configuration directory", type=click.Path())
+@click.option('--teachers-per-round', help="How many teachers to learn from concurrently each learning round",
+              type=click.IntRange(min=1))
 @nucypher_click_config
 def init(click_config,
 
@@ -102,7 +104,7 @@ def init(click_config,
          rest_port, db_filepath, poa, light,
 
          # Other
-         force, config_root):
+         force, config_root, teachers_per_round):
     """
     Create a new Ursula node configuration.
     """
@@ -145,7 +147,8 @@ def init(click_config,
                                                  provider_process=ETH_NODE,
                                                  provider_uri=provider_uri,
                                                  poa=poa,
-                                                 light=light)
+                                                 light=light,
+                                                 teachers_per_round=teachers_per_round)
     painting.paint_new_installation_help(emitter, new_configuration=ursula_config)
 
 
@@ -218,6 +221,8 @@ def forget(click_config,
 @click.option('--interactive', '-I', help="Launch command interface after connecting to seednodes.", is_flag=True,
               default=False)
 @click.option('--dry-run', '-x', help="Execute normally without actually starting the node", is_flag=True)
+@click.option('--teachers-per-round', help="How many teachers to learn from concurrently each learning round",
+              type=click.IntRange(min=1))
 @nucypher_click_config
 def run(click_config,
 
@@ -226,7 +231,7 @@ def run(click_config,
         rest_port, db_filepath, poa, light, config_file, dev, lonely, teacher_uri, min_stake,
 
         # Other
-        interactive, dry_run):
+        interactive, dry_run, teachers_per_round):
     """
     Run an "Ursula" node.
     """
@@ -240,7 +245,8 @@ def run(click_config,
 
     ursula_config, provider_uri = _get_ursula_config(emitter, geth, provider_uri, network, registry_filepath, dev,
                                                      config_file, staker_address, worker_address, federated_only,
-                                                     rest_host, rest_port, db_filepath, poa, light)
+                                                     rest_host, rest_port, db_filepath, poa, light,
+                                                     teachers_per_round=teachers_per_round)
     #############
 
     URSULA = _create_ursula(ursula_config, click_config, dev, emitter, lonely, teacher_uri, min_stake)
@@ -271,6 +277,8 @@ def run(click_config,
             return  # <-- ABORT - (Last Chance)
 
         # Run - Step 3
+        URSULA.policy_reaper.start()
+        reactor.addSystemEventTrigger('before', 'shutdown', URSULA.stop)
         node_deployer = URSULA.get_deployer()
         node_deployer.addServices()
         node_deployer.catalogServers(node_deployer.hendrix)
@@ -442,7 +450,8 @@ def _pre_launch_warnings(emitter, dev, force):
 
 
 def _get_ursula_config(emitter, geth, provider_uri, network, registry_filepath, dev, config_file,
-                       staker_address, worker_address, federated_only, rest_host, rest_port, db_filepath, poa, light):
+                       staker_address, worker_address, federated_only, rest_host, rest_port, db_filepath, poa, light,
+                       teachers_per_round=None):
 
     ETH_NODE = NO_BLOCKCHAIN_CONNECTION
     if geth:
@@ -462,7 +471,8 @@ def _get_ursula_config(emitter, geth, provider_uri, network, registry_filepath,
                                             federated_only=federated_only,
                                             rest_host=rest_host,
                                             rest_port=rest_port,
-                                            db_filepath=db_filepath)
+                                            db_filepath=db_filepath,
+                                            teachers_per_round=teachers_per_round)
     else:
         try:
             ursula_config = UrsulaConfiguration.from_configuration_file(filepath=config_file,
@@ -475,7 +485,8 @@ def _get_ursula_config(emitter, geth, provider_uri, network, registry_filepath,
                                                                         db_filepath=db_filepath,
                                                                         poa=poa,
                                                                         light=light,
-                                                                        federated_only=federated_only)
+                                                                        federated_only=federated_only,
+                                                                        teachers_per_round=teachers_per_round)
         except FileNotFoundError:
             return actions.handle_missing_configuration_file(character_config_class=UrsulaConfiguration,
                                                              config_file=config_file)
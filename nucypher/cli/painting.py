@@ -559,25 +559,25 @@ def paint_stakers(emitter, stakers: List[str], staking_agent, policy_agent) -> N
     emitter.echo(f"{'Checksum address':42}  Staker information")
     emitter.echo('=' * (42 + 2 + 53))
 
-    for staker in stakers:
+    # Gather everything there is to paint up front, in as few requests as possible.
+    stakers_details = staking_agent.get_stakers_details(stakers)
+    reward_amounts = policy_agent.get_reward_amounts(stakers)
+
+    for staker, details, fees in zip(stakers, stakers_details, reward_amounts):
         nickname, pairs = nickname_from_seed(staker)
         symbols = f"{pairs[0][1]}  {pairs[1][1]}"
         emitter.echo(f"{staker}  {'Nickname:':10} {nickname} {symbols}")
         tab = " " * len(staker)
 
-        owned_tokens = staking_agent.owned_tokens(staker)
-        last_confirmed_period = staking_agent.get_last_active_period(staker)
-        worker = staking_agent.get_worker_from_staker(staker)
-        is_restaking = staking_agent.is_restaking(staker)
-
+        last_confirmed_period = details.last_active_period
         missing_confirmations = current_period - last_confirmed_period
-        owned_in_nu = round(NU.from_nunits(owned_tokens), 2)
-        locked_tokens = round(NU.from_nunits(staking_agent.get_locked_tokens(staker)), 2)
+        owned_in_nu = round(NU.from_nunits(details.owned_tokens), 2)
+        locked_tokens = round(NU.from_nunits(details.locked_tokens), 2)
 
         emitter.echo(f"{tab}  {'Owned:':10} {owned_in_nu}  (Staked: {locked_tokens})")
-        if is_restaking:
-            if staking_agent.is_restaking_locked(staker):
-                unlock_period = staking_agent.get_restake_unlock_period(staker)
+        if details.is_restaking:
+            if details.is_restaking_locked:
+                unlock_period = details.restake_lock_period
                 emitter.echo(f"{tab}  {'Re-staking:':10} Yes  (Locked until period: {unlock_period})")
             else:
                 emitter.echo(f"{tab}  {'Re-staking:':10} Yes  (Unlocked)")
@@ -596,12 +596,11 @@ def paint_stakers(emitter, stakers: List[str], staking_agent, policy_agent) -> N
                          f"(last time for period #{last_confirmed_period})", color='red')
 
         emitter.echo(f"{tab}  {'Worker:':10} ", nl=False)
-        if worker == BlockchainInterface.NULL_ADDRESS:
+        if details.worker == BlockchainInterface.NULL_ADDRESS:
             emitter.echo(f"Worker not set", color='red')
         else:
-            emitter.echo(f"{worker}")
+            emitter.echo(f"{details.worker}")
 
-        fees = policy_agent.get_reward_amount(staker)
         emitter.echo(f"{tab}  Unclaimed fees: {Web3.fromWei(fees, 'gwei')} Gwei")
 
 
@@ -52,6 +52,8 @@ class UrsulaConfiguration(CharacterConfiguration):
                  rest_port: int = None,
                  tls_curve: EllipticCurve = None,
                  certificate: Certificate = None,
+                 reencryption_processes: int = None,
+                 reencryption_queue_depth: int = None,
                  *args, **kwargs) -> None:
 
         if not rest_port:
@@ -65,6 +67,11 @@ class UrsulaConfiguration(CharacterConfiguration):
         self.certificate = certificate
         self.db_filepath = db_filepath or UNINITIALIZED_CONFIGURATION
         self.worker_address = worker_address
+        if reencryption_processes is None and dev_mode:
+            reencryption_processes = 0  # Development Ursulas re-encrypt on the request thread
+        # Otherwise None is passed on to Ursula, who then starts one worker process per core on first use.
+        self.reencryption_processes = reencryption_processes
+        self.reencryption_queue_depth = reencryption_queue_depth
         super().__init__(dev_mode=dev_mode, *args, **kwargs)
 
     def generate_runtime_filepaths(self, config_root: str) -> dict:
@@ -83,6 +90,8 @@ class UrsulaConfiguration(CharacterConfiguration):
             rest_host=self.rest_host,
             rest_port=self.rest_port,
             db_filepath=self.db_filepath,
+            reencryption_processes=self.reencryption_processes,
+            reencryption_queue_depth=self.reencryption_queue_depth,
         )
         return {**super().static_payload(), **payload}
 
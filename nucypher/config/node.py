@@ -49,6 +49,7 @@ class CharacterConfiguration(BaseConfiguration):
     DEFAULT_CONTROLLER_PORT = NotImplemented
     DEFAULT_DOMAIN = 'goerli'
     DEFAULT_NETWORK_MIDDLEWARE = RestMiddleware
+    DEFAULT_TEACHERS_PER_ROUND = 1
     TEMP_CONFIGURATION_DIR_PREFIX = 'tmp-nucypher'
 
     def __init__(self,
@@ -73,6 +74,7 @@ class CharacterConfiguration(BaseConfiguration):
                  learn_on_same_thread: bool = False,
                  abort_on_learning_error: bool = False,
                  start_learning_now: bool = True,
+                 teachers_per_round: int = None,
 
                  # Network
                  controller_port: int = None,
@@ -138,6 +140,7 @@ class CharacterConfiguration(BaseConfiguration):
         self.learn_on_same_thread = learn_on_same_thread
         self.abort_on_learning_error = abort_on_learning_error
         self.start_learning_now = start_learning_now
+        self.teachers_per_round = teachers_per_round or self.DEFAULT_TEACHERS_PER_ROUND
         self.save_metadata = save_metadata
         self.reload_metadata = reload_metadata
         self.known_nodes = known_nodes or set()  # handpicked
@@ -345,6 +348,7 @@ class CharacterConfiguration(BaseConfiguration):
             learn_on_same_thread=self.learn_on_same_thread,
             abort_on_learning_error=self.abort_on_learning_error,
             start_learning_now=self.start_learning_now,
+            teachers_per_round=self.teachers_per_round,
             save_metadata=self.save_metadata,
             node_storage=self.node_storage.payload(),
         )
@@ -23,6 +23,7 @@ from abc import abstractmethod, ABC
 import OpenSSL
 import shutil
 import sqlite3
+from constant_sorrow.constants import CERTIFICATE_NOT_SAVED
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.serialization import Encoding
@@ -180,11 +181,13 @@ class ForgetfulNodeStorage(NodeStorage):
     _name = ':memory:'
     __base_prefix = "nucypher-tmp-certs-"
 
-    def __init__(self, parent_dir: str = None, *args, **kwargs) -> None:
+    def __init__(self, parent_dir: str = None, *args, persist_certificates: bool = False, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.__metadata = dict()
 
-        # Certificates
+        # Certificates are kept in memory, which is where connections are pinned from;
+        # a temporary PEM file is written for each only if asked for.
+        self.persist_certificates = persist_certificates
         self.__certificates = dict()
         self.__temporary_certificates = list()
         self._temp_certificates_dir = tempfile.mkdtemp(prefix='nucypher-temp-certs-', dir=parent_dir)
@@ -225,6 +228,8 @@ class ForgetfulNodeStorage(NodeStorage):
     def store_node_certificate(self, certificate: Certificate):
         checksum_address = read_certificate_pseudonym(certificate=certificate)
         self.__certificates[checksum_address] = certificate
+        if not self.persist_certificates:
+            return CERTIFICATE_NOT_SAVED
         self._write_tls_certificate(certificate=certificate)
         filepath = self.generate_certificate_filepath(checksum_address=checksum_address)
         return filepath
@@ -0,0 +1,210 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import atexit
+import multiprocessing
+import os
+from concurrent import futures
+from concurrent.futures.process import BrokenProcessPool
+from threading import BoundedSemaphore, Lock
+from typing import Callable, List, Tuple
+
+from bytestring_splitter import VariableLengthBytestring
+from umbral import pre
+from umbral.config import default_params
+from umbral.keys import UmbralPublicKey
+from umbral.kfrags import KFrag
+from umbral.pre import Capsule
+
+from nucypher.keystore.keypairs import SigningKeypair
+from nucypher.utilities.caches import LRUCache
+
+
+def reencrypt_tasks(stamp: Callable,
+                    kfrag: KFrag,
+                    alice_verifying_key: UmbralPublicKey,
+                    tasks: List[Tuple[Capsule, bytes]]
+                    ) -> List[bytes]:
+    """
+    Re-encrypts the capsule of each (capsule, task signature) pair,
+    returning for each the serialized cfrag followed by Ursula's signature of it.
+    """
+    capsules_and_metadata = [(capsule, reencryption_metadata(stamp, task_signature))
+                             for capsule, task_signature in tasks]
+    cfrags = reencrypt_capsules(kfrag, alice_verifying_key, capsules_and_metadata)
+    return sign_cfrags(stamp, cfrags)
+
+
+def reencryption_metadata(stamp: Callable, task_signature: bytes) -> bytes:
+    # Ursula signs on top of Bob's signature of each task.
+    # Now both are committed to the same task.  See #259.
+    return bytes(stamp(bytes(task_signature)))
+
+
+def reencrypt_capsules(kfrag: KFrag,
+                       alice_verifying_key: UmbralPublicKey,
+                       capsules_and_metadata: List[Tuple[Capsule, bytes]]
+                       ) -> List[bytes]:
+    """Re-encrypts each capsule with the given metadata, returning the serialized cfrags."""
+    cfrags = list()
+    for capsule, metadata in capsules_and_metadata:
+
+        # Ursula sets Alice's verifying key for capsule correctness verification.
+        capsule.set_correctness_keys(verifying=alice_verifying_key)
+
+        # Then re-encrypts the fragment.
+        cfrag = pre.reencrypt(kfrag, capsule, metadata=metadata)  # <--- pyUmbral
+        cfrags.append(bytes(cfrag))
+
+    return cfrags
+
+
+def sign_cfrags(stamp: Callable, cfrags: List[bytes]) -> List[bytes]:
+    # Next, Ursula signs to commit to her results.
+    return [bytes(VariableLengthBytestring(cfrag)) + bytes(stamp(cfrag)) for cfrag in cfrags]
+
+
+#
+# Worker Processes
+#
+
+def _reencrypt_in_worker(kfrag_bytes: bytes,
+                         alice_verifying_key_bytes: bytes,
+                         capsules_and_metadata: List[Tuple[bytes, bytes]]
+                         ) -> List[bytes]:
+    # Workers only re-encrypt; Ursula's signing key never leaves the serving process.
+    params = default_params()
+    kfrag = KFrag.from_bytes(kfrag_bytes)
+    alice_verifying_key = UmbralPublicKey.from_bytes(alice_verifying_key_bytes)
+    capsules_and_metadata = [(Capsule.from_bytes(capsule_bytes, params=params), metadata)
+                             for capsule_bytes, metadata in capsules_and_metadata]
+    return reencrypt_capsules(kfrag, alice_verifying_key, capsules_and_metadata)
+
+
+class ReencryptionEngine:
+    """
+    Performs Ursula's re-encryptions on a pool of worker processes, so that work orders
+    don't hold the GIL of the process serving requests and all of the machine's cores are used.
+    Signing stays in this process; the workers are only handed the capsules and their metadata.
+
+    The tasks of a work order are spread over the workers and their results put back in order,
+    so that a work order carrying many capsules uses all of the cores too.
+    At most queue_depth work orders are handed to the pool at once; requests beyond that
+    wait for a slot instead of piling up in the pool.  With zero processes, work orders
+    are re-encrypted on the calling thread.
+
+    The workers are started on first use, and stopped by stop() or when the interpreter exits.
+    """
+
+    def __init__(self,
+                 signing_keypair: SigningKeypair,
+                 processes: int = None,
+                 queue_depth: int = None
+                 ) -> None:
+
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if processes < 0:
+            raise ValueError(f"The number of re-encryption processes can't be negative, got {processes}.")
+        if queue_depth is None:
+            queue_depth = 2 * processes
+        if processes and queue_depth < 1:
+            raise ValueError(f"The re-encryption queue depth must be at least 1, got {queue_depth}.")
+
+        self.processes = processes
+        self.queue_depth = queue_depth
+
+        self.__stamp = signing_keypair.get_signature_stamp()
+        self.__slots = BoundedSemaphore(queue_depth) if processes else None
+        self.__pool = None
+        self.__pool_lock = Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self.__pool is not None
+
+    def start(self) -> futures.ProcessPoolExecutor:
+        """Starts the worker processes, if they are not running yet.  Called on first use."""
+        with self.__pool_lock:
+            if self.processes and self.__pool is None:
+                # Worker processes are spawned rather than forked, since the serving process is multi-threaded.
+                self.__pool = futures.ProcessPoolExecutor(max_workers=self.processes,
+                                                          mp_context=multiprocessing.get_context('spawn'))
+                atexit.register(self.stop)
+            return self.__pool
+
+    def stop(self) -> None:
+        with self.__pool_lock:
+            if self.__pool is not None:
+                self.__pool.shutdown(wait=True)
+                self.__pool = None
+                atexit.unregister(self.stop)
+
+    def reencrypt(self,
+                  kfrag: KFrag,
+                  alice_verifying_key: UmbralPublicKey,
+                  tasks: List[Tuple[Capsule, bytes]]
+                  ) -> List[bytes]:
+        """
+        Re-encrypts the capsule of each (capsule, task signature) pair of a work order;
+        see reencrypt_tasks.  Blocks until the result is available.
+        """
+        if not self.processes or not tasks:
+            return reencrypt_tasks(self.__stamp, kfrag, alice_verifying_key, tasks)
+
+        capsules_and_metadata = [(bytes(capsule), reencryption_metadata(self.__stamp, task_signature))
+                                 for capsule, task_signature in tasks]
+        chunk_size = -(-len(capsules_and_metadata) // self.processes)  # At most one chunk per worker
+        chunks = [capsules_and_metadata[i:i + chunk_size] for i in range(0, len(capsules_and_metadata), chunk_size)]
+        kfrag_bytes, alice_verifying_key_bytes = bytes(kfrag), bytes(alice_verifying_key)
+
+        with self.__slots:
+            pool = self.start()
+            try:
+                submitted = [pool.submit(_reencrypt_in_worker, kfrag_bytes, alice_verifying_key_bytes, chunk)
+                             for chunk in chunks]
+                cfrags = [cfrag for future in submitted for cfrag in future.result()]
+            except BrokenProcessPool:
+                # A worker died; this pool is unusable, so a fresh one is started on next use.
+                with self.__pool_lock:
+                    if self.__pool is pool:
+                        self.__pool = None
+                        atexit.unregister(self.stop)
+                raise
+
+        return sign_cfrags(self.__stamp, cfrags)
+
+
+class ReencryptionResultCache(LRUCache):
+    """
+    The serialized cfrag and signature Ursula produced for each task, keyed by
+    (arrangement ID, capsule, Bob's task signature), so that retried and duplicate
+    work orders are answered without re-encrypting again.
+    """
+
+    DEFAULT_MAX_ENTRIES = 10000
+
+    def __init__(self, max_entries: int = None) -> None:
+        super().__init__(max_entries=max_entries or self.DEFAULT_MAX_ENTRIES)
+
+    @staticmethod
+    def task_id(arrangement_id: bytes, task) -> Tuple[bytes, bytes, bytes]:
+        return bytes(arrangement_id), bytes(task.capsule), bytes(task.signature)
+
+    def covers(self, work_order) -> bool:
+        """True if every task of this work order has been re-encrypted already."""
+        return all(self.task_id(work_order.arrangement_id, task) in self for task in work_order.tasks)
@@ -14,15 +14,66 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
-from sqlalchemy import event
-from sqlalchemy.engine import Engine
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine, create_engine
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import QueuePool, StaticPool
 
 Base = declarative_base()
 
+DEFAULT_POOL_SIZE = 8
+DEFAULT_BUSY_TIMEOUT = 30  # seconds a connection waits for another one's write lock
+
 
 @event.listens_for(Engine, "connect")
 def set_secure_delete_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA secure_delete=on")
     cursor.close()
+
+
+def set_write_ahead_logging_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")   # Readers don't block the writer, nor the writer readers
+    cursor.execute("PRAGMA synchronous=NORMAL")  # Durable as of the last checkpoint; safe from corruption in WAL mode
+    cursor.close()
+
+
+def make_engine(db_filepath: str = None, pool_size: int = DEFAULT_POOL_SIZE) -> Engine:
+    """
+    Makes an engine for a datastore shared by many threads, with its tables and indexes in place.
+
+    A datastore on disk gets a pool of connections in write-ahead logging mode;
+    an in-memory one (no filepath) only exists on the connection which created it,
+    so that one connection is shared by every thread, whose ThreadedSessions take turns on it.
+    """
+    # See: https://docs.sqlalchemy.org/en/rel_0_9/dialects/sqlite.html#connect-strings
+    if db_filepath and db_filepath != ':memory:':
+        engine = create_engine(f'sqlite:///{db_filepath}',
+                               poolclass=QueuePool,
+                               pool_size=pool_size,
+                               max_overflow=pool_size,
+                               connect_args={'check_same_thread': False, 'timeout': DEFAULT_BUSY_TIMEOUT})
+        event.listen(engine, "connect", set_write_ahead_logging_pragmas)
+    else:
+        # TODO: Is this a sane default? See #667
+        engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+
+    create_tables(engine)
+    return engine
+
+
+def create_tables(engine: Engine) -> None:
+    """
+    Creates the tables which don't exist yet, and the indexes
+    which don't exist yet on those which do (i.e. added since they were created).
+    """
+    from nucypher.keystore.db import models  # Registers the models with Base
+
+    Base.metadata.create_all(engine)
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                index.create(bind=engine)
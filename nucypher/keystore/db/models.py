@@ -53,9 +53,9 @@ class PolicyArrangement(Base):
     __tablename__ = 'policyarrangements'
 
     id = Column(LargeBinary, unique=True, primary_key=True)
-    expiration = Column(DateTime)
+    expiration = Column(DateTime, index=True)
     kfrag = Column(LargeBinary, unique=True, nullable=True)
-    alice_verifying_key_id = Column(Integer, ForeignKey('keys.id'))
+    alice_verifying_key_id = Column(Integer, ForeignKey('keys.id'), index=True)
     alice_verifying_key = relationship(Key, backref="policies", lazy='joined')
 
     # TODO: Maybe this will be two signatures - one for the offer, one for the KFrag.
@@ -84,9 +84,9 @@ class Workorder(Base):
     __tablename__ = 'workorders'
 
     id = Column(Integer, primary_key=True)
-    bob_verifying_key_id = Column(Integer, ForeignKey('keys.id'))
+    bob_verifying_key_id = Column(Integer, ForeignKey('keys.id'), index=True)
     bob_signature = Column(LargeBinary, unique=True)
-    arrangement_id = Column(LargeBinary, unique=False)
+    arrangement_id = Column(LargeBinary, unique=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     def __init__(self, bob_verifying_key_id, bob_signature, arrangement_id) -> None:
@@ -96,3 +96,20 @@ class Workorder(Base):
 
     def __repr__(self):
         return f'{self.__class__.__name__}(id={self.id})'
+
+
+class StoredTreasureMap(Base):
+    __tablename__ = 'treasuremaps'
+
+    id = Column(LargeBinary, unique=True, primary_key=True)
+    treasure_map = Column(LargeBinary)
+    expiration = Column(DateTime, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __init__(self, id, treasure_map, expiration) -> None:
+        self.id = id
+        self.treasure_map = treasure_map
+        self.expiration = expiration
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(id={self.id})'
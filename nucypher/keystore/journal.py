@@ -0,0 +1,162 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import atexit
+from collections import deque
+from threading import Event, Lock, Thread
+from typing import Tuple
+
+from sqlalchemy.exc import IntegrityError
+from twisted.logger import Logger
+
+from nucypher.keystore.threading import ThreadedSession
+
+
+class WorkOrderJournal:
+    """
+    Write-behind log of the work orders Ursula has served.
+
+    Records are queued in memory and written to the datastore in batches of at most batch_size,
+    one transaction per batch, every flush_interval seconds or as soon as batch_size records
+    are waiting, so that serving a work order doesn't wait on the disk.
+
+    A batch which fails to commit is rolled back and its records written one at a time, so that
+    one bad record doesn't hold back the others.  Records which still fail are queued again,
+    and dropped (and logged) once they have failed max_attempts times, or at once if they can
+    never be written, such as a duplicate of a work order already saved.  Flushing never raises.
+
+    Whatever is still queued is flushed when the journal is stopped or the process exits
+    normally; records queued when the process is killed are lost.
+    """
+
+    DEFAULT_FLUSH_INTERVAL = 1  # seconds
+    DEFAULT_BATCH_SIZE = 100
+    DEFAULT_MAX_ATTEMPTS = 3
+
+    log = Logger("work-order-journal")
+
+    def __init__(self,
+                 datastore,
+                 flush_interval: float = None,
+                 batch_size: int = None,
+                 max_attempts: int = None
+                 ) -> None:
+        self.datastore = datastore
+        self.flush_interval = flush_interval or self.DEFAULT_FLUSH_INTERVAL
+        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        self.max_attempts = max_attempts or self.DEFAULT_MAX_ATTEMPTS
+        self.dropped = 0
+
+        self.__queue = deque()
+        self.__queue_lock = Lock()
+        self.__flush_lock = Lock()  # One batch at a time, so that batches are committed in order
+        self.__wakeup = Event()
+        self.__stopping = Event()
+        self.__thread = None
+        self.__failed_attempts = dict()  # id(record) -> how many times it failed to be written
+
+    def __len__(self) -> int:
+        return len(self.__queue)
+
+    @property
+    def is_running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self) -> None:
+        with self.__queue_lock:
+            if self.__thread is not None:
+                return
+            self.__stopping.clear()
+            self.__thread = Thread(target=self.__run, name="work-order-journal", daemon=True)
+            self.__thread.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        with self.__queue_lock:
+            thread, self.__thread = self.__thread, None
+        if thread is not None:
+            self.__stopping.set()
+            self.__wakeup.set()
+            thread.join()
+            atexit.unregister(self.stop)
+        self.flush()
+
+    def record(self, bob_verifying_key: bytes, bob_signature: bytes, arrangement_id: bytes) -> None:
+        with self.__queue_lock:
+            self.__queue.append((bob_verifying_key, bob_signature, arrangement_id))
+            batch_is_ready = len(self.__queue) >= self.batch_size
+        if not self.is_running:
+            self.start()
+        if batch_is_ready:
+            self.__wakeup.set()
+
+    def flush(self) -> int:
+        """
+        Writes everything queued so far to the datastore, returning the number of records written.
+        """
+        written, failed = 0, list()
+        with self.__flush_lock:
+            while True:
+                with self.__queue_lock:
+                    batch = [self.__queue.popleft() for _ in range(min(self.batch_size, len(self.__queue)))]
+                if not batch:
+                    break
+
+                try:
+                    self.__write(batch)
+                except Exception as e:
+                    self.log.info(f"Failed to write a batch of {len(batch)} work orders; writing them one at a time: {e}")
+                    batch_written, batch_failed = self.__write_one_at_a_time(batch)
+                    written += batch_written
+                    failed.extend(batch_failed)
+                else:
+                    written += len(batch)
+
+            # Records which failed are retried on the next flush, ahead of those queued since.
+            with self.__queue_lock:
+                self.__queue.extendleft(reversed(failed))
+        return written
+
+    def __write(self, records) -> None:
+        with ThreadedSession(self.datastore.engine) as session:
+            self.datastore.save_workorders(records, session=session)
+
+    def __write_one_at_a_time(self, batch) -> Tuple[int, list]:
+        written, failed = 0, list()
+        for record in batch:
+            try:
+                self.__write([record])
+            except Exception as e:
+                attempts = self.__failed_attempts.pop(id(record), 0) + 1
+                if attempts < self.max_attempts and not isinstance(e, IntegrityError):
+                    self.__failed_attempts[id(record)] = attempts
+                    failed.append(record)
+                    continue
+                _bob_verifying_key, _bob_signature, arrangement_id = record
+                self.dropped += 1
+                self.log.warn(f"Dropped work order for arrangement {bytes(arrangement_id).hex()} "
+                              f"after {attempts} failed attempts to write it: {e}")
+            else:
+                self.__failed_attempts.pop(id(record), None)
+                written += 1
+        return written, failed
+
+    def __run(self) -> None:
+        while not self.__stopping.is_set():
+            self.__wakeup.wait(timeout=self.flush_interval)
+            self.__wakeup.clear()
+            self.flush()
@@ -14,16 +14,17 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
-from typing import Union, List
+from datetime import datetime
+from typing import Iterable, List, Tuple, Union
 
 from bytestring_splitter import BytestringSplitter
-from sqlalchemy.orm import sessionmaker
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
 
 from nucypher.crypto.signing import Signature
 from nucypher.crypto.utils import fingerprint_from_key
-from nucypher.keystore.db.models import Key, PolicyArrangement, Workorder
+from nucypher.keystore.db.models import Key, PolicyArrangement, StoredTreasureMap, Workorder
+from nucypher.keystore.threading import session_factory
 from . import keypairs
 
 
@@ -47,7 +48,7 @@ class KeyStore(object):
         :param sqlalchemy_engine: SQLAlchemy engine object to create session
         """
         self.engine = sqlalchemy_engine
-        Session = sessionmaker(bind=sqlalchemy_engine)
+        Session = session_factory(sqlalchemy_engine)
 
         # This will probably be on the reactor thread for most production configs.
         # Best to treat like hot lava.
@@ -145,6 +146,45 @@ class KeyStore(object):
         session.query(PolicyArrangement).filter_by(id=arrangement_id).delete()
         session.commit()
 
+    def del_expired_policy_arrangements(self,
+                                        now: datetime = None,
+                                        batch_size: int = 500,
+                                        session=None
+                                        ) -> Tuple[int, int]:
+        """
+        Deletes the PolicyArrangements which expired by now (UTC), and the Workorders
+        served under them, a batch at a time; returns how many of each were deleted.
+        """
+        session = session or self._session_on_init_thread
+        now = now or datetime.utcnow()
+
+        deleted_arrangements = deleted_workorders = 0
+        while True:
+            expired = session.query(PolicyArrangement.id).filter(PolicyArrangement.expiration <= now)
+            expired_ids = [arrangement_id for arrangement_id, in expired.limit(batch_size)]
+            if not expired_ids:
+                break
+
+            # Arrangements are kept by their hex ID, while Workorders refer to them by the raw ID.
+            workorder_arrangement_ids = list()
+            for arrangement_id in expired_ids:
+                try:
+                    workorder_arrangement_ids.append(bytes.fromhex(arrangement_id.decode()))
+                except ValueError:
+                    workorder_arrangement_ids.append(arrangement_id)
+
+            try:
+                workorders = session.query(Workorder).filter(Workorder.arrangement_id.in_(workorder_arrangement_ids))
+                deleted_workorders += workorders.delete(synchronize_session=False)
+                arrangements = session.query(PolicyArrangement).filter(PolicyArrangement.id.in_(expired_ids))
+                deleted_arrangements += arrangements.delete(synchronize_session=False)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
+        return deleted_arrangements, deleted_workorders
+
     def attach_kfrag_to_saved_arrangement(self, alice, id_as_hex, kfrag, session=None):
         session = session or self._session_on_init_thread
         
@@ -179,6 +219,41 @@ class KeyStore(object):
         session.commit()
         return new_workorder
 
+    def save_workorders(self, workorders: Iterable[Tuple[bytes, bytes, bytes]], session=None) -> List[Workorder]:
+        """
+        Adds several Workorders, given as (bob_verifying_key, bob_signature, arrangement_id),
+        to the keystore in a single transaction, preserving their order.
+        """
+        session = session or self._session_on_init_thread
+
+        keys_by_fingerprint = dict()
+        new_workorders = list()
+        try:
+            for bob_verifying_key, bob_signature, arrangement_id in workorders:
+
+                # Get or Create Bob Verifying Key
+                fingerprint = fingerprint_from_key(bob_verifying_key)
+                key = keys_by_fingerprint.get(fingerprint)
+                if not key:
+                    key = session.query(Key).filter_by(fingerprint=fingerprint).first()
+                    if not key:
+                        key = Key(fingerprint, bytes(bob_verifying_key), True)
+                        session.add(key)
+                        session.flush()  # Assigns the new key its ID
+                    keys_by_fingerprint[fingerprint] = key
+
+                new_workorder = Workorder(bob_verifying_key_id=key.id,
+                                          bob_signature=bob_signature,
+                                          arrangement_id=arrangement_id)
+                session.add(new_workorder)
+                new_workorders.append(new_workorder)
+
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        return new_workorders
+
     def get_workorders(self,
                        arrangement_id: bytes = None,
                        bob_verifying_key: bytes = None,
@@ -221,3 +296,58 @@ class KeyStore(object):
         session.commit()
 
         return deleted
+
+    def save_treasure_map(self,
+                          map_id: bytes,
+                          treasure_map: bytes,
+                          expiration: datetime,
+                          session=None
+                          ) -> StoredTreasureMap:
+        """
+        Adds a TreasureMap to the Keystore, replacing the one stored with the same ID, if any.
+        """
+        session = session or self._session_on_init_thread
+
+        stored_treasure_map = session.merge(StoredTreasureMap(map_id, treasure_map, expiration))
+        session.commit()
+
+        return stored_treasure_map
+
+    def get_treasure_map(self, map_id: bytes, now: datetime = None, session=None) -> StoredTreasureMap:
+        """
+        Returns the TreasureMap stored with this ID, unless it expired by now (UTC).
+        """
+        session = session or self._session_on_init_thread
+        now = now or datetime.utcnow()
+
+        stored_treasure_map = session.query(StoredTreasureMap).filter_by(id=map_id).first()
+
+        if not stored_treasure_map or stored_treasure_map.expiration <= now:
+            raise NotFound("No TreasureMap {} found.".format(map_id))
+        return stored_treasure_map
+
+    def del_expired_treasure_maps(self, now: datetime = None, max_rows: int = None, session=None) -> int:
+        """
+        Deletes the TreasureMaps which expired by now (UTC) and, if more than max_rows remain,
+        the ones closest to expiring until max_rows are left, returning how many were deleted.
+        """
+        session = session or self._session_on_init_thread
+        now = now or datetime.utcnow()
+
+        try:
+            expired = session.query(StoredTreasureMap).filter(StoredTreasureMap.expiration <= now)
+            deleted = expired.delete(synchronize_session=False)
+
+            if max_rows is not None:
+                excess = session.query(StoredTreasureMap).count() - max_rows
+                if excess > 0:
+                    oldest = session.query(StoredTreasureMap.id).order_by(StoredTreasureMap.expiration).limit(excess)
+                    oldest_ids = [map_id for map_id, in oldest]
+                    oldest_maps = session.query(StoredTreasureMap).filter(StoredTreasureMap.id.in_(oldest_ids))
+                    deleted += oldest_maps.delete(synchronize_session=False)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        return deleted
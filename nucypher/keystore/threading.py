@@ -14,18 +14,74 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
-from sqlalchemy.orm import sessionmaker, scoped_session
+from threading import Lock, RLock
+from typing import Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+_session_factory_lock = Lock()
+
+
+def session_factory(sqlalchemy_engine: Engine) -> sessionmaker:
+    """
+    The one session factory bound to this engine, made on first use and reused after.
+
+    It's kept on the engine itself, so the two are garbage collected together.
+    """
+    with _session_factory_lock:
+        try:
+            return sqlalchemy_engine._nucypher_session_factory
+        except AttributeError:
+            factory = sqlalchemy_engine._nucypher_session_factory = sessionmaker(bind=sqlalchemy_engine)
+            return factory
+
+
+def session_lock(sqlalchemy_engine: Engine) -> Optional[RLock]:
+    """
+    The lock which sessions on this engine take turns with, if its threads all share
+    a single connection (e.g. an in-memory datastore), or None if each gets one of its own.
+
+    Without it, their transactions would interleave on that connection,
+    and a rollback on one thread would undo another's writes.
+    """
+    if not isinstance(sqlalchemy_engine.pool, StaticPool):
+        return None
+    with _session_factory_lock:
+        try:
+            return sqlalchemy_engine._nucypher_session_lock
+        except AttributeError:
+            lock = sqlalchemy_engine._nucypher_session_lock = RLock()
+            return lock
 
 
 class ThreadedSession:
+    """
+    A session of its own for the block it's used in, from the engine's shared session factory;
+    its connection goes back to the engine's pool when the block exits.
+
+    On an engine whose threads share one connection, only one such block runs at a time.
+    """
 
     def __init__(self, sqlalchemy_engine) -> None:
         self.engine = sqlalchemy_engine
+        self.lock = session_lock(sqlalchemy_engine)
 
     def __enter__(self):
-        session_factory = sessionmaker(bind=self.engine)
-        self.session = scoped_session(session_factory)
+        if self.lock is not None:
+            self.lock.acquire()
+        try:
+            self.session = session_factory(self.engine)()
+        except BaseException:
+            if self.lock is not None:
+                self.lock.release()
+            raise
         return self.session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.session.remove()
\ No newline at end of file
+        try:
+            self.session.close()
+        finally:
+            if self.lock is not None:
+                self.lock.release()
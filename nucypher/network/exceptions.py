@@ -1,6 +1,11 @@
 import requests, socket
+from twisted.internet import defer, error
+from twisted.web.client import ResponseNeverReceived
 
 NodeSeemsToBeDown = (requests.exceptions.ConnectionError,
                      requests.exceptions.ReadTimeout,
                      socket.gaierror,
-                     ConnectionRefusedError)
+                     ConnectionRefusedError,
+                     error.ConnectError,       # The same, from AsyncRestMiddleware
+                     defer.TimeoutError,
+                     ResponseNeverReceived)
@@ -16,6 +16,10 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import socket
 import ssl
+from collections import namedtuple
+from io import BytesIO
+from typing import Tuple
+from urllib.parse import urlencode
 
 import requests
 import time
@@ -23,10 +27,23 @@ from bytestring_splitter import BytestringSplitter, VariableLengthBytestring
 from constant_sorrow.constants import CERTIFICATE_NOT_SAVED
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.serialization import Encoding
+from requests.adapters import HTTPAdapter
+from twisted.internet import reactor, threads
+from twisted.internet.defer import Deferred
+from twisted.internet.ssl import Certificate, optionsForClientTLS
 from twisted.logger import Logger
+from twisted.web.client import (Agent, BrowserLikePolicyForHTTPS, FileBodyProducer, HTTPConnectionPool,
+                                readBody)
+from twisted.web.http_headers import Headers
+from twisted.web.iweb import IPolicyForHTTPS
+from zope.interface import implementer
 from umbral.cfrags import CapsuleFrag
 from umbral.signing import Signature
 
+from nucypher.utilities.caches import LRUCache
+
 
 class UnexpectedResponse(Exception):
     pass
@@ -36,27 +53,106 @@ class NotFound(UnexpectedResponse):
     pass
 
 
+def pinned_ssl_context(certificate: x509.Certificate) -> ssl.SSLContext:
+    """
+    An SSL context which trusts this node's certificate, and no other.
+    """
+    context = ssl.create_default_context(cadata=certificate.public_bytes(Encoding.PEM).decode())
+    # Nodes are reached by IP address, to which urllib3 doesn't send SNI; it matches the address itself instead.
+    context.check_hostname = False
+    return context
+
+
+class PinnedCertificateAdapter(HTTPAdapter):
+    """
+    Verifies the TLS connections it makes with an SSL context pinned to a node's certificate,
+    rather than against a CA bundle file.
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext, *args, **kwargs) -> None:
+        self.ssl_context = ssl_context
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        """The pinned SSL context does the verifying; requests' CA bundle would widen it."""
+
+
+class NodeSessionPool(LRUCache):
+    """
+    A keep-alive requests.Session per node, keyed by its address and pinned certificate,
+    so that repeated requests to a node reuse its open connections instead of connecting
+    and completing a TLS handshake every time.
+
+    A node's certificate is pinned in memory, by an SSL context made from it once for its session;
+    a certificate file, if that's all there is, is passed to requests to verify against instead.
+
+    Sessions are kept for at most max_entries nodes; the least recently contacted
+    node's session is dropped to make room.  It isn't closed, since another thread may
+    still be using it; its connections are closed once it's garbage collected.
+    """
+
+    DEFAULT_MAX_ENTRIES = 256
+    DEFAULT_CONNECTIONS_PER_NODE = 10
+
+    def __init__(self, max_entries: int = None, connections_per_node: int = None) -> None:
+        super().__init__(max_entries=max_entries or self.DEFAULT_MAX_ENTRIES)
+        self.connections_per_node = connections_per_node or self.DEFAULT_CONNECTIONS_PER_NODE
+
+    def session(self,
+                host: str,
+                certificate_filepath=CERTIFICATE_NOT_SAVED,
+                certificate: x509.Certificate = None
+                ) -> requests.Session:
+        if certificate is not None:
+            key = (host, certificate.fingerprint(hashes.SHA256()))
+        else:
+            key = (host, str(certificate_filepath))
+
+        with self._lock:
+            session = self.get(key)
+            if session is None:
+                session = requests.Session()
+                if certificate is not None:
+                    adapter = PinnedCertificateAdapter(ssl_context=pinned_ssl_context(certificate),
+                                                       pool_connections=1,
+                                                       pool_maxsize=self.connections_per_node)
+                else:
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.connections_per_node)
+                session.mount("https://", adapter)
+                self.put(key, session)
+            return session
+
+
 class NucypherMiddlewareClient:
     library = requests
     timeout = 1.2
 
+    def __init__(self, sessions: NodeSessionPool = None) -> None:
+        self.sessions = sessions or NodeSessionPool()
+
     @staticmethod
     def response_cleaner(response):
         return response
 
-    def parse_node_or_host_and_port(self, node, host, port):
+    def parse_node_or_host_and_port(self, node, host, port, certificate=None):
         if node:
             if any((host, port)):
                 raise ValueError("Don't pass host and port if you are passing the node.")
             host = node.rest_url()
             certificate_filepath = node.certificate_filepath
+            certificate = certificate or node.certificate
         elif all((host, port)):
             host = f"{host}:{port}"
             certificate_filepath = CERTIFICATE_NOT_SAVED
         else:
             raise ValueError("You need to pass either the node or a host and port.")
 
-        return host, certificate_filepath, self.library
+        session = self.sessions.session(host, certificate_filepath=certificate_filepath, certificate=certificate)
+        return host, certificate_filepath, session
 
     def invoke_method(self, method, url, *args, **kwargs):
         self.clean_params(kwargs)
@@ -82,8 +178,10 @@ class NucypherMiddlewareClient:
                            host=None,
                            port=None,
                            certificate_filepath=None,
+                           certificate=None,
                            *args, **kwargs):
-            host, node_certificate_filepath, http_client = self.parse_node_or_host_and_port(node, host, port)
+            host, node_certificate_filepath, http_client = self.parse_node_or_host_and_port(node, host, port,
+                                                                                            certificate=certificate)
 
             if certificate_filepath:
                 filepaths_are_different = node_certificate_filepath != certificate_filepath
@@ -119,6 +217,19 @@ class RestMiddleware:
 
     client = NucypherMiddlewareClient()
 
+    # Ursula re-encrypts every capsule of a work order before answering, so its timeout grows with them.
+    WORK_ORDER_TIMEOUT = 2  # seconds
+    WORK_ORDER_TIMEOUT_PER_TASK = 0.2  # seconds
+
+    def remember_certificate(self, node) -> None:
+        """
+        Called once a node's certificate has been verified and stored.  Sessions are kept
+        per certificate, so a node's new one gets a session of its own; nothing to refresh.
+        """
+
+    def work_order_timeout(self, work_order) -> float:
+        return self.WORK_ORDER_TIMEOUT + self.WORK_ORDER_TIMEOUT_PER_TASK * len(work_order.tasks)
+
     def get_certificate(self, host, port, timeout=3, retry_attempts: int = 3, retry_rate: int = 2,
                         current_attempt: int = 0):
 
@@ -196,20 +307,22 @@ class RestMiddleware:
         return self.client.post(
             node=work_order.ursula,
             path=f"kFrag/{id_as_hex}/reencrypt",
-            data=payload, timeout=2)
+            data=payload, timeout=self.work_order_timeout(work_order))
 
-    def node_information(self, host, port, certificate_filepath=None):
+    def node_information(self, host, port, certificate_filepath=None, certificate=None):
         response = self.client.get(host=host, port=port,
                                    path="public_information",
                                    timeout=2,
-                                   certificate_filepath=certificate_filepath)
+                                   certificate_filepath=certificate_filepath,
+                                   certificate=certificate)
         return response.content
 
     def get_nodes_via_rest(self,
                            node,
                            announce_nodes=None,
                            nodes_i_need=None,
-                           fleet_checksum=None):
+                           fleet_checksum=None,
+                           teacher_fleet_checksum=None):
         if nodes_i_need:
             # TODO: This needs to actually do something.
             # Include node_ids in the request; if the teacher node doesn't know about the
@@ -221,6 +334,10 @@ class RestMiddleware:
         else:
             params = {}
 
+        if teacher_fleet_checksum:
+            # Ask the teacher for only those nodes which changed since the last state of its fleet we saw.
+            params['since'] = teacher_fleet_checksum
+
         if announce_nodes:
             payload = bytes().join(bytes(VariableLengthBytestring(n)) for n in announce_nodes)
             response = self.client.post(node=node,
@@ -234,3 +351,201 @@ class RestMiddleware:
                                        params=params)
 
         return response
+
+
+#
+# Asynchronous Middleware
+#
+
+AsyncResponse = namedtuple("AsyncResponse", ("status_code", "content", "headers"))
+
+
+@implementer(IPolicyForHTTPS)
+class PinnedCertificatePolicy:
+    """
+    Verifies each node's TLS certificate against the one pinned for its address, as
+    NucypherMiddlewareClient does by passing the node's certificate to requests as its CA bundle;
+    addresses with no pinned certificate are verified against the platform's trust roots.
+
+    A certificate file is only read when its address is first pinned, or when a node's
+    certificate is stored, so requests on the reactor don't touch the disk.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+
+    def __init__(self, max_entries: int = None) -> None:
+        self._pins = LRUCache(max_entries=max_entries or self.DEFAULT_MAX_ENTRIES)
+        self._default_policy = BrowserLikePolicyForHTTPS()
+
+    def is_pinned(self, host: str, port: int) -> bool:
+        return (host, port) in self._pins
+
+    def pin(self,
+            host: str,
+            port: int,
+            certificate_filepath: str = None,
+            certificate: x509.Certificate = None
+            ) -> None:
+        """
+        Pins this address to the certificate, unless it's pinned to that one already;
+        given a certificate_filepath instead, (re)pins it to the file's contents.
+        """
+        if certificate is not None:
+            pinned = self._pins.get((host, port))
+            if pinned and pinned[0] == certificate:
+                return
+            source, pem = certificate, certificate.public_bytes(Encoding.PEM)
+        else:
+            with open(certificate_filepath, 'rb') as certificate_file:
+                source, pem = certificate_filepath, certificate_file.read()
+        self._pins.put((host, port), (source, Certificate.loadPEM(pem)))
+
+    def creatorForNetloc(self, hostname: bytes, port: int):
+        pinned = self._pins.get((hostname.decode(), port))
+        if pinned is None:
+            return self._default_policy.creatorForNetloc(hostname, port)
+        _source, certificate = pinned
+        return optionsForClientTLS(hostname.decode(), trustRoot=certificate)
+
+
+class AsyncNucypherMiddlewareClient:
+    """
+    The asynchronous counterpart of NucypherMiddlewareClient: the same HTTP verbs, returning
+    Deferreds which fire with an AsyncResponse, or fail with NotFound or UnexpectedResponse.
+
+    Requests are made on the reactor over one pool of persistent connections,
+    so any number of them can be in flight without a thread each.
+    """
+
+    timeout = NucypherMiddlewareClient.timeout
+    MAX_CONNECTIONS_PER_NODE = 10
+
+    def __init__(self, clock=None, tls_policy: PinnedCertificatePolicy = None) -> None:
+        self.clock = clock or reactor
+        self.tls_policy = tls_policy or PinnedCertificatePolicy()
+        self.pool = HTTPConnectionPool(self.clock, persistent=True)
+        self.pool.maxPersistentPerHost = self.MAX_CONNECTIONS_PER_NODE
+        self.agent = Agent(self.clock, contextFactory=self.tls_policy, pool=self.pool)
+
+    def parse_node_or_host_and_port(self,
+                                    node,
+                                    host,
+                                    port,
+                                    certificate=None
+                                    ) -> Tuple[str, int, str, x509.Certificate]:
+        if node:
+            if any((host, port)):
+                raise ValueError("Don't pass host and port if you are passing the node.")
+            host, port = node.rest_interface.host, node.rest_interface.port
+            certificate_filepath = node.certificate_filepath
+            certificate = certificate or node.certificate
+        elif all((host, port)):
+            certificate_filepath = CERTIFICATE_NOT_SAVED
+        else:
+            raise ValueError("You need to pass either the node or a host and port.")
+
+        return host, int(port), certificate_filepath, certificate
+
+    def __getattr__(self, method_name):
+        # Quick sanity check.
+        if not method_name in ("post", "get", "put", "patch", "delete"):
+            raise TypeError(
+                f"This client is for HTTP only - you need to use a real HTTP verb, not '{method_name}'.")
+
+        def method_wrapper(path,
+                           node=None,
+                           host=None,
+                           port=None,
+                           certificate_filepath=None,
+                           certificate=None,
+                           params=None,
+                           data=None,
+                           timeout=None) -> Deferred:
+            host, port, node_certificate_filepath, certificate = self.parse_node_or_host_and_port(
+                node, host, port, certificate=certificate)
+
+            if certificate_filepath:
+                filepaths_are_different = node_certificate_filepath != certificate_filepath
+                node_has_a_cert = node_certificate_filepath is not CERTIFICATE_NOT_SAVED
+                if node_has_a_cert and filepaths_are_different:
+                    raise ValueError("Don't try to pass a node with a certificate_filepath while also passing a"
+                                     " different certificate_filepath.  What do you even expect?")
+            else:
+                certificate_filepath = node_certificate_filepath
+
+            if certificate is not None:
+                self.tls_policy.pin(host, port, certificate=certificate)
+            elif certificate_filepath is not CERTIFICATE_NOT_SAVED and not self.tls_policy.is_pinned(host, port):
+                self.tls_policy.pin(host, port, certificate_filepath=certificate_filepath)
+
+            url = f"https://{host}:{port}/{path}"
+            if params:
+                url = f"{url}?{urlencode(params)}"
+            body = FileBodyProducer(BytesIO(data)) if data is not None else None
+
+            d = self.agent.request(method_name.upper().encode(), url.encode(), Headers(), body)
+            d.addCallback(self._read_response)
+            d.addTimeout(timeout or self.timeout, self.clock)
+            d.addCallback(self._check_response, method_name, path)
+            return d
+
+        return method_wrapper
+
+    @staticmethod
+    def _read_response(response) -> Deferred:
+        d = readBody(response)
+        d.addCallback(lambda content: AsyncResponse(status_code=response.code,
+                                                    content=content,
+                                                    headers=response.headers))
+        return d
+
+    @staticmethod
+    def _check_response(response: AsyncResponse, method_name: str, path: str) -> AsyncResponse:
+        if response.status_code >= 300:
+            if response.status_code == 404:
+                m = f"While trying to {method_name} {path}, server 404'd.  Response: {response.content}"
+                raise NotFound(m)
+            else:
+                m = f"Unexpected response while trying to {method_name} {path}: {response.status_code} {response.content}"
+                raise UnexpectedResponse(m)
+        return response
+
+
+class AsyncRestMiddleware(RestMiddleware):
+    """
+    RestMiddleware whose every method returns a Deferred instead of blocking, firing with
+    what the blocking method would have returned.
+    """
+
+    def __init__(self, client: AsyncNucypherMiddlewareClient = None) -> None:
+        # Made here rather than at import, so that its Agent is on whichever reactor is installed by then.
+        self.client = client or AsyncNucypherMiddlewareClient()
+
+    def remember_certificate(self, node) -> None:
+        self.client.tls_policy.pin(node.rest_interface.host, node.rest_interface.port, certificate=node.certificate)
+
+    def get_certificate(self, *args, **kwargs) -> Deferred:
+        return threads.deferToThread(super().get_certificate, *args, **kwargs)
+
+    def enact_policy(self, ursula, kfrag_id, payload) -> Deferred:
+        d = self.client.post(node=ursula,
+                             path=f'kFrag/{kfrag_id.hex()}',
+                             data=payload,
+                             timeout=2)
+        d.addCallback(lambda _response: (True, ursula.stamp.as_umbral_pubkey()))
+        return d
+
+    def reencrypt(self, work_order) -> Deferred:
+        d = self.send_work_order_payload_to_ursula(work_order)
+        splitter = BytestringSplitter((CapsuleFrag, VariableLengthBytestring), Signature)
+        d.addCallback(lambda response: work_order.complete(splitter.repeat(response.content)))
+        return d
+
+    def node_information(self, host, port, certificate_filepath=None, certificate=None) -> Deferred:
+        d = self.client.get(host=host, port=port,
+                            path="public_information",
+                            timeout=2,
+                            certificate_filepath=certificate_filepath,
+                            certificate=certificate)
+        d.addCallback(lambda response: response.content)
+        return d
@@ -23,6 +23,7 @@ from collections import defaultdict, OrderedDict
 from collections import deque
 from collections import namedtuple
 from contextlib import suppress
+from threading import Lock
 from typing import Set, Tuple, Union
 
 import maya
@@ -40,6 +41,7 @@ from constant_sorrow.constants import (
     UNKNOWN_FLEET_STATE
 )
 from cryptography.x509 import Certificate
+from eth_utils import to_checksum_address
 from requests.exceptions import SSLError
 from twisted.internet import reactor, defer
 from twisted.internet import task
@@ -63,6 +65,7 @@ from nucypher.network.middleware import RestMiddleware
 from nucypher.network.nicknames import nickname_from_seed
 from nucypher.network.protocols import SuspiciousActivity
 from nucypher.network.server import TLSHostingPower
+from nucypher.utilities.concurrency import WorkerPool
 
 
 def icon_from_checksum(checksum,
@@ -88,6 +91,78 @@ def icon_from_checksum(checksum,
     )
 
 
+class FleetStateDigest:
+    """
+    An incrementally maintained digest of a fleet of serialized nodes.
+
+    Nodes are bucketed by the leading hex digits of their checksum address into a
+    fixed-depth, 16-way tree.  Adding, replacing or removing a node only rehashes
+    the node's bucket and that bucket's ancestors; the rest of the fleet is untouched.
+
+    The root only tells a FleetStateTracker cheaply whether its fleet changed; it never
+    goes on the wire, where the fleet state checksum is the one every node version computes.
+    """
+
+    DEPTH = 2
+    _NIBBLES = '0123456789abcdef'
+
+    def __init__(self):
+        self._buckets = defaultdict(dict)  # prefix -> {address: node digest}
+        self._digests = dict()             # prefix -> subtree digest, for every prefix of length 0..DEPTH
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def __contains__(self, checksum_address):
+        address = checksum_address.lower()
+        return address in self._buckets.get(self._bucket_prefix(address), ())
+
+    @property
+    def root(self) -> bytes:
+        return self._digests.get('')
+
+    def _bucket_prefix(self, address: str) -> str:
+        return address[2:2 + self.DEPTH]
+
+    def update(self, checksum_address: str, node_bytes: bytes) -> None:
+        address = checksum_address.lower()
+        prefix = self._bucket_prefix(address)
+        self._buckets[prefix][address] = keccak_digest(node_bytes)
+        self._rehash(prefix)
+
+    def remove(self, checksum_address: str) -> None:
+        address = checksum_address.lower()
+        prefix = self._bucket_prefix(address)
+        bucket = self._buckets.get(prefix, {})
+        if bucket.pop(address, None) is None:
+            return
+        if not bucket:
+            del self._buckets[prefix]
+        self._rehash(prefix)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._digests.clear()
+
+    def _rehash(self, bucket_prefix: str) -> None:
+        bucket = self._buckets.get(bucket_prefix)
+        if bucket:
+            node_digests = (bucket[address] for address in sorted(bucket))
+            self._digests[bucket_prefix] = keccak_digest(b"".join(node_digests))
+        else:
+            self._digests.pop(bucket_prefix, None)
+
+        # Walk up the tree, rehashing each ancestor from its (at most 16) children.
+        for depth in reversed(range(len(bucket_prefix))):
+            prefix = bucket_prefix[:depth]
+            children = b"".join(nibble.encode() + self._digests[prefix + nibble]
+                                for nibble in self._NIBBLES if prefix + nibble in self._digests)
+            if children:
+                self._digests[prefix] = keccak_digest(children)
+            else:
+                self._digests.pop(prefix, None)
+
+
 class FleetStateTracker:
     """
     A representation of a fleet of NuCypher nodes.
@@ -97,6 +172,7 @@ class FleetStateTracker:
     _nickname_metadata = NO_KNOWN_NODES
     _tracking = False
     most_recent_node_change = NO_KNOWN_NODES
+    MAX_RECORDED_STATES = 64  # Older states age out; learners still referencing them get a full dump.
     snapshot_splitter = BytestringSplitter(32, 4)
     log = Logger("Learning")
     state_template = namedtuple("FleetState", ("nickname", "metadata", "icon", "nodes", "updated"))
@@ -104,11 +180,42 @@ class FleetStateTracker:
     def __init__(self):
         self.additional_nodes_to_track = []
         self.updated = maya.now()
+        self._digest = FleetStateDigest()
+        self._recorded_digest_root = None
+        self._serialized_nodes = dict()
         self._nodes = OrderedDict()
         self.states = OrderedDict()
 
+    @property
+    def _nodes(self):
+        return self.__nodes
+
+    @_nodes.setter
+    def _nodes(self, nodes):
+        # Replacing the node collection wholesale (rather than node by node) invalidates the digest.
+        self.__nodes = OrderedDict(nodes)
+        self._digest.clear()
+        self._serialized_nodes.clear()
+        for node in self.__nodes.values():
+            self._track(node)
+
+    def _track(self, node, node_bytes: bytes = None) -> None:
+        node_bytes = node_bytes or bytes(node)
+        self._serialized_nodes[node.checksum_address] = node_bytes
+        self._digest.update(node.checksum_address, node_bytes)
+
+    def serialized(self, node) -> bytes:
+        """
+        Returns the cached serialization of a node tracked in this fleet state.
+        """
+        try:
+            return self._serialized_nodes[node.checksum_address]
+        except KeyError:
+            return bytes(node)
+
     def __setitem__(self, key, value):
         self._nodes[key] = value
+        self._track(value)
 
         if self._tracking:
             self.log.info("Updating fleet state after saving node {}".format(value))
@@ -179,12 +286,23 @@ class FleetStateTracker:
         if not self._nodes:
             # No news here.
             return
-        sorted_nodes = self.sorted()
 
-        sorted_nodes_joined = b"".join(bytes(n) for n in sorted_nodes)
-        checksum = keccak_digest(sorted_nodes_joined).hex()
+        for node in self.additional_nodes_to_track:
+            node_bytes = bytes(node)
+            if self._serialized_nodes.get(node.checksum_address) != node_bytes:
+                self._track(node, node_bytes)  # New, or its metadata changed since it was last tracked.
+
+        digest_root = self._digest.root
+        if digest_root == self._recorded_digest_root:
+            return  # No news here either.
+        self._recorded_digest_root = digest_root
+
+        # The checksum is the flat keccak of the sorted nodes, as nodes of earlier versions compute it,
+        # so that fleet states still match across versions; only the serializing is cached.
+        sorted_nodes = self.sorted()
+        checksum = keccak_digest(b"".join(self.serialized(node) for node in sorted_nodes)).hex()
         if checksum not in self.states:
-            self.checksum = keccak_digest(b"".join(bytes(n) for n in self.sorted())).hex()
+            self.checksum = checksum
             self.updated = maya.now()
             # For now we store the sorted node list.  Someday we probably spin this out into
             # its own class, FleetState, and use it as the basis for partial updates.
@@ -195,8 +313,26 @@ class FleetStateTracker:
                                             updated=self.updated,
                                             )
             self.states[checksum] = new_state
+            while len(self.states) > self.MAX_RECORDED_STATES:
+                self.states.popitem(last=False)
             return checksum, new_state
 
+    def nodes_updated_since(self, checksum: str):
+        """
+        Returns the nodes which were added or updated after the recorded fleet state
+        matching checksum, or None if that state is unknown or has aged out.
+        """
+        try:
+            previous_state = self.states[checksum]
+        except KeyError:
+            return None
+
+        # Updated nodes are new objects, so identity (rather than Character equality, which
+        # only considers the stamp) tells us which nodes the previous state already had.
+        previous_nodes = set(id(node) for node in previous_state.nodes)
+        current_nodes = list(self._nodes.values()) + self.additional_nodes_to_track
+        return [node for node in current_nodes if id(node) not in previous_nodes]
+
     def start_tracking_state(self, additional_nodes_to_track=None):
         if additional_nodes_to_track is None:
             additional_nodes_to_track = list()
@@ -271,6 +407,9 @@ class Learner:
     _SHORT_LEARNING_DELAY = 5
     _LONG_LEARNING_DELAY = 90
     LEARNING_TIMEOUT = 10
+    TEACHER_RESPONSE_TIMEOUT = 10
+    NODE_VERIFICATION_TIMEOUT = 10
+    MAX_CONCURRENT_VERIFICATIONS = 8
     _ROUNDS_WITHOUT_NODES_AFTER_WHICH_TO_SLOW_DOWN = 10
 
     # For Keeps
@@ -315,11 +454,16 @@ class Learner:
                  node_storage=None,
                  save_metadata: bool = False,
                  abort_on_learning_error: bool = False,
-                 lonely: bool = False
+                 lonely: bool = False,
+                 teachers_per_round: int = 1,
                  ) -> None:
 
         self.log = Logger("learning-loop")  # type: Logger
 
+        if teachers_per_round < 1:
+            raise ValueError(f"Must learn from at least one teacher per round, got {teachers_per_round}.")
+        self.teachers_per_round = teachers_per_round
+
         self.learning_domains = domains
         self.network_middleware = network_middleware
         self.save_metadata = save_metadata
@@ -427,14 +571,6 @@ class Learner:
             # Whoops, we got an Alice, Bob, or someone...
             raise self.NotATeacher(f"{node.__class__.__name__} does not have a certificate and cannot be remembered.")
 
-        # Store node's certificate - It has been seen.
-        certificate_filepath = self.node_storage.store_node_certificate(certificate=stranger_certificate)
-
-        # In some cases (seed nodes or other temp stored certs),
-        # this will update the filepath from the temp location to this one.
-        node.certificate_filepath = certificate_filepath
-        self.log.info(f"Saved TLS certificate for {node.nickname}: {certificate_filepath}")
-
         try:
             node.verify_node(force=force_verification_check,
                              network_middleware=self.network_middleware,
@@ -453,6 +589,16 @@ class Learner:
             self.log.info(f'Staker:Worker {node.checksum_address}:{node.worker_address} is not actively staking, skipping.')
             return False
 
+        # Store node's certificate - It has been verified.  Only node storage which persists certificates
+        # writes it to disk; connections to the node are pinned to the certificate in memory either way.
+        certificate_filepath = self.node_storage.store_node_certificate(certificate=stranger_certificate)
+        if certificate_filepath is not CERTIFICATE_NOT_SAVED:
+            # In some cases (seed nodes or other temp stored certs),
+            # this will update the filepath from the temp location to this one.
+            node.certificate_filepath = certificate_filepath
+            self.log.info(f"Saved TLS certificate for {node.nickname}: {certificate_filepath}")
+        self.network_middleware.remember_certificate(node)
+
         listeners = self._learning_listeners.pop(node.checksum_address, tuple())
         address = node.checksum_address
 
@@ -739,38 +885,129 @@ class Learner:
     def learn_from_teacher_node(self, eager=True):
         """
         Sends a request to node_url to find out about known nodes.
+
+        If this Learner is configured to learn from more than one teacher per round,
+        the teachers are asked concurrently instead.
         """
         self._learning_round += 1
 
+        if self.teachers_per_round > 1:
+            return self._learn_from_several_teacher_nodes(eager=eager)
+
         try:
             current_teacher = self.current_teacher_node()
         except self.NotEnoughTeachers as e:
             self.log.warn("Can't learn right now: {}".format(e.args[0]))
             return
 
+        try:
+            node_list = self._fetch_nodes_from_teacher(current_teacher)
+        except NodeSeemsToBeDown as e:
+            self.log.info("Bad Response from teacher: {}:{}.".format(current_teacher, e))
+            return
+        finally:
+            self.cycle_teacher_node()
+
+        if not isinstance(node_list, list):
+            # Either there was nothing to learn (NO_KNOWN_NODES, FLEET_STATES_MATCH) or the response was bad.
+            if node_list is None or not current_teacher.pending_nodes:
+                return node_list
+            node_list = list()  # Nothing new, but the nodes it sent before which we couldn't reach are retried.
+
+        nodes_and_teachers = ((node, current_teacher) for node in self._with_pending_nodes(current_teacher, node_list))
+        new_nodes, unsettled_nodes = self._remember_nodes_from_teachers(nodes_and_teachers, eager=eager)
+        self._settle_fleet_state(current_teacher, unsettled_nodes=unsettled_nodes)
+        learning_round_log_message = "Learning round {}.  Teacher: {} knew about {} nodes, {} were new."
+        self.log.info(learning_round_log_message.format(self._learning_round,
+                                                        current_teacher,
+                                                        len(node_list),
+                                                        len(new_nodes)))
+        return new_nodes
+
+    def _learn_from_several_teacher_nodes(self, eager=True):
+        """
+        Asks up to teachers_per_round teachers for their known nodes concurrently,
+        then merges their responses into a single pass of remembering nodes.
+        """
+        teachers = OrderedDict()
+        try:
+            teacher = self.current_teacher_node()
+            for _ in range(self.teachers_per_round):
+                teachers[teacher.checksum_address] = teacher
+                teacher = self.current_teacher_node(cycle=True)
+        except self.NotEnoughTeachers as e:
+            if not teachers:
+                self.log.warn("Can't learn right now: {}".format(e.args[0]))
+                return
+
+        worker_pool = WorkerPool(worker=self._fetch_nodes_from_teacher,
+                                 max_workers=len(teachers),
+                                 timeout=self.TEACHER_RESPONSE_TIMEOUT)
+
+        # If several teachers know about the same node, consider only its most recent representation.
+        nodes_to_consider = OrderedDict()
+        teachers_of_node = defaultdict(list)
+        answering_teachers = []
+        for teacher, node_list, error in worker_pool.as_completed(teachers.values()):
+            if error:
+                if isinstance(error, NodeSeemsToBeDown + (WorkerPool.TimedOut, self.InvalidSignature)):
+                    self.log.info("Bad Response from teacher: {}:{}.".format(teacher, error))
+                    continue
+                raise error
+
+            if not isinstance(node_list, list):
+                if node_list is None or not teacher.pending_nodes:
+                    continue  # Nothing new from this teacher.
+                node_list = list()
+
+            answering_teachers.append(teacher)
+            for node in self._with_pending_nodes(teacher, node_list):
+                teachers_of_node[node.checksum_address].append(teacher)
+                with suppress(KeyError):
+                    already_considered_node, _propagated_by = nodes_to_consider[node.checksum_address]
+                    if not node.timestamp > already_considered_node.timestamp:
+                        continue
+                nodes_to_consider[node.checksum_address] = (node, teacher)
+
+        new_nodes, unsettled_nodes = self._remember_nodes_from_teachers(nodes_to_consider.values(), eager=eager)
+
+        # Nodes we couldn't reach this round are retried along with what each teacher who sent them sends next.
+        unsettled_nodes_of_teacher = defaultdict(list)
+        for node in unsettled_nodes:
+            for teacher in teachers_of_node[node.checksum_address]:
+                unsettled_nodes_of_teacher[teacher.checksum_address].append(node)
+        for teacher in answering_teachers:
+            self._settle_fleet_state(teacher, unsettled_nodes=unsettled_nodes_of_teacher[teacher.checksum_address])
+
+        learning_round_log_message = "Learning round {}.  {} teachers knew about {} distinct nodes, {} were new."
+        self.log.info(learning_round_log_message.format(self._learning_round,
+                                                        len(teachers),
+                                                        len(nodes_to_consider),
+                                                        len(new_nodes)))
+        return new_nodes
+
+    def _fetch_nodes_from_teacher(self, teacher):
+        """
+        Requests the nodes known to a teacher and checks the teacher's signature on them.
+
+        Returns a list of (not yet verified) nodes, NO_KNOWN_NODES, or FLEET_STATES_MATCH;
+        returns None if the teacher's response can't be used.
+        """
+
         if Teacher in self.__class__.__bases__:
             announce_nodes = [self]
         else:
             announce_nodes = None
 
-        unresponsive_nodes = set()
-
         #
         # Request
         #
 
-        try:
-            response = self.network_middleware.get_nodes_via_rest(node=current_teacher,
-                                                                  nodes_i_need=self._node_ids_to_learn_about_immediately,
-                                                                  announce_nodes=announce_nodes,
-                                                                  fleet_checksum=self.known_nodes.checksum)
-        except NodeSeemsToBeDown as e:
-            unresponsive_nodes.add(current_teacher)
-            self.log.info("Bad Response from teacher: {}:{}.".format(current_teacher, e))
-            return
-
-        finally:
-            self.cycle_teacher_node()
+        response = self.network_middleware.get_nodes_via_rest(node=teacher,
+                                                              nodes_i_need=self._node_ids_to_learn_about_immediately,
+                                                              announce_nodes=announce_nodes,
+                                                              fleet_checksum=self.known_nodes.checksum,
+                                                              teacher_fleet_checksum=teacher.learned_fleet_state_checksum)
 
         # Before we parse the response, let's handle some edge cases.
         if response.status_code == 204:
@@ -781,7 +1018,7 @@ class Learner:
             # It's possible that our fleet states match, and we'll check for that later.
 
         elif response.status_code != 200:
-            self.log.info("Bad response from teacher {}: {} - {}".format(current_teacher, response, response.content))
+            self.log.info("Bad response from teacher {}: {} - {}".format(teacher, response, response.content))
             return
 
         #
@@ -791,12 +1028,12 @@ class Learner:
         try:
             signature, node_payload = signature_splitter(response.content, return_remainder=True)
         except BytestringSplittingError as e:
-            self.log.warn("No signature prepended to Teacher {} payload: {}".format(current_teacher, response.content))
+            self.log.warn("No signature prepended to Teacher {} payload: {}".format(teacher, response.content))
             return
 
         try:
-            self.verify_from(current_teacher, node_payload, signature=signature)
-        except current_teacher.InvalidSignature:
+            self.verify_from(teacher, node_payload, signature=signature)
+        except teacher.InvalidSignature:
             # TODO: What to do if the teacher improperly signed the node payload?
             raise
 
@@ -805,28 +1042,58 @@ class Learner:
             node_payload,
             return_remainder=True)
 
-        current_teacher.last_seen = maya.now()
+        teacher.last_seen = maya.now()
         # TODO: This is weird - let's get a stranger FleetState going.
         checksum = fleet_state_checksum_bytes.hex()
 
         # TODO: This doesn't make sense - a decentralized node can still learn about a federated-only node.
         from nucypher.characters.lawful import Ursula
-        if constant_or_bytes(node_payload) is FLEET_STATES_MATCH:
-            current_teacher.update_snapshot(checksum=checksum,
-                                            updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
-                                            number_of_known_nodes=len(self.known_nodes))
+        if node_payload and constant_or_bytes(node_payload) is FLEET_STATES_MATCH:
+            teacher.update_snapshot(checksum=checksum,
+                                    updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
+                                    number_of_known_nodes=len(self.known_nodes))
+            teacher.learned_fleet_state_checksum = checksum  # Our fleets match; there is nothing left to learn.
             return FLEET_STATES_MATCH
 
         node_list = Ursula.batch_from_bytes(node_payload,
                                             registry=self.registry,
                                             federated_only=self.federated_only)  # TODO: 466
 
-        current_teacher.update_snapshot(checksum=checksum,
-                                        updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
-                                        number_of_known_nodes=len(node_list))
+        teacher.update_snapshot(checksum=checksum,
+                                updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
+                                number_of_known_nodes=len(node_list))
+        return node_list
+
+    @staticmethod
+    def _settle_fleet_state(teacher, unsettled_nodes: list) -> None:
+        """
+        Once a teacher's nodes have been considered, it is only asked for what changed since.
+
+        Nodes which couldn't be reached this time wouldn't be mentioned in any later delta,
+        so they are kept as pending and retried directly along with the teacher's next answer.
+        """
+        teacher.learned_fleet_state_checksum = teacher.fleet_state_checksum
+        teacher.pending_nodes = {node.checksum_address: node for node in unsettled_nodes}
+
+    @staticmethod
+    def _with_pending_nodes(teacher, node_list: list) -> list:
+        """The nodes a teacher just sent, along with those it sent before which we couldn't reach then."""
+        sent = {node.checksum_address for node in node_list}
+        return node_list + [node for address, node in teacher.pending_nodes.items() if address not in sent]
+
+    def _remember_nodes_from_teachers(self, nodes_and_teachers, eager=True) -> Tuple[list, list]:
+        """
+        Verifies and remembers nodes learned from teachers, given as (node, teacher) pairs,
+        then records a new fleet state (once) if any of them were new.
+
+        When eager, nodes are verified concurrently (at most MAX_CONCURRENT_VERIFICATIONS at a time,
+        each within NODE_VERIFICATION_TIMEOUT seconds) and remembered as soon as they pass.
 
-        new_nodes = []
-        for node in node_list:
+        Returns the new nodes, and those which couldn't be reached (they timed out or seem
+        to be down); nodes rejected for what they are (invalid, not staking) are not retried.
+        """
+        candidates = []
+        for node, current_teacher in nodes_and_teachers:
             if not set(self.learning_domains).intersection(set(node.serving_domains)):
                 self.log.debug(f"Teacher {node} is serving {node.serving_domains}, but we're only learning {self.learning_domains}.")
                 continue  # This node is not serving any of our domains.
@@ -840,26 +1107,47 @@ class Learner:
                     # This node is already known.  We can safely continue to the next.
                     continue
 
-            #
-            # Verify Node
-            #
+            candidates.append((node, current_teacher))
 
-            certificate_filepath = self.node_storage.store_node_certificate(certificate=node.certificate)
-            try:
-                if eager:
-                    node.verify_node(self.network_middleware,
-                                     registry=self.registry,
-                                     certificate_filepath=certificate_filepath)
-                    self.log.debug("Verified node: {}".format(node.checksum_address))
+        #
+        # Verify Nodes
+        #
 
-                else:
-                    node.validate_metadata(registry=self.registry)
+        def verify(candidate):
+            node, _teacher = candidate
+            if eager:
+                node.verify_node(self.network_middleware, registry=self.registry)  # Pinned to node.certificate
+                self.log.debug("Verified node: {}".format(node.checksum_address))
+            else:
+                node.validate_metadata(registry=self.registry)
+
+        if eager:
+            worker_pool = WorkerPool(worker=verify,
+                                     max_workers=self.MAX_CONCURRENT_VERIFICATIONS,
+                                     value_timeout=self.NODE_VERIFICATION_TIMEOUT)
+            outcomes = worker_pool.as_completed(candidates)
+        else:
+            # Without eager verification there is no REST round trip per node; validate on this thread.
+            outcomes = WorkerPool.in_place(worker=verify, values=candidates)
+
+        new_nodes, unsettled_nodes = [], []
+        for candidate, _result, error in outcomes:
+            node, current_teacher = candidate
+            try:
+                if error:
+                    raise error
 
             #
             # Report Failure
             #
 
+            except WorkerPool.TimedOut:
+                unsettled_nodes.append(node)
+                self.log.info(f"Verification Failed - "
+                              f"{node} did not respond within {self.NODE_VERIFICATION_TIMEOUT} seconds.")
+
             except NodeSeemsToBeDown:
+                unsettled_nodes.append(node)
                 self.log.info(f"Verification Failed - "
                               f"Cannot establish connection to {node}.")
 
@@ -902,16 +1190,119 @@ class Learner:
         #
 
         self._adjust_learning(new_nodes)
-        learning_round_log_message = "Learning round {}.  Teacher: {} knew about {} nodes, {} were new."
-        self.log.info(learning_round_log_message.format(self._learning_round,
-                                                        current_teacher,
-                                                        len(node_list),
-                                                        len(new_nodes)))
         if new_nodes:
             self.known_nodes.record_fleet_state()
-            for node in new_nodes:
-                self.node_storage.store_node_certificate(certificate=node.certificate)
-        return new_nodes
+        return new_nodes, unsettled_nodes
+
+
+class StakerValidationCache:
+    """
+    Memoizes the on-chain answers used to validate a Teacher's worker - the staker a worker is
+    bonded to, and whether a staker is really staking.  These change at most once per period, so
+    answers are kept until the period rolls over, at which point all active stakers are
+    prefetched in bulk.  Negative answers are not kept, so that a stake or bond which
+    becomes effective with a new period is picked up before the next period check.
+
+    There is one cache per registry, shared by every Teacher validated against it (i.e. by both
+    the learning loop and the REST server).
+    """
+
+    PERIOD_REFRESH_INTERVAL = 60  # seconds between checks of the current period on-chain
+
+    __caches = dict()
+
+    @classmethod
+    def for_registry(cls, registry: BaseContractRegistry) -> 'StakerValidationCache':
+        registry_id = registry.id
+        try:
+            return cls.__caches[registry_id]
+        except KeyError:
+            cache = cls(registry=registry)
+            cls.__caches[registry_id] = cache
+            return cache
+
+    def __init__(self, registry: BaseContractRegistry) -> None:
+        self.registry = registry
+        self.__lock = Lock()
+        self.__refresh_lock = Lock()
+        self.__period = None
+        self.__period_checked_at = None
+        self.__stakers_by_worker = dict()  # (worker, period) -> staker
+        self.__staking = dict()            # (staker, period) -> bool
+
+    @property
+    def staking_agent(self) -> StakingEscrowAgent:
+        return ContractAgency.get_agent(StakingEscrowAgent, registry=self.registry)
+
+    def current_period(self) -> int:
+        if not self.__period_is_stale():
+            return self.__period
+
+        # One thread goes to the chain; the others carry on with the period they know, if they know one.
+        if self.__refresh_lock.acquire(blocking=self.__period is None):
+            try:
+                if self.__period_is_stale():
+                    self.__refresh_period()
+            finally:
+                self.__refresh_lock.release()
+        return self.__period
+
+    def __period_is_stale(self) -> bool:
+        checked_at = self.__period_checked_at
+        return checked_at is None or time.monotonic() - checked_at >= self.PERIOD_REFRESH_INTERVAL
+
+    def __refresh_period(self) -> None:
+        period = self.staking_agent.get_current_period()
+        if period != self.__period:
+            staking = self.__fetch_active_stakers(period)  # Without holding up lookups meanwhile
+            with self.__lock:
+                self.__period = period
+                self.__stakers_by_worker.clear()
+                self.__staking.clear()
+                self.__staking.update(staking)
+        self.__period_checked_at = time.monotonic()
+
+    def __fetch_active_stakers(self, period: int) -> dict:
+        if not self.staking_agent.get_staker_population():
+            return dict()  # There are no stakers at all (getActiveStakers would revert)
+
+        # Active stakers have confirmed activity for this period; those with enough tokens
+        # locked for the next one are staking, without the need to ask about each of them.
+        min_stake = TokenEconomicsFactory.get_economics(registry=self.registry).minimum_allowed_locked
+        _total_locked_tokens, active_stakers = self.staking_agent.get_all_active_stakers(periods=1)
+        return {(to_checksum_address(staker), period): True
+                for staker, locked_tokens in active_stakers
+                if locked_tokens >= min_stake}
+
+    def staker_from_worker(self, worker_address: str) -> str:
+        key = (worker_address, self.current_period())
+        try:
+            return self.__stakers_by_worker[key]
+        except KeyError:
+            staker_address = self.staking_agent.get_staker_from_worker(worker_address=worker_address)
+            if staker_address != BlockchainInterface.NULL_ADDRESS:
+                self.__stakers_by_worker[key] = staker_address
+            return staker_address
+
+    def is_staking(self, staker_address: str) -> bool:
+        key = (staker_address, self.current_period())
+        try:
+            return self.__staking[key]
+        except KeyError:
+            min_stake = TokenEconomicsFactory.get_economics(registry=self.registry).minimum_allowed_locked
+            stake_current_period = self.staking_agent.get_locked_tokens(staker_address=staker_address, periods=0)
+            stake_next_period = self.staking_agent.get_locked_tokens(staker_address=staker_address, periods=1)
+            is_staking = max(stake_current_period, stake_next_period) >= min_stake
+            if is_staking:
+                self.__staking[key] = is_staking
+            return is_staking
+
+    def forget(self, staker_address: str, worker_address: str = None) -> None:
+        """Drops what is known about this staker (and worker) for the current period."""
+        period = self.__period
+        self.__staking.pop((staker_address, period), None)
+        if worker_address:
+            self.__stakers_by_worker.pop((worker_address, period), None)
 
 
 class Teacher:
@@ -937,6 +1328,8 @@ class Teacher:
         self.serving_domains = domains
         self.fleet_state_checksum = None
         self.fleet_state_updated = None
+        self.learned_fleet_state_checksum = None  # The state of its fleet we last learned all of; deltas are since it.
+        self.pending_nodes = dict()  # checksum_address -> node it sent which we couldn't reach yet; retried directly.
         self.last_seen = NEVER_SEEN("No Connection to Node")
 
         self.fleet_state_icon = UNKNOWN_FLEET_STATE
@@ -1049,10 +1442,8 @@ class Teacher:
         As a follow-up, this checks that the worker is linked to a staker, but it may be
         the case that the "staker" isn't "staking" (e.g., all her tokens have been slashed).
         """
-        # Lazy agent get or create
-        staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=registry)
-
-        staker_address = staking_agent.get_staker_from_worker(worker_address=self.worker_address)
+        validation_cache = StakerValidationCache.for_registry(registry=registry)
+        staker_address = validation_cache.staker_from_worker(worker_address=self.worker_address)
         if staker_address == BlockchainInterface.NULL_ADDRESS:
             raise self.DetachedWorker(f"Worker {self.worker_address} is detached")
         return staker_address == self.checksum_address
@@ -1062,20 +1453,8 @@ class Teacher:
         This method assumes the stamp's signature is valid and accurate.
         As a follow-up, this checks that the staker is, indeed, staking.
         """
-        # Lazy agent get or create
-        staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=registry)  # type: StakingEscrowAgent
-
-        try:
-            economics = TokenEconomicsFactory.get_economics(registry=registry)
-        except Exception:
-            raise  # TODO: Get StandardEconomics
-
-        min_stake = economics.minimum_allowed_locked
-
-        stake_current_period = staking_agent.get_locked_tokens(staker_address=self.checksum_address, periods=0)
-        stake_next_period = staking_agent.get_locked_tokens(staker_address=self.checksum_address, periods=1)
-        is_staking = max(stake_current_period, stake_next_period) >= min_stake
-        return is_staking
+        validation_cache = StakerValidationCache.for_registry(registry=registry)
+        return validation_cache.is_staking(staker_address=self.checksum_address)
 
     def validate_worker(self, registry: BaseContractRegistry = None) -> None:
 
@@ -1152,6 +1531,11 @@ class Teacher:
             self.verified_node = False
             self.verified_stamp = False
             self.verified_worker = False
+            if registry and not self.federated_only:
+                # Ask the blockchain again, rather than relying on what was learned earlier this period.
+                with suppress(self.StampNotSigned):
+                    StakerValidationCache.for_registry(registry=registry).forget(staker_address=self.checksum_address,
+                                                                                 worker_address=self.worker_address)
 
         if self.verified_node:
             return True
@@ -1164,15 +1548,14 @@ class Teacher:
         self.validate_metadata(registry=registry)
 
         # The node's metadata is valid; let's be sure the interface is in order.
-        if not certificate_filepath:
-            if self.certificate_filepath is CERTIFICATE_NOT_SAVED:
-                raise TypeError("We haven't saved a certificate for this node yet.")
-            else:
-                certificate_filepath = self.certificate_filepath
-
+        # Unless told to trust a saved certificate file, its certificate is pinned from memory.
+        if certificate_filepath is CERTIFICATE_NOT_SAVED:
+            certificate_filepath = None
+        certificate = None if certificate_filepath else self.certificate
         response_data = network_middleware.node_information(host=self.rest_interface.host,
                                                             port=self.rest_interface.port,
-                                                            certificate_filepath=certificate_filepath)
+                                                            certificate_filepath=certificate_filepath,
+                                                            certificate=certificate)
 
         version, node_bytes = self.version_splitter(response_data, return_remainder=True)
         node_details = self.internal_splitter(node_bytes)
@@ -0,0 +1,111 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from threading import Lock
+
+from twisted.internet import reactor, task, threads
+from twisted.logger import Logger
+
+from nucypher.keystore.threading import ThreadedSession
+
+
+class PolicyReaper:
+    """
+    Periodically reclaims what Ursula holds for policies that are over: expired arrangements
+    and the work orders served under them are deleted from the datastore, expired KFrags are
+    evicted from memory, and expired TreasureMaps are evicted from wherever Ursula keeps them.
+
+    Each pass runs off the reactor thread; the counters add up what every pass has reclaimed.
+    """
+
+    CLOCK = reactor
+    DEFAULT_INTERVAL = 60 * 60  # One hour
+
+    log = Logger("policy-reaper")
+
+    def __init__(self, datastore, kfrags, treasure_maps, interval: float = None) -> None:
+        self.datastore = datastore
+        self.kfrags = kfrags
+        self.treasure_maps = treasure_maps
+        self.interval = interval or self.DEFAULT_INTERVAL
+
+        self.arrangements_deleted = 0
+        self.workorders_deleted = 0
+        self.kfrags_evicted = 0
+        self.treasure_maps_evicted = 0
+        self.passes = 0
+
+        self.__prune_lock = Lock()
+        self._reaping_task = task.LoopingCall(self._do_work)
+        self._reaping_task.clock = self.CLOCK
+
+    @property
+    def is_running(self) -> bool:
+        return self._reaping_task.running
+
+    @property
+    def stats(self) -> dict:
+        return dict(passes=self.passes,
+                    arrangements_deleted=self.arrangements_deleted,
+                    workorders_deleted=self.workorders_deleted,
+                    kfrags_evicted=self.kfrags_evicted,
+                    treasure_maps_evicted=self.treasure_maps_evicted,
+                    treasure_maps_evicted_lru=self.treasure_maps.lru_evictions)
+
+    def start(self, now: bool = False) -> None:
+        if self._reaping_task.running:
+            return
+        d = self._reaping_task.start(interval=self.interval, now=now)
+        d.addErrback(self.handle_reaping_errors)
+        self.log.info(f"STARTED REAPING EXPIRED POLICIES")
+
+    def stop(self) -> None:
+        if self._reaping_task.running:
+            self._reaping_task.stop()
+            self.log.info(f"STOPPED REAPING EXPIRED POLICIES")
+
+    def handle_reaping_errors(self, failure) -> None:
+        self.log.warn(f"Unhandled error while reaping expired policies: {failure.getErrorMessage()}")
+
+    def _do_work(self):
+        d = threads.deferToThread(self.prune)
+        d.addErrback(self.handle_reaping_errors)  # A failed pass doesn't stop the next one
+        return d
+
+    def prune(self) -> dict:
+        """
+        Reclaims everything that has expired by now, returning how much of each was reclaimed.
+        """
+        with self.__prune_lock:
+            with ThreadedSession(self.datastore.engine) as session:
+                arrangements, workorders = self.datastore.del_expired_policy_arrangements(session=session)
+            kfrags = self.kfrags.prune()
+            treasure_maps = self.treasure_maps.prune()
+
+            self.arrangements_deleted += arrangements
+            self.workorders_deleted += workorders
+            self.kfrags_evicted += kfrags
+            self.treasure_maps_evicted += treasure_maps
+            self.passes += 1
+
+        reclaimed = dict(arrangements=arrangements,
+                         workorders=workorders,
+                         kfrags=kfrags,
+                         treasure_maps=treasure_maps)
+        if any(reclaimed.values()):
+            self.log.info(f"Reaped expired policies: {reclaimed}")
+        return reclaimed
@@ -17,8 +17,11 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import binascii
 import os
-from typing import Tuple
+from collections import namedtuple
+from threading import Lock
+from typing import Callable, Optional, Tuple
 
+import maya
 from bytestring_splitter import VariableLengthBytestring
 from constant_sorrow import constants
 from constant_sorrow.constants import FLEET_STATES_MATCH, NO_KNOWN_NODES
@@ -31,7 +34,6 @@ from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
 
 import nucypher
-from nucypher.config.storages import ForgetfulNodeStorage
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import KeyPairBasedPower, PowerUpError
 from nucypher.crypto.signing import InvalidSignature
@@ -42,6 +44,7 @@ from nucypher.keystore.threading import ThreadedSession
 from nucypher.network import LEARNING_LOOP_VERSION
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.protocols import InterfaceInfo
+from nucypher.utilities.caches import LRUCache
 
 HERE = BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 TEMPLATES_DIR = os.path.join(HERE, "templates")
@@ -76,6 +79,198 @@ class ProxyRESTServer:
         return "{}:{}".format(self.rest_interface.host, self.rest_interface.port)
 
 
+class FleetStatePayloadCache:
+    """
+    Signed /node_metadata payloads for a node's current fleet state.
+
+    Serializing and signing the whole fleet is expensive, so each distinct payload (the full fleet,
+    the fleet-states-match reply, and deltas since each remembered state) is built once per fleet state
+    and then served as-is until the fleet state changes.
+    """
+
+    def __init__(self, this_node) -> None:
+        self.__this_node = this_node
+        self.__snapshot = None
+        self.__payloads = dict()
+        self.__lock = Lock()
+
+    def get(self, variant, build: Callable[[], bytes]) -> bytes:
+        snapshot = self.__this_node.known_nodes.snapshot()
+        with self.__lock:
+            if snapshot != self.__snapshot:
+                # Our fleet state has changed; everything we had cached is stale.
+                self.__snapshot = snapshot
+                self.__payloads = dict()
+            try:
+                return self.__payloads[variant]
+            except KeyError:
+                pass
+
+        payload = snapshot + build()
+        signed_payload = bytes(self.__this_node.stamp(payload)) + payload
+
+        with self.__lock:
+            if snapshot == self.__snapshot:
+                self.__payloads[variant] = signed_payload
+        return signed_payload
+
+
+class KFragCache(LRUCache):
+    """
+    Ready-to-use re-encryption material (KFrag, Alice's verifying key and address) by arrangement ID,
+    so that repeated work orders for a hot policy skip the datastore and the deserialization.
+
+    Holds at most max_entries, evicting the least recently used; entries are evicted when
+    the arrangement expires or is revoked.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1000
+
+    Entry = namedtuple("Entry", ("kfrag", "alice_verifying_key", "alice_address", "expiration"))
+
+    def __init__(self, max_entries: int = None) -> None:
+        super().__init__(max_entries=max_entries or self.DEFAULT_MAX_ENTRIES)
+
+    def get(self, arrangement_id: bytes, default=None) -> Optional['KFragCache.Entry']:
+        with self._lock:
+            entry = super().get(arrangement_id)
+            if entry is None:
+                return default
+            if entry.expiration <= maya.now():
+                self.pop(arrangement_id)
+                return default
+            return entry
+
+    def put(self, arrangement_id: bytes, entry: 'KFragCache.Entry') -> None:
+        if entry.expiration <= maya.now():
+            return
+        super().put(arrangement_id, entry)
+
+    def evict(self, arrangement_id: bytes) -> None:
+        self.pop(arrangement_id)
+
+    def prune(self) -> int:
+        """Evicts the entries whose arrangement has expired, returning how many were."""
+        now = maya.now()
+        with self._lock:
+            expired = [arrangement_id for arrangement_id, entry in self._entries.items() if entry.expiration <= now]
+            for arrangement_id in expired:
+                self.pop(arrangement_id)
+        return len(expired)
+
+
+class TreasureMapCache(LRUCache):
+    """
+    The TreasureMaps this Ursula keeps for Bobs, by map ID.
+
+    A TreasureMap doesn't reveal when its policy expires, so each one is kept for max_age
+    after it was last stored (Alice re-publishing a map refreshes it); at most max_entries
+    are kept, evicting the least recently used.
+    """
+
+    DEFAULT_MAX_ENTRIES = 10000
+    DEFAULT_MAX_AGE = 60 * 60 * 24 * 365  # seconds
+
+    Entry = namedtuple("Entry", ("treasure_map", "expiration"))
+
+    def __init__(self, max_entries: int = None, max_age: float = None) -> None:
+        super().__init__(max_entries=max_entries or self.DEFAULT_MAX_ENTRIES)
+        self.max_age = max_age or self.DEFAULT_MAX_AGE
+        self.lru_evictions = 0
+
+    def __getitem__(self, map_id: bytes):
+        treasure_map = self.get(map_id)
+        if treasure_map is None:
+            raise KeyError(map_id)
+        return treasure_map
+
+    def __setitem__(self, map_id: bytes, treasure_map) -> None:
+        self.put(map_id, treasure_map)
+
+    def __contains__(self, map_id: bytes) -> bool:
+        return self.get(map_id) is not None
+
+    def get(self, map_id: bytes, default=None):
+        with self._lock:
+            entry = super().get(map_id)
+            if entry is None:
+                return default
+            if entry.expiration <= maya.now():
+                self.pop(map_id)
+                return default
+            return entry.treasure_map
+
+    def put(self, map_id: bytes, treasure_map, expiration: maya.MayaDT = None) -> None:
+        expiration = expiration or maya.now().add(seconds=self.max_age)
+        super().put(map_id, self.Entry(treasure_map=treasure_map, expiration=expiration))
+
+    def prune(self) -> int:
+        """Evicts the TreasureMaps which have expired, returning how many were."""
+        now = maya.now()
+        with self._lock:
+            expired = [map_id for map_id, entry in self._entries.items() if entry.expiration <= now]
+            for map_id in expired:
+                self.pop(map_id)
+        return len(expired)
+
+    def _evicted(self, map_id: bytes, entry: 'TreasureMapCache.Entry') -> None:
+        self.lru_evictions += 1
+
+
+class TreasureMapStore(TreasureMapCache):
+    """
+    The TreasureMaps this Ursula keeps for Bobs, written through to her datastore so that
+    they survive restarts, with the most recently used ones held in memory in front of it.
+
+    Maps evicted from memory to make room are still served, from disk.  Anyone can store a
+    validly signed map, so at most max_rows are kept on disk; pruning deletes the ones
+    closest to expiring (the least recently stored) beyond that.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1000
+    DEFAULT_MAX_ROWS = 100000
+
+    def __init__(self, datastore, max_entries: int = None, max_age: float = None, max_rows: int = None) -> None:
+        super().__init__(max_entries=max_entries, max_age=max_age)
+        self.datastore = datastore
+        self.max_rows = max_rows or self.DEFAULT_MAX_ROWS
+        self.disk_reads = 0
+
+    def get(self, map_id: bytes, default=None):
+        treasure_map = super().get(map_id)
+        if treasure_map is not None:
+            return treasure_map
+
+        try:
+            with ThreadedSession(self.datastore.engine) as session:
+                stored_treasure_map = self.datastore.get_treasure_map(map_id, session=session)
+                treasure_map_bytes = stored_treasure_map.treasure_map
+                expiration = maya.MayaDT.from_datetime(stored_treasure_map.expiration)
+        except NotFound:
+            return default
+        self.disk_reads += 1
+
+        from nucypher.policy.collections import TreasureMap  # Avoid circular import
+        treasure_map = TreasureMap.from_bytes(bytes_representation=treasure_map_bytes, verify=False)  # Verified on receipt
+        super().put(map_id, treasure_map, expiration=expiration)
+        return treasure_map
+
+    def put(self, map_id: bytes, treasure_map, expiration: maya.MayaDT = None) -> None:
+        expiration = expiration or maya.now().add(seconds=self.max_age)
+        with ThreadedSession(self.datastore.engine) as session:
+            self.datastore.save_treasure_map(map_id=map_id,
+                                             treasure_map=bytes(treasure_map),
+                                             expiration=expiration.datetime(naive=True),
+                                             session=session)
+        super().put(map_id, treasure_map, expiration=expiration)
+
+    def prune(self) -> int:
+        """Deletes the TreasureMaps which have expired, and the oldest beyond max_rows, returning how many were."""
+        super().prune()
+        with ThreadedSession(self.datastore.engine) as session:
+            return self.datastore.del_expired_treasure_maps(max_rows=self.max_rows, session=session)
+
+
 def make_rest_app(
         db_filepath: str,
         this_node,
@@ -83,25 +278,15 @@ def make_rest_app(
         log=Logger("http-application-layer")
         ) -> Tuple:
 
-    forgetful_node_storage = ForgetfulNodeStorage(federated_only=this_node.federated_only)
+    fleet_state_payloads = FleetStatePayloadCache(this_node=this_node)
+    kfrags = this_node.kfrag_cache
 
     from nucypher.keystore import keystore
-    from nucypher.keystore.db import Base
-    from sqlalchemy.engine import create_engine
+    from nucypher.keystore.db import make_engine
 
     log.info("Starting datastore {}".format(db_filepath))
-
-    # See: https://docs.sqlalchemy.org/en/rel_0_9/dialects/sqlite.html#connect-strings
-    if db_filepath:
-        db_uri = f'sqlite:///{db_filepath}'
-    else:
-        db_uri = 'sqlite://'  # TODO: Is this a sane default? See #667
-
-    engine = create_engine(db_uri)
-
-    Base.metadata.create_all(engine)
-    datastore = keystore.KeyStore(engine)
-    db_engine = engine
+    db_engine = make_engine(db_filepath=db_filepath)
+    datastore = keystore.KeyStore(db_engine)
 
     from nucypher.characters.lawful import Alice, Ursula
     _alice_class = Alice
@@ -127,15 +312,23 @@ def make_rest_app(
         if this_node.known_nodes.checksum is NO_KNOWN_NODES:
             return Response(b"", headers=headers, status=204)
 
-        payload = this_node.known_nodes.snapshot()
+        # If the learner tells us the last state of our fleet it saw, and we still remember it,
+        # we only need to send the nodes that have changed since.  Otherwise, send everything.
+        learners_view_of_our_fleet_state = request.args.get('since')
+        if learners_view_of_our_fleet_state not in this_node.known_nodes.states:
+            learners_view_of_our_fleet_state = None
 
-        ursulas_as_vbytes = (VariableLengthBytestring(n) for n in this_node.known_nodes)
-        ursulas_as_bytes = bytes().join(bytes(u) for u in ursulas_as_vbytes)
-        ursulas_as_bytes += VariableLengthBytestring(bytes(this_node))
+        def serialize_nodes():
+            nodes = None
+            if learners_view_of_our_fleet_state:
+                nodes = this_node.known_nodes.nodes_updated_since(learners_view_of_our_fleet_state)
+            if nodes is None:
+                nodes = list(this_node.known_nodes) + [this_node]
+            ursulas_as_vbytes = (VariableLengthBytestring(this_node.known_nodes.serialized(n)) for n in nodes)
+            return bytes().join(bytes(u) for u in ursulas_as_vbytes)
 
-        payload += ursulas_as_bytes
-        signature = this_node.stamp(payload)
-        return Response(bytes(signature) + payload, headers=headers)
+        signed_payload = fleet_state_payloads.get(variant=learners_view_of_our_fleet_state, build=serialize_nodes)
+        return Response(signed_payload, headers=headers)
 
     @rest_app.route('/node_metadata', methods=["POST"])
     def node_metadata_exchange():
@@ -145,9 +338,9 @@ def make_rest_app(
         if learner_fleet_state == this_node.known_nodes.checksum:
             log.debug("Learner already knew fleet state {}; doing nothing.".format(learner_fleet_state))
             headers = {'Content-Type': 'application/octet-stream'}
-            payload = this_node.known_nodes.snapshot() + bytes(FLEET_STATES_MATCH)
-            signature = this_node.stamp(payload)
-            return Response(bytes(signature) + payload, headers=headers)
+            signed_payload = fleet_state_payloads.get(variant=bytes(FLEET_STATES_MATCH),
+                                                      build=lambda: bytes(FLEET_STATES_MATCH))
+            return Response(signed_payload, headers=headers)
 
         nodes = _node_class.batch_from_bytes(request.data,
                                              registry=this_node.registry,
@@ -167,12 +360,7 @@ def make_rest_app(
             def learn_about_announced_nodes():
 
                 try:
-                    certificate_filepath = forgetful_node_storage.store_node_certificate(
-                        certificate=node.certificate)
-
-                    node.verify_node(this_node.network_middleware,
-                                     registry=this_node.registry,
-                                     certificate_filepath=certificate_filepath)
+                    node.verify_node(this_node.network_middleware, registry=this_node.registry)
 
                 # Suspicion
                 except node.SuspiciousActivity as e:
@@ -197,10 +385,6 @@ def make_rest_app(
                     this_node.remember_node(node)
                     # TODO: Record new fleet state
 
-                # Cleanup
-                finally:
-                    forgetful_node_storage.forget()
-
         # TODO: What's the right status code here?  202?  Different if we already knew about the node?
         return all_known_nodes()
 
@@ -254,6 +438,7 @@ def make_rest_app(
                 id_as_hex,
                 kfrag,
                 session=session)
+        kfrags.evict(binascii.unhexlify(id_as_hex))
 
         # TODO: Sign the arrangement here.  #495
         return ""  # TODO: Return A 200, with whatever policy metadata.
@@ -282,6 +467,7 @@ def make_rest_app(
                 elif revocation.verify_signature(alice_pubkey):
                     datastore.del_policy_arrangement(
                         id_as_hex.encode(), session=session)
+                    kfrags.evict(revocation.arrangement_id)
         except (NotFound, InvalidSignature) as e:
             log.debug("Exception attempting to revoke: {}".format(e))
             return Response(response='KFrag not found or revocation signature is invalid.', status=404)
@@ -297,20 +483,29 @@ def make_rest_app(
             arrangement_id = binascii.unhexlify(id_as_hex)
         except (binascii.Error, TypeError):
             return Response(response=b'Invalid arrangement ID', status=405)
-        try:
-            with ThreadedSession(db_engine) as session:
-                arrangement = datastore.get_policy_arrangement(arrangement_id=id_as_hex.encode(), session=session)
-        except NotFound:
-            return Response(response=arrangement_id, status=404)
-
-        # Get KFrag
-        kfrag = KFrag.from_bytes(arrangement.kfrag)
+        cached = kfrags.get(arrangement_id)
+        if cached:
+            kfrag, alice_verifying_key, alice_address, _expiration = cached
+        else:
+            try:
+                with ThreadedSession(db_engine) as session:
+                    arrangement = datastore.get_policy_arrangement(arrangement_id=id_as_hex.encode(), session=session)
+            except NotFound:
+                return Response(response=arrangement_id, status=404)
+
+            # Get KFrag
+            kfrag = KFrag.from_bytes(arrangement.kfrag)
+
+            alice_verifying_key_bytes = arrangement.alice_verifying_key.key_data
+            alice_verifying_key = UmbralPublicKey.from_bytes(alice_verifying_key_bytes)
+            alice_address = canonical_address_from_umbral_key(alice_verifying_key)
+            kfrags.put(arrangement_id, KFragCache.Entry(kfrag=kfrag,
+                                                        alice_verifying_key=alice_verifying_key,
+                                                        alice_address=alice_address,
+                                                        expiration=maya.MayaDT.from_datetime(arrangement.expiration)))
 
         # Get Work Order
         from nucypher.policy.collections import WorkOrder  # Avoid circular import
-        alice_verifying_key_bytes = arrangement.alice_verifying_key.key_data
-        alice_verifying_key = UmbralPublicKey.from_bytes(alice_verifying_key_bytes)
-        alice_address = canonical_address_from_umbral_key(alice_verifying_key)
         work_order_payload = request.data
         work_order = WorkOrder.from_rest_payload(arrangement_id=arrangement_id,
                                                  rest_payload=work_order_payload,
@@ -318,16 +513,19 @@ def make_rest_app(
                                                  alice_address=alice_address)
         log.info(f"Work Order from {work_order.bob}, signed {work_order.receipt_signature}")
 
+        # A work order we've fully served before (e.g. a retry) is answered again, but not recorded again.
+        repeated_work_order = this_node.reencryption_results.covers(work_order)
+
         # Re-encrypt
         response = this_node._reencrypt(kfrag=kfrag,
                                         work_order=work_order,
                                         alice_verifying_key=alice_verifying_key)
 
-        # Now, Ursula saves this workorder to her database...
-        with ThreadedSession(db_engine):
-            this_node.datastore.save_workorder(bob_verifying_key=bytes(work_order.bob.stamp),
-                                               bob_signature=bytes(work_order.receipt_signature),
-                                               arrangement_id=work_order.arrangement_id)
+        # Now, Ursula records this workorder; it's written to her database shortly, without holding up Bob.
+        if not repeated_work_order:
+            this_node.work_order_journal.record(bob_verifying_key=bytes(work_order.bob.stamp),
+                                                bob_signature=bytes(work_order.receipt_signature),
+                                                arrangement_id=work_order.arrangement_id)
 
         headers = {'Content-Type': 'application/octet-stream'}
         return Response(headers=headers, response=response)
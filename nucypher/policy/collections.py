@@ -56,6 +56,8 @@ class TreasureMap:
         Called when no known nodes have it.
         """
 
+    RESPONSIBLE_NODES = 5  # Number of nodes on which each TreasureMap is stored
+
     node_id_splitter = BytestringSplitter((to_checksum_address, int(PUBLIC_ADDRESS_LENGTH)), ID_LENGTH)
 
     from nucypher.crypto.signing import InvalidSignature  # Raised when the public signature (typically intended for Ursula) is not valid.
@@ -151,6 +153,19 @@ class TreasureMap:
             raise TypeError("This TreasureMap is encrypted.  You can't add another node without decrypting it.")
         self.destinations[arrangement.ursula.checksum_address] = arrangement.id
 
+    @staticmethod
+    def rank_nodes(map_id: str, nodes) -> List:
+        """
+        Orders nodes by their affinity to the TreasureMap with the given public ID (rendezvous hashing);
+        the first RESPONSIBLE_NODES of them are the ones which store it.  Nodes known to both Alice and Bob
+        are ranked in the same order by each, so Bob knows where to look without asking around.
+        """
+        map_id_bytes = bytes.fromhex(map_id)
+        ranked_nodes = sorted(nodes,
+                              key=lambda node: keccak_digest(map_id_bytes, node.canonical_public_address),
+                              reverse=True)
+        return ranked_nodes
+
     def public_id(self):
         """
         We need an ID that Bob can glean from knowledge he already has *and* which Ursula can verify came from Alice.
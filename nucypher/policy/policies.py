@@ -8,6 +8,7 @@ from typing import Generator, Set, List
 import maya
 from bytestring_splitter import BytestringSplitter, VariableLengthBytestring
 from constant_sorrow.constants import NOT_SIGNED, UNKNOWN_KFRAG, FEDERATED_POLICY, UNKNOWN_ARRANGEMENTS
+from twisted.logger import Logger
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
 
@@ -21,7 +22,8 @@ from nucypher.crypto.kits import RevocationKit
 from nucypher.crypto.powers import DecryptingPower, SigningPower
 from nucypher.crypto.utils import construct_policy_id
 from nucypher.network.exceptions import NodeSeemsToBeDown
-from nucypher.network.middleware import RestMiddleware
+from nucypher.network.middleware import RestMiddleware, UnexpectedResponse
+from nucypher.utilities.concurrency import WorkerPool
 
 
 class Arrangement:
@@ -160,9 +162,19 @@ class Policy(ABC):
     POLICY_ID_LENGTH = 16
     _arrangement_class = NotImplemented
 
+    MAX_CONCURRENT_NEGOTIATIONS = 20
+    NEGOTIATION_TIMEOUT = 10  # seconds, per Ursula
+    MAX_CONCURRENT_ENACTMENTS = 20
+    ENACTMENT_TIMEOUT = 10  # seconds, per Ursula
+
+    log = Logger("policy")
+
     class Rejected(RuntimeError):
         """Too many Ursulas rejected"""
 
+    class EnactmentFailed(RuntimeError):
+        """Too few Ursulas received their KFrags for the Policy to be usable"""
+
     def __init__(self,
                  alice,
                  label,
@@ -196,6 +208,7 @@ class Policy(ABC):
 
         self._enacted_arrangements = OrderedDict()
         self._published_arrangements = OrderedDict()
+        self.failed_enactments = OrderedDict()  # Ursula -> reason her KFrag wasn't delivered
 
         self.alice_signature = alice_signature  # TODO: This is unused / To Be Implemented?
 
@@ -217,6 +230,12 @@ class Policy(ABC):
     def accepted_ursulas(self) -> Set[Ursula]:
         return {arrangement.ursula for arrangement in self._accepted_arrangements}
 
+    @property
+    def enacted_arrangements(self) -> List[Arrangement]:
+        """The arrangements whose Ursulas actually received their KFrags."""
+        return [arrangement for arrangement in self._enacted_arrangements.values()
+                if arrangement.ursula not in self.failed_enactments]
+
     def hrac(self) -> bytes:
         """
         # TODO: #180 - This function is hanging on for dear life.  After 180 is closed, it can be completely deprecated.
@@ -242,28 +261,35 @@ class Policy(ABC):
             # TODO: Optionally, block.
             raise RuntimeError("Alice hasn't learned of any nodes.  Thus, she can't push the TreasureMap.")
 
-        responses = dict()
-        for node in self.alice.known_nodes:
-            # TODO: # 342 - It's way overkill to push this to every node we know about.  Come up with a system.
-
-            try:
-                treasure_map_id = self.treasure_map.public_id()
-
-                # TODO: Certificate filepath needs to be looked up and passed here
-                response = network_middleware.put_treasure_map_on_node(node=node,
-                                                                       map_id=treasure_map_id,
-                                                                       map_payload=bytes(self.treasure_map))
-            except NodeSeemsToBeDown:
-                # TODO: Introduce good failure mode here if too few nodes receive the map.
-                continue
+        treasure_map_id = self.treasure_map.public_id()
+        ranked_nodes = self.treasure_map.rank_nodes(map_id=treasure_map_id, nodes=self.alice.known_nodes)
 
-            if response.status_code == 202:
-                # TODO: #341 - Handle response wherein node already had a copy of this TreasureMap.
-                responses[node] = response
+        def put_treasure_map(node):
+            # TODO: Certificate filepath needs to be looked up and passed here
+            return network_middleware.put_treasure_map_on_node(node=node,
+                                                               map_id=treasure_map_id,
+                                                               map_payload=bytes(self.treasure_map))
 
-            else:
-                # TODO: Do something useful here.
-                raise RuntimeError
+        # Store the map on the nodes responsible for it; if some of them can't take it,
+        # it goes to the next ones in line, which is also where Bob will look next.
+        responses = dict()
+        while ranked_nodes and len(responses) < self.treasure_map.RESPONSIBLE_NODES:
+            missing = self.treasure_map.RESPONSIBLE_NODES - len(responses)
+            nodes, ranked_nodes = ranked_nodes[:missing], ranked_nodes[missing:]
+            worker_pool = WorkerPool(worker=put_treasure_map, max_workers=len(nodes), value_timeout=self.ENACTMENT_TIMEOUT)
+            for node, response, error in worker_pool.as_completed(nodes):
+                if error:
+                    if isinstance(error, NodeSeemsToBeDown + (UnexpectedResponse, WorkerPool.TimedOut)):
+                        # TODO: Introduce good failure mode here if too few nodes receive the map.
+                        continue
+                    raise error
+
+                if response.status_code == 202:
+                    # TODO: #341 - Handle response wherein node already had a copy of this TreasureMap.
+                    responses[node] = response
+                else:
+                    # TODO: Do something useful here.
+                    raise RuntimeError
 
         return responses
 
@@ -283,47 +309,74 @@ class Policy(ABC):
             raise self.MoreKFragsThanArrangements("Not enough candidate arrangements. "
                                                   "Call make_arrangements to make more.")
 
+        already_enacted = set(self._enacted_arrangements.values())
+        unassigned_arrangements = iter([arrangement for arrangement in self._accepted_arrangements
+                                        if arrangement not in already_enacted])
         for kfrag in self.kfrags:
-            for arrangement in self._accepted_arrangements:
-                if not arrangement in self._enacted_arrangements.values():
-                    arrangement.kfrag = kfrag
-                    self._enacted_arrangements[kfrag] = arrangement
-                    yield arrangement
-                    break  # This KFrag is now assigned; break the inner loop and go back to assign other kfrags.
-            else:
+            try:
+                arrangement = next(unassigned_arrangements)
+            except StopIteration:
                 # We didn't assign that KFrag.  Trouble.
                 # This is ideally an impossible situation, because we don't typically
                 # enter this method unless we've already had n or more Arrangements accepted.
                 raise self.MoreKFragsThanArrangements("Not enough accepted arrangements to assign all KFrags.")
+            arrangement.kfrag = kfrag
+            self._enacted_arrangements[kfrag] = arrangement
+            yield arrangement
         return
 
     def enact(self, network_middleware, publish=True) -> dict:
         """
         Assign kfrags to ursulas_on_network, and distribute them via REST,
-        populating enacted_arrangements
+        populating enacted_arrangements.
+
+        KFrags are encrypted and sent to their Ursulas concurrently; Ursulas which fail
+        to receive theirs are left out of the TreasureMap and recorded in failed_enactments.
         """
-        for arrangement in self.__assign_kfrags():
+        def enact_arrangement(arrangement):
             policy_message_kit = arrangement.encrypt_payload_for_ursula()
+            return network_middleware.enact_policy(arrangement.ursula,
+                                                   arrangement.id,
+                                                   policy_message_kit.to_bytes())
+
+        worker_pool = WorkerPool(worker=enact_arrangement,
+                                 max_workers=self.MAX_CONCURRENT_ENACTMENTS,
+                                 value_timeout=self.ENACTMENT_TIMEOUT)
+
+        for arrangement, _response, error in worker_pool.as_completed(self.__assign_kfrags()):
+            if error:
+                if isinstance(error, NodeSeemsToBeDown + (UnexpectedResponse, WorkerPool.TimedOut)):
+                    self.log.warn(f"Failed to enact arrangement {arrangement.id.hex()} with {arrangement.ursula}: {error}")
+                    self.failed_enactments[arrangement.ursula] = error
+                    continue
+                raise error
+            self.treasure_map.add_arrangement(arrangement)
 
-            response = network_middleware.enact_policy(arrangement.ursula,
-                                                       arrangement.id,
-                                                       policy_message_kit.to_bytes())
+        # ...After *all* the policies are enacted
+        enacted = len(self.enacted_arrangements)
+        if enacted < self.treasure_map.m:
+            raise self.EnactmentFailed(f"Only {enacted} of {self.n} Ursulas received their KFrags; "
+                                       f"at least {self.treasure_map.m} are needed.")
 
-            if not response:
-                pass  # TODO: Parse response for confirmation.
+        # Create Alice's revocation kit
+        self.revocation_kit = RevocationKit(self, self.alice.stamp)
+        self.alice.add_active_policy(self)
 
-            # Assuming response is what we hope for.
-            self.treasure_map.add_arrangement(arrangement)
+        if publish is True:
+            return self.publish(network_middleware=network_middleware)
+
+    def consider_arrangement(self, network_middleware, ursula, arrangement) -> bool:
+        arrangement_is_accepted = self._negotiate_arrangement(network_middleware=network_middleware,
+                                                              ursula=ursula,
+                                                              arrangement=arrangement)
 
-        else:  # ...After *all* the policies are enacted
-            # Create Alice's revocation kit
-            self.revocation_kit = RevocationKit(self, self.alice.stamp)
-            self.alice.add_active_policy(self)
+        bucket = self._accepted_arrangements if arrangement_is_accepted else self._rejected_arrangements
+        bucket.add(arrangement)
 
-            if publish is True:
-                return self.publish(network_middleware=network_middleware)
+        return arrangement_is_accepted
 
-    def consider_arrangement(self, network_middleware, ursula, arrangement) -> bool:
+    def _negotiate_arrangement(self, network_middleware, ursula, arrangement) -> bool:
+        """Offers an arrangement to an Ursula, and returns whether she accepted it."""
         try:
             ursula.verify_node(network_middleware, registry=self.alice.registry)  # From the perspective of alice.
         except ursula.InvalidNode:
@@ -338,10 +391,6 @@ class Policy(ABC):
 
         # TODO: check out the response: need to assess the result and see if we're actually good to go.
         arrangement_is_accepted = negotiation_response.status_code == 200
-
-        bucket = self._accepted_arrangements if arrangement_is_accepted else self._rejected_arrangements
-        bucket.add(arrangement)
-
         return arrangement_is_accepted
 
     def make_arrangements(self,
@@ -359,7 +408,6 @@ class Policy(ABC):
                  know which nodes to use.  Either pass them here or when you make ' \
                  the Policy.".format(self.n))
 
-        # TODO: One of these layers needs to add concurrency.
         self._consider_arrangements(network_middleware=network_middleware,
                                     candidate_ursulas=sampled_ursulas,
                                     *args, **kwargs)
@@ -395,33 +443,44 @@ class Policy(ABC):
                                *args,
                                **kwargs) -> None:
 
-        for index, selected_ursula in enumerate(candidate_ursulas):
-            arrangement = self.make_arrangement(ursula=selected_ursula, *args, **kwargs)
-            try:
-                is_accepted = self.consider_arrangement(ursula=selected_ursula,
-                                                        arrangement=arrangement,
-                                                        network_middleware=network_middleware)
-
-            except NodeSeemsToBeDown:  # TODO: #355 Also catch InvalidNode here?
-                # This arrangement won't be added to the accepted bucket.
-                # If too many nodes are down, it will fail in make_arrangements.
-                continue
-
+        """
+        Negotiates with all candidates concurrently, until n of them have accepted;
+        candidates not heard from by then are kept as spares.
+        """
+        arrangements = [self.make_arrangement(ursula=ursula, *args, **kwargs) for ursula in candidate_ursulas]
+        if not arrangements:
+            return
+
+        def negotiate(arrangement):
+            return self._negotiate_arrangement(network_middleware=network_middleware,
+                                               ursula=arrangement.ursula,
+                                               arrangement=arrangement)
+
+        worker_pool = WorkerPool(worker=negotiate,
+                                 max_workers=self.MAX_CONCURRENT_NEGOTIATIONS,
+                                 value_timeout=self.NEGOTIATION_TIMEOUT)
+
+        outstanding_candidates = set(candidate_ursulas)
+        outcomes = worker_pool.as_completed(arrangements)
+        for arrangement, is_accepted, error in outcomes:
+            outstanding_candidates.discard(arrangement.ursula)
+            if error:
+                if isinstance(error, NodeSeemsToBeDown + (WorkerPool.TimedOut,)):  # TODO: #355 Also catch InvalidNode here?
+                    # This arrangement won't be added to the accepted bucket.
+                    # If too many nodes are down, it will fail in make_arrangements.
+                    continue
+                raise error
+
+            # Bucket the arrangements
+            if is_accepted:
+                self._accepted_arrangements.add(arrangement)
+                accepted = len(self._accepted_arrangements)
+                if accepted == self.n and not consider_everyone:
+                    outcomes.close()  # Stop waiting on the rest.
+                    self._spare_candidates.update(outstanding_candidates)
+                    break
             else:
-
-                # Bucket the arrangements
-                if is_accepted:
-                    self._accepted_arrangements.add(arrangement)
-                    accepted = len(self._accepted_arrangements)
-                    if accepted == self.n and not consider_everyone:
-                        try:
-                            spares = set(list(candidate_ursulas)[index+1::])
-                            self._spare_candidates.update(spares)
-                        except IndexError:
-                            self._spare_candidates = set()
-                        break
-                else:
-                    self._rejected_arrangements.add(arrangement)
+                self._rejected_arrangements.add(arrangement)
 
 
 class FederatedPolicy(Policy):
@@ -604,13 +663,21 @@ class BlockchainPolicy(Policy):
 
     def publish(self, **kwargs) -> dict:
 
-        prearranged_ursulas = list(a.ursula.checksum_address for a in self._accepted_arrangements)
+        # Only Ursulas who received their KFrags are paid for this policy.
+        prearranged_ursulas = list(a.ursula.checksum_address for a in self.enacted_arrangements)
+        if len(prearranged_ursulas) < self.treasure_map.m:
+            raise self.EnactmentFailed(f"Only {len(prearranged_ursulas)} of {self.n} Ursulas received their KFrags; "
+                                       f"at least {self.treasure_map.m} are needed.")
+
+        # PolicyManager pays each node value / len(nodes), so the value covers just the nodes paid.
+        # The first period reward is per node, and so is unaffected.
+        value = (self.value // self.n) * len(prearranged_ursulas)
 
         # Transact
         receipt = self.author.policy_agent.create_policy(
                        policy_id=self.hrac()[:16],          # bytes16 _policyID
                        author_address=self.author.checksum_address,
-                       value=self.value,
+                       value=value,
                        periods=self.duration_periods,           # uint16 _numberOfPeriods
                        first_period_reward=self.first_period_reward,  # uint256 _firstPartialReward
                        node_addresses=prearranged_ursulas   # address[] memory _nodes
@@ -0,0 +1,130 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+from collections import deque, namedtuple
+from concurrent import futures
+from typing import Callable, Iterable, Iterator
+
+
+class WorkerPool:
+    """
+    Runs a blocking worker (typically network I/O) over a batch of values on a bounded
+    pool of threads, yielding an Outcome for each value as soon as it is available.
+
+    If the pool's timeout elapses before every value has been processed, or a single value
+    takes longer than the value_timeout, those values are reported with a TimedOut exception
+    and are abandoned.  Threads which are still blocked finish in the background, bounded by
+    their own I/O timeouts, and keep counting towards max_workers until they do, so that
+    no more than max_workers values are ever in flight.
+
+    Consumers may stop iterating early (e.g. once they have enough successes),
+    in which case work which hasn't started yet is cancelled.
+    """
+
+    Outcome = namedtuple("Outcome", ("value", "result", "exception"))
+
+    class TimedOut(TimeoutError):
+        """Raised (or reported) when a value isn't processed before the pool's timeout."""
+
+    def __init__(self,
+                 worker: Callable,
+                 max_workers: int,
+                 timeout: float = None,
+                 value_timeout: float = None,
+                 ) -> None:
+        """
+        :param timeout: Seconds allowed for the whole batch, measured from the start of iteration.
+        :param value_timeout: Seconds allowed for each value, measured from when a worker picks it up.
+        """
+
+        if max_workers < 1:
+            raise ValueError(f"WorkerPool needs at least one worker, got {max_workers}.")
+        self.worker = worker
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.value_timeout = value_timeout
+
+    @classmethod
+    def in_place(cls, worker: Callable, values: Iterable) -> Iterator['WorkerPool.Outcome']:
+        """
+        Processes values one by one on the calling thread, yielding Outcomes just like as_completed.
+        """
+        for value in values:
+            try:
+                result = worker(value)
+            except Exception as e:
+                yield cls.Outcome(value=value, result=None, exception=e)
+            else:
+                yield cls.Outcome(value=value, result=result, exception=None)
+
+    def as_completed(self, values: Iterable) -> Iterator['WorkerPool.Outcome']:
+        queued = deque(values)
+        batch_deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+
+        # Values are only submitted when a thread is free to pick them up, so that a value's deadline
+        # starts when its work does; abandoned workers hold on to their thread until they finish.
+        executor = futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="worker-pool")
+        in_progress = dict()  # future -> (value, deadline)
+        abandoned = set()
+        try:
+            while queued or in_progress:
+                abandoned = {future for future in abandoned if not future.done()}
+                while queued and len(in_progress) + len(abandoned) < self.max_workers:
+                    value = queued.popleft()
+                    deadline = time.monotonic() + self.value_timeout if self.value_timeout is not None else None
+                    in_progress[executor.submit(self.worker, value)] = (value, deadline)
+
+                # Wake up for the earliest deadline of anything in progress, or of the batch,
+                # or as soon as an abandoned worker frees up its thread.
+                deadlines = [deadline for _value, deadline in in_progress.values() if deadline is not None]
+                if batch_deadline is not None:
+                    deadlines.append(batch_deadline)
+                wait_for = max(0, min(deadlines) - time.monotonic()) if deadlines else None
+
+                done, _not_done = futures.wait(set(in_progress) | abandoned,
+                                               timeout=wait_for,
+                                               return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    if future not in in_progress:
+                        continue
+                    value, _deadline = in_progress.pop(future)
+                    exception = future.exception()
+                    result = None if exception else future.result()
+                    yield self.Outcome(value=value, result=result, exception=exception)
+
+                now = time.monotonic()
+                if batch_deadline is not None and now >= batch_deadline:
+                    timed_out = [value for value, _deadline in in_progress.values()] + list(queued)
+                    abandoned.update(in_progress)
+                    in_progress.clear()
+                    queued.clear()
+                    for value in timed_out:
+                        error = self.TimedOut(f"{value} not processed after {self.timeout} seconds.")
+                        yield self.Outcome(value=value, result=None, exception=error)
+                    break
+
+                for future, (value, deadline) in list(in_progress.items()):
+                    if deadline is not None and now >= deadline:
+                        del in_progress[future]
+                        abandoned.add(future)
+                        error = self.TimedOut(f"{value} not processed after {self.value_timeout} seconds.")
+                        yield self.Outcome(value=value, result=None, exception=error)
+
+        finally:
+            # Values which haven't started are never started; those in progress are abandoned.
+            executor.shutdown(wait=False)
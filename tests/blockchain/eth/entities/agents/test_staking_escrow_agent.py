@@ -144,6 +144,61 @@ def test_get_swarm(agency, blockchain_ursulas):
     assert is_address(staker_addr)
 
 
+@pytest.mark.slow()
+@pytest.mark.usefixtures("blockchain_ursulas")
+def test_batched_staker_reads(agency):
+    _token_agent, staking_agent, _policy_agent = agency
+
+    stakers = staking_agent.get_stakers()
+    assert stakers == list(staking_agent.swarm())
+
+    # Batched calls give the same answers as individual ones, in order.
+    functions = [staking_agent.contract.functions.getLastActivePeriod(staker) for staker in stakers]
+    assert staking_agent.batch_call(functions) == [function.call() for function in functions]
+
+    active, pending, missing = staking_agent.partition_stakers_by_activity()
+    assert sorted(active + pending + missing) == sorted(stakers)
+
+
+@pytest.mark.slow()
+@pytest.mark.usefixtures("blockchain_ursulas")
+def test_batched_staker_reads_over_json_rpc_batches(agency, mocker):
+    _token_agent, staking_agent, policy_agent = agency
+    w3 = staking_agent.blockchain.w3
+    stakers = staking_agent.get_stakers()
+    functions = [staking_agent.contract.functions.getLastActivePeriod(staker) for staker in stakers]
+    expected_results = [function.call() for function in functions]
+
+    # Pretend to be connected over HTTP, answering each batch the way a node would - in any order.
+    batches = []
+
+    def answer_batch(_provider, payload):
+        batches.append(payload)
+        return [dict(jsonrpc='2.0', id=request['id'], result=w3.manager.request_blocking('eth_call', request['params']).hex())
+                for request in reversed(payload)]
+
+    mocker.patch('nucypher.blockchain.eth.agents._supports_batch_requests', return_value=True)
+    mocker.patch('nucypher.blockchain.eth.agents._post_batch_request', side_effect=answer_batch)
+    mocker.patch.object(staking_agent, 'MAX_BATCH_SIZE', 2)
+
+    assert staking_agent.batch_call(functions) == expected_results
+    assert len(batches) == -(-len(functions) // 2)
+    assert len({request['params'][1] for batch in batches for request in batch}) == 1  # All against the same block
+
+    # The named accessors read through the same batches.
+    details = staking_agent.get_stakers_details(stakers)
+    assert [d.last_active_period for d in details] == [staking_agent.get_last_active_period(s) for s in stakers]
+    assert [d.worker for d in details] == [staking_agent.get_worker_from_staker(s) for s in stakers]
+    assert [d.is_restaking for d in details] == [staking_agent.is_restaking(s) for s in stakers]
+    assert policy_agent.get_reward_amounts(stakers) == [policy_agent.get_reward_amount(s) for s in stakers]
+
+    # A call which fails fails the whole batch call.
+    mocker.patch('nucypher.blockchain.eth.agents._post_batch_request',
+                 return_value=[dict(jsonrpc='2.0', id=0, error=dict(code=-32000, message='execution reverted'))])
+    with pytest.raises(StakingEscrowAgent.BatchCallFailed):
+        staking_agent.batch_call(functions[:2])
+
+
 @pytest.mark.slow()
 @pytest.mark.usefixtures("blockchain_ursulas")
 def test_sample_stakers(agency):
@@ -169,6 +224,25 @@ def test_sample_stakers(agency):
     staking_agent.blockchain.is_light = light
 
 
+@pytest.mark.slow()
+@pytest.mark.usefixtures("blockchain_ursulas")
+def test_sampling_distribution_is_fetched_once_per_period(agency, mocker):
+    _token_agent, staking_agent, _policy_agent = agency
+
+    stakers, cumulative_tokens = staking_agent.get_sampling_distribution(duration=5)
+    all_locked_tokens, active_stakers = staking_agent.get_all_active_stakers(periods=5, pagination_size=1)
+    assert cumulative_tokens[-1] == all_locked_tokens
+    assert cumulative_tokens == sorted(cumulative_tokens)
+    assert set(stakers) == {to_checksum_address(staker) for staker, tokens in active_stakers if tokens}
+
+    # Within the same period, sampling doesn't go back to the blockchain for active stakers,
+    # nor for the current period itself.
+    mocker.patch.object(staking_agent, 'get_all_active_stakers', side_effect=AssertionError("Refetched stakers"))
+    mocker.patch.object(staking_agent, 'get_current_period', side_effect=AssertionError("Refetched period"))
+    sampled = staking_agent.sample(quantity=3, duration=5)
+    assert set(sampled) <= set(stakers)
+
+
 def test_get_current_period(agency, testerchain):
     _token_agent, staking_agent,_policy_agent = agency
     start_period = staking_agent.get_current_period()
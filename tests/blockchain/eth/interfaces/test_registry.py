@@ -84,6 +84,25 @@ def test_contract_registry(tempfile_path):
         test_registry.search(contract_address=test_addr)
 
 
+def test_contract_registry_is_parsed_once_until_changed(tempfile_path, mocker):
+    test_registry = LocalContractRegistry(filepath=tempfile_path)
+    test_registry.enroll(contract_name='TestContract', contract_address='0xDEADBEEF', contract_abi=['fake', 'data'])
+    registry_id = test_registry.id
+
+    # Lookups and the id are served from the parsed registry...
+    read = mocker.spy(test_registry, 'read')
+    assert test_registry.id == registry_id
+    assert test_registry.search(contract_address='0xDEADBEEF')[0] == 'TestContract'
+    assert read.call_count == 0
+
+    # ...until the file changes, even if it's changed by someone else.
+    with open(tempfile_path, 'w') as registry_file:
+        json.dump([['OtherContract', '0xCAFE', []]], registry_file)
+    assert test_registry.search(contract_name='OtherContract') == (('OtherContract', '0xCAFE', []),)
+    assert test_registry.id != registry_id
+    assert read.call_count == 1
+
+
 def test_individual_allocation_registry(get_random_checksum_address, test_registry, tempfile_path):
     empty_allocation_escrow_deployer = PreallocationEscrowDeployer(registry=test_registry)
     allocation_contract_abi = empty_allocation_escrow_deployer.get_contract_abi()
@@ -123,6 +123,20 @@ def retrieve_control_request(federated_bob, enacted_federated_policy, capsule_si
     return method_name, params
 
 
+@pytest.fixture(scope='module')
+def retrieve_many_control_request(federated_bob, enacted_federated_policy, capsule_side_channel):
+    method_name = 'retrieve_many'
+    message_kits = [capsule_side_channel()[0] for _ in range(2)]
+
+    params = {
+        'label': enacted_federated_policy.label.decode(),
+        'policy_encrypting_key': bytes(enacted_federated_policy.public_key).hex(),
+        'alice_verifying_key': bytes(enacted_federated_policy.alice.stamp).hex(),
+        'message_kits': [b64encode(message_kit.to_bytes()).decode() for message_kit in message_kits],
+    }
+    return method_name, params
+
+
 @pytest.fixture(scope='module')
 def encrypt_control_request():
     method_name = 'encrypt_message'
@@ -190,6 +190,23 @@ def test_bob_web_character_control_retrieve(bob_web_controller_test_client, retr
     response = bob_web_controller_test_client.put(endpoint, data=json.dumps(params))
 
 
+def test_bob_web_character_control_retrieve_many(bob_web_controller_test_client, retrieve_many_control_request):
+    method_name, params = retrieve_many_control_request
+    endpoint = f'/{method_name}'
+
+    response = bob_web_controller_test_client.post(endpoint, data=json.dumps(params))
+    assert response.status_code == 200
+
+    response_data = json.loads(response.data)
+    cleartexts = response_data['result']['cleartexts']
+    assert len(cleartexts) == len(params['message_kits'])
+    assert all(cleartext.startswith('Welcome to flippering number') for cleartext in cleartexts)
+
+    # Send bad data to assert error returns
+    response = bob_web_controller_test_client.post(endpoint, data=json.dumps({'bad': 'input'}))
+    assert response.status_code == 400
+
+
 def test_enrico_web_character_control_encrypt_message(enrico_web_controller_test_client, encrypt_control_request):
     method_name, params = encrypt_control_request
     endpoint = f'/{method_name}'
@@ -19,6 +19,8 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 import os
 
 import datetime
+import time
+from threading import Lock
 import maya
 import pytest
 
@@ -72,6 +74,49 @@ def test_decentralized_grant(blockchain_alice, blockchain_bob, agency):
         assert kfrag == retrieved_kfrag
 
 
+@pytest.mark.usefixtures('blockchain_ursulas')
+def test_decentralized_grant_pays_only_ursulas_who_received_their_kfrags(blockchain_alice, blockchain_bob, agency, mocker):
+    create_policy = mocker.spy(blockchain_alice.policy_agent, 'create_policy')
+
+    # The first Ursula Alice sends a KFrag to is down.
+    enact_policy = blockchain_alice.network_middleware.enact_policy
+    unreachable_ursulas = []
+    lock = Lock()  # KFrags are sent concurrently
+
+    def first_ursula_is_down(ursula, kfrag_id, payload):
+        with lock:
+            if not unreachable_ursulas:
+                unreachable_ursulas.append(ursula)
+            is_down = ursula == unreachable_ursulas[0]
+        if is_down:
+            raise ConnectionRefusedError
+        return enact_policy(ursula, kfrag_id, payload)
+
+    mocker.patch.object(blockchain_alice.network_middleware, 'enact_policy', side_effect=first_ursula_is_down)
+
+    n = 3
+    policy = blockchain_alice.grant(bob=blockchain_bob,
+                                    label=b"one_ursula_is_down_during_decentralized_enactment",
+                                    m=2,
+                                    n=n,
+                                    rate=int(1e18),  # one ether
+                                    expiration=maya.now() + datetime.timedelta(days=5))
+
+    unreachable_ursula = unreachable_ursulas[0]
+    assert set(policy.failed_enactments) == {unreachable_ursula}
+    assert len(policy.enacted_arrangements) == n - 1
+
+    # The Ursula without a KFrag is neither paid on-chain nor revoked later.
+    _args, kwargs = create_policy.call_args
+    assert unreachable_ursula.checksum_address not in kwargs['node_addresses']
+    assert set(kwargs['node_addresses']) == {a.ursula.checksum_address for a in policy.enacted_arrangements}
+    assert set(kwargs['node_addresses']) == policy.revocation_kit.revokable_addresses
+
+    # Each of them is paid as much as if all n had received their KFrags; no more.
+    assert kwargs['value'] == (policy.value // n) * (n - 1)
+    assert kwargs['first_period_reward'] == policy.first_period_reward
+
+
 @pytest.mark.usefixtures('federated_ursulas')
 def test_federated_grant(federated_alice, federated_bob):
 
@@ -271,3 +316,55 @@ def test_alices_powers_are_persistent(federated_ursulas, tmpdir):
 
     # Both policies must share the same public key (i.e., the policy public key)
     assert policy_pubkey == roberto_policy.public_key
+
+
+def test_federated_arrangements_are_negotiated_concurrently(federated_alice, federated_bob, federated_ursulas):
+    delay = 0.5
+
+    class SlowMiddleware(MockRestMiddleware):
+        def consider_arrangement(self, arrangement):
+            time.sleep(delay)
+            return super().consider_arrangement(arrangement)
+
+    m, n = 2, 3
+    policy = federated_alice.create_policy(federated_bob,
+                                           label=b"negotiated_all_at_once",
+                                           m=m, n=n,
+                                           expiration=maya.now() + datetime.timedelta(days=5))
+    candidates = set(list(federated_ursulas)[:n + 2])
+
+    started = time.monotonic()
+    policy._consider_arrangements(network_middleware=SlowMiddleware(), candidate_ursulas=candidates)
+
+    # Negotiation time depends on the slowest Ursula rather than on how many there are...
+    assert time.monotonic() - started < delay * n
+
+    # ...and those not needed once n accepted are kept as spares.
+    assert len(policy._accepted_arrangements) == n
+    assert policy.accepted_ursulas | policy._spare_candidates == candidates
+    assert not policy.accepted_ursulas & policy._spare_candidates
+
+
+def test_federated_enactment_reports_ursulas_which_did_not_get_their_kfrags(federated_alice,
+                                                                            federated_bob,
+                                                                            federated_ursulas):
+    m, n = 2, 3
+    policy = federated_alice.create_policy(federated_bob,
+                                           label=b"one_ursula_is_down_during_enactment",
+                                           m=m, n=n,
+                                           expiration=maya.now() + datetime.timedelta(days=5))
+    handpicked_ursulas = set(list(federated_ursulas)[:n])
+    policy.make_arrangements(network_middleware=MockRestMiddleware(), handpicked_ursulas=handpicked_ursulas)
+    unreachable_ursula = list(handpicked_ursulas)[0]
+
+    class OneUrsulaIsDown(MockRestMiddleware):
+        def enact_policy(self, ursula, kfrag_id, payload):
+            if ursula == unreachable_ursula:
+                raise ConnectionRefusedError
+            return super().enact_policy(ursula, kfrag_id, payload)
+
+    policy.enact(network_middleware=OneUrsulaIsDown(), publish=False)
+
+    assert set(policy.failed_enactments) == {unreachable_ursula}
+    assert unreachable_ursula.checksum_address not in policy.treasure_map.destinations
+    assert len(policy.treasure_map.destinations) == n - 1
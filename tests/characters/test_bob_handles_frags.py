@@ -16,6 +16,8 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+from concurrent import futures
+
 import pytest
 import pytest_twisted
 from twisted.internet import threads
@@ -24,8 +26,10 @@ from umbral import pre
 from umbral.kfrags import KFrag
 from umbral.cfrags import CapsuleFrag
 
-from nucypher.crypto.powers import DecryptingPower 
+from nucypher.crypto.powers import DecryptingPower, SigningPower
+from nucypher.crypto.reencryption import ReencryptionEngine
 from nucypher.utilities.sandbox.middleware import MockRestMiddleware
+from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 
 
 def test_bob_cannot_follow_the_treasure_map_in_isolation(enacted_federated_policy, federated_bob):
@@ -332,3 +336,108 @@ def test_federated_bob_retrieves(federated_bob,
 
     # We show that indeed this is the passage originally encrypted by the Enrico.
     assert b"Welcome to flippering number 1." == delivered_cleartexts[0]
+
+
+def test_ursula_reencrypts_on_worker_processes(enacted_federated_policy,
+                                               federated_bob,
+                                               federated_alice,
+                                               federated_ursulas,
+                                               capsule_side_channel,
+                                               mocker):
+    map_id = enacted_federated_policy.treasure_map.public_id()
+    capsules = [capsule_side_channel()[0].capsule for _ in range(3)]
+    for capsule in capsules:
+        capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                     receiving=federated_bob.public_keys(DecryptingPower),
+                                     verifying=federated_alice.stamp.as_umbral_pubkey())
+
+    work_orders = federated_bob.generate_work_orders(map_id, *capsules, num_ursulas=1)
+    ursula_id, work_order = list(work_orders.items())[0]
+    ursula = next(u for u in federated_ursulas if u.checksum_address == ursula_id)
+
+    # This Ursula hands her re-encryptions over to a couple of worker processes.
+    engine_on_request_thread = ursula.reencryption_engine
+    ursula.reencryption_engine = ReencryptionEngine(signing_keypair=ursula._crypto_power.power_ups(SigningPower).keypair,
+                                                    processes=2,
+                                                    queue_depth=1)
+    submit = mocker.spy(futures.ProcessPoolExecutor, 'submit')
+    start_pool = mocker.spy(futures.ProcessPoolExecutor, '__init__')
+    try:
+        cfrags = federated_bob.get_reencrypted_cfrags(work_order)
+        assert ursula.reencryption_engine.is_running
+    finally:
+        ursula.reencryption_engine.stop()
+        ursula.reencryption_engine = engine_on_request_thread
+
+    # The work order's capsules were spread over both workers...
+    assert submit.call_count == 2
+
+    # ...which were handed nothing to start with; Ursula's signing key stays in her own process...
+    _args, pool_options = start_pool.call_args
+    assert 'initargs' not in pool_options
+
+    # ...and the cfrags came back in order, signed by Ursula, and they are correct.
+    assert work_order.completed
+    assert len(cfrags) == len(capsules)
+    for capsule, cfrag in zip(capsules, cfrags):
+        assert cfrag.verify_correctness(capsule)
+
+
+def test_reencryption_workers_start_on_first_use_and_stop_at_exit(federated_ursulas, mocker):
+    register_at_exit = mocker.patch('atexit.register')
+    unregister_at_exit = mocker.patch('atexit.unregister')
+    ursula = list(federated_ursulas)[0]
+    engine = ReencryptionEngine(signing_keypair=ursula._crypto_power.power_ups(SigningPower).keypair, processes=1)
+    assert not engine.is_running
+
+    engine.start()
+    register_at_exit.assert_called_once_with(engine.stop)
+    engine.stop()
+    unregister_at_exit.assert_called_once_with(engine.stop)
+    assert not engine.is_running
+
+
+def test_stopping_ursula_stops_her_background_work(ursula_federated_test_config):
+    ursula = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                    quantity=1,
+                                    know_each_other=False,
+                                    reencryption_processes=1).pop()
+    ursula.reencryption_engine.start()
+    ursula.policy_reaper.start()
+    ursula.work_order_journal.start()
+
+    ursula.stop()
+    assert not ursula.reencryption_engine.is_running
+    assert not ursula.policy_reaper.is_running
+    assert not ursula.work_order_journal.is_running
+
+
+def test_ursula_answers_a_retried_work_order_from_her_results_cache(enacted_federated_policy,
+                                                                    federated_bob,
+                                                                    federated_alice,
+                                                                    federated_ursulas,
+                                                                    capsule_side_channel,
+                                                                    mocker):
+    map_id = enacted_federated_policy.treasure_map.public_id()
+    capsule = capsule_side_channel()[0].capsule
+    capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                 receiving=federated_bob.public_keys(DecryptingPower),
+                                 verifying=federated_alice.stamp.as_umbral_pubkey())
+
+    work_orders = federated_bob.generate_work_orders(map_id, capsule, num_ursulas=1)
+    ursula_id, work_order = list(work_orders.items())[0]
+    ursula = next(u for u in federated_ursulas if u.checksum_address == ursula_id)
+    reencrypt = mocker.spy(ursula.reencryption_engine, 'reencrypt')
+    number_of_saved_work_orders = len(ursula.work_orders())
+
+    first_cfrags = federated_bob.get_reencrypted_cfrags(work_order)
+    assert reencrypt.call_count == 1
+    assert len(ursula.work_orders()) == number_of_saved_work_orders + 1
+
+    # Bob didn't hear back (say), so he sends the very same WorkOrder again.
+    retried_cfrags = federated_bob.get_reencrypted_cfrags(work_order)
+
+    # Ursula neither re-encrypted nor recorded it again, and the results are the same.
+    assert reencrypt.call_count == 1
+    assert len(ursula.work_orders()) == number_of_saved_work_orders + 1
+    assert [bytes(cfrag) for cfrag in retried_cfrags] == [bytes(cfrag) for cfrag in first_cfrags]
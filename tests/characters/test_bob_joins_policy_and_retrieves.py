@@ -1,8 +1,10 @@
 import datetime
 import os
+from threading import Event
 
 import maya
 import pytest
+import requests
 
 from constant_sorrow.constants import NO_DECRYPTION_PERFORMED
 from nucypher.characters.lawful import Bob, Ursula
@@ -39,6 +41,109 @@ def test_federated_bob_full_retrieve_flow(federated_ursulas,
     assert b"Welcome to flippering number 1." == delivered_cleartexts[0]
 
 
+def test_federated_bob_retrieves_without_waiting_for_a_stalled_ursula(federated_ursulas,
+                                                                     federated_bob,
+                                                                     federated_alice,
+                                                                     capsule_side_channel,
+                                                                     enacted_federated_policy,
+                                                                     mocker):
+    treasure_map = enacted_federated_policy.treasure_map
+    federated_bob.treasure_maps[treasure_map.public_id()] = treasure_map
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    # The first Ursula Bob sends a WorkOrder to hangs until we let her go.
+    stalled_ursula_address, _arrangement_id = next(iter(treasure_map))
+    ursula_is_stalled = Event()
+    reencrypt = federated_bob.network_middleware.reencrypt
+
+    def stall_first_ursula(work_order):
+        if work_order.ursula.checksum_address == stalled_ursula_address:
+            ursula_is_stalled.wait(timeout=30)
+        return reencrypt(work_order)
+
+    mocker.patch.object(federated_bob.network_middleware, 'reencrypt', side_effect=stall_first_ursula)
+
+    the_message_kit, the_data_source = capsule_side_channel()
+    alices_verifying_key = federated_alice.stamp.as_umbral_pubkey()
+    try:
+        delivered_cleartexts = federated_bob.retrieve(message_kit=the_message_kit,
+                                                      data_source=the_data_source,
+                                                      alice_verifying_key=alices_verifying_key,
+                                                      label=enacted_federated_policy.label)
+    finally:
+        ursula_is_stalled.set()
+
+    expected_message = "Welcome to flippering number {}.".format(len(capsule_side_channel.messages) - 1).encode()
+    assert expected_message == delivered_cleartexts[0]
+    assert len(the_message_kit.capsule._attached_cfrags) == treasure_map.m
+
+
+def test_federated_bob_retrieves_many_message_kits_with_one_work_order_per_ursula(federated_ursulas,
+                                                                                 federated_bob,
+                                                                                 federated_alice,
+                                                                                 capsule_side_channel,
+                                                                                 enacted_federated_policy,
+                                                                                 mocker):
+    treasure_map = enacted_federated_policy.treasure_map
+    federated_bob.treasure_maps[treasure_map.public_id()] = treasure_map
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    message_kits, data_sources = zip(*(capsule_side_channel() for _ in range(5)))
+    reencrypt = mocker.spy(federated_bob.network_middleware, 'reencrypt')
+
+    delivered_cleartexts = federated_bob.retrieve_many(message_kits=message_kits,
+                                                       data_sources=data_sources,
+                                                       alice_verifying_key=federated_alice.stamp.as_umbral_pubkey(),
+                                                       label=enacted_federated_policy.label)
+
+    assert len(delivered_cleartexts) == len(message_kits)
+    assert all(cleartext.startswith(b"Welcome to flippering number") for cleartext in delivered_cleartexts)
+
+    # Each Ursula got (at most) one WorkOrder, carrying every capsule.
+    work_orders = [call[0][0] for call in reencrypt.call_args_list]
+    assert treasure_map.m <= len(work_orders) <= len(treasure_map.destinations)
+    assert len({work_order.ursula.checksum_address for work_order in work_orders}) == len(work_orders)
+    assert all(len(work_order.tasks) == len(message_kits) for work_order in work_orders)
+    assert all(len(message_kit.capsule._attached_cfrags) >= treasure_map.m for message_kit in message_kits)
+
+
+def test_federated_bob_retrieves_despite_an_ursula_timing_out(federated_ursulas,
+                                                              federated_bob,
+                                                              federated_alice,
+                                                              capsule_side_channel,
+                                                              enacted_federated_policy,
+                                                              mocker):
+    treasure_map = enacted_federated_policy.treasure_map
+    federated_bob.treasure_maps[treasure_map.public_id()] = treasure_map
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    # The first Ursula Bob sends a WorkOrder to never answers in time.
+    slow_ursula_address, _arrangement_id = next(iter(treasure_map))
+    reencrypt = federated_bob.network_middleware.reencrypt
+
+    def time_out_first_ursula(work_order):
+        if work_order.ursula.checksum_address == slow_ursula_address:
+            raise requests.exceptions.ReadTimeout("Read timed out.")
+        return reencrypt(work_order)
+
+    mocker.patch.object(federated_bob.network_middleware, 'reencrypt', side_effect=time_out_first_ursula)
+
+    the_message_kit, the_data_source = capsule_side_channel()
+    alices_verifying_key = federated_alice.stamp.as_umbral_pubkey()
+    delivered_cleartexts = federated_bob.retrieve(message_kit=the_message_kit,
+                                                  data_source=the_data_source,
+                                                  alice_verifying_key=alices_verifying_key,
+                                                  label=enacted_federated_policy.label)
+
+    # The other Ursulas made up for her.
+    expected_message = "Welcome to flippering number {}.".format(len(capsule_side_channel.messages) - 1).encode()
+    assert expected_message == delivered_cleartexts[0]
+    assert len(the_message_kit.capsule._attached_cfrags) == treasure_map.m
+
+
 def test_bob_joins_policy_and_retrieves(federated_alice,
                                         federated_ursulas,
                                         certificates_tempdir,
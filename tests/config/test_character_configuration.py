@@ -70,6 +70,17 @@ def test_federated_development_character_configurations(character, configuration
         _characters.append(another_character)
 
 
+@pytest.mark.parametrize("character,configuration", characters_and_configurations)
+def test_character_configurations_set_teachers_per_round(character, configuration):
+    default_config = configuration(dev_mode=True, federated_only=True)
+    assert default_config.teachers_per_round == configuration.DEFAULT_TEACHERS_PER_ROUND
+    assert default_config().teachers_per_round == configuration.DEFAULT_TEACHERS_PER_ROUND
+
+    config = configuration(dev_mode=True, federated_only=True, teachers_per_round=3)
+    assert config.static_payload()['teachers_per_round'] == 3
+    assert config().teachers_per_round == 3
+
+
 @pytest.mark.parametrize('configuration_class', all_configurations)
 def test_default_character_configuration_preservation(configuration_class):
 
@@ -25,7 +25,6 @@ import maya
 import pytest
 
 from eth_utils import to_checksum_address
-from sqlalchemy.engine import create_engine
 from twisted.logger import Logger
 from umbral import pre
 from umbral.curvebn import CurveBN
@@ -58,7 +57,7 @@ from nucypher.config.node import CharacterConfiguration
 from nucypher.crypto.powers import TransactingPower
 from nucypher.crypto.utils import canonical_address_from_umbral_key
 from nucypher.keystore import keystore
-from nucypher.keystore.db import Base
+from nucypher.keystore.db import make_engine
 from nucypher.policy.collections import IndisputableEvidence, WorkOrder
 from nucypher.utilities.sandbox.blockchain import token_airdrop, TesterBlockchain
 from nucypher.utilities.sandbox.constants import (
@@ -106,9 +105,7 @@ def temp_dir_path():
 
 @pytest.fixture(scope="module")
 def test_keystore():
-    engine = create_engine('sqlite:///:memory:')
-    Base.metadata.create_all(engine)
-    test_keystore = keystore.KeyStore(engine)
+    test_keystore = keystore.KeyStore(make_engine())
     yield test_keystore
 
 
@@ -14,10 +14,21 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import gc
+import maya
 import pytest
-from datetime import datetime
+import weakref
+from datetime import datetime, timedelta
+from threading import Event, Thread
+from sqlalchemy import inspect
+from sqlalchemy.exc import OperationalError
 
 from nucypher.keystore import keystore, keypairs
+from nucypher.keystore.db import make_engine
+from nucypher.keystore.journal import WorkOrderJournal
+from nucypher.keystore.threading import ThreadedSession, session_factory, session_lock
+from nucypher.network.reaper import PolicyReaper
+from nucypher.network.server import KFragCache, TreasureMapCache
 
 
 @pytest.mark.usefixtures('testerchain')
@@ -75,3 +86,193 @@ def test_workorder_sqlite_keystore(test_keystore):
     deleted = test_keystore.del_workorders(arrangement_id)
     assert deleted > 0
     assert len(test_keystore.get_workorders(arrangement_id)) == 0
+
+
+def test_workorders_are_saved_in_batches_by_the_journal(tmpdir, mocker):
+    test_keystore = keystore.KeyStore(make_engine(db_filepath=str(tmpdir.join('journal.db'))))
+    save_workorders = mocker.spy(test_keystore, 'save_workorders')
+
+    bob_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    arrangement_id = b'test'
+    journal = WorkOrderJournal(datastore=test_keystore, flush_interval=60, batch_size=3)
+
+    # Recording a work order doesn't write it right away...
+    journal.record(bytes(bob_keypair_sig.pubkey), b'test0', arrangement_id)
+    journal.record(bytes(bob_keypair_sig.pubkey), b'test1', arrangement_id)
+    assert len(journal) == 2
+    assert len(test_keystore.get_workorders(arrangement_id)) == 0
+
+    # ...until a whole batch is waiting, or the journal is stopped.
+    journal.record(bytes(bob_keypair_sig.pubkey), b'test2', arrangement_id)
+    journal.record(bytes(bob_keypair_sig.pubkey), b'test3', arrangement_id)
+    journal.stop()
+    assert len(journal) == 0
+
+    # Each batch is written in its own transaction, no larger than batch_size.
+    assert [len(call[0][0]) for call in save_workorders.call_args_list] == [3, 1]
+
+    # All of them are there, in the order they were recorded, sharing Bob's key.
+    saved_workorders = sorted(test_keystore.get_workorders(arrangement_id), key=lambda workorder: workorder.id)
+    assert [workorder.bob_signature for workorder in saved_workorders] == [b'test0', b'test1', b'test2', b'test3']
+    assert len({workorder.bob_verifying_key_id for workorder in saved_workorders}) == 1
+
+
+def test_journal_drops_work_orders_which_can_never_be_written(tmpdir):
+    test_keystore = keystore.KeyStore(make_engine(db_filepath=str(tmpdir.join('journal.db'))))
+
+    bob_verifying_key = bytes(keypairs.SigningKeypair(generate_keys_if_needed=True).pubkey)
+    arrangement_id = b'test'
+    test_keystore.save_workorder(bob_verifying_key, b'already saved', arrangement_id)
+    journal = WorkOrderJournal(datastore=test_keystore, flush_interval=60)
+
+    # Bob's signatures are unique, so a batch with a duplicate can't be written as a whole,
+    # but only the duplicate is held back - for good - and the flush doesn't fail.
+    journal.record(bob_verifying_key, b'first', arrangement_id)
+    journal.record(bob_verifying_key, b'already saved', arrangement_id)
+    journal.record(bob_verifying_key, b'later', arrangement_id)
+    assert journal.flush() == 2
+    assert len(journal) == 0
+    assert journal.dropped == 1
+
+    saved_signatures = {workorder.bob_signature for workorder in test_keystore.get_workorders(arrangement_id)}
+    assert saved_signatures == {b'already saved', b'first', b'later'}
+
+
+def test_journal_retries_work_orders_which_fail_to_be_written(tmpdir, mocker):
+    test_keystore = keystore.KeyStore(make_engine(db_filepath=str(tmpdir.join('journal.db'))))
+
+    bob_verifying_key = bytes(keypairs.SigningKeypair(generate_keys_if_needed=True).pubkey)
+    arrangement_id = b'test'
+    journal = WorkOrderJournal(datastore=test_keystore, flush_interval=60, max_attempts=2)
+    journal.record(bob_verifying_key, b'first', arrangement_id)
+
+    # A record which fails for a reason that may go away is kept for the next flush...
+    save_workorders = mocker.patch.object(test_keystore, 'save_workorders', side_effect=OperationalError(None, None, None))
+    assert journal.flush() == 0
+    assert len(journal) == 1
+    assert journal.dropped == 0
+
+    # ...and dropped once it has failed max_attempts times.
+    assert journal.flush() == 0
+    assert len(journal) == 0
+    assert journal.dropped == 1
+    assert save_workorders.call_count == 4  # Each flush tries the batch, then the record on its own
+
+
+def test_datastore_on_disk_is_pooled_in_write_ahead_logging_mode_and_indexed(tmpdir):
+    db_filepath = str(tmpdir.join('datastore.db'))
+    engine = make_engine(db_filepath=db_filepath)
+
+    # Every pooled connection reads while others write
+    connections = [engine.connect() for _ in range(2)]
+    for connection in connections:
+        assert connection.execute("PRAGMA journal_mode").scalar() == 'wal'
+        connection.close()
+
+    # Every lookup path is covered by an index
+    inspector = inspect(engine)
+    indexed_columns = {(table, tuple(index['column_names']))
+                       for table in inspector.get_table_names()
+                       for index in inspector.get_indexes(table)}
+    assert ('workorders', ('arrangement_id',)) in indexed_columns
+    assert ('workorders', ('bob_verifying_key_id',)) in indexed_columns
+    assert ('policyarrangements', ('expiration',)) in indexed_columns
+
+    # Indexes missing from a datastore made before they were are added when it's opened again
+    with engine.connect() as connection:
+        connection.execute("DROP INDEX ix_workorders_arrangement_id")
+    engine.dispose()
+    engine = make_engine(db_filepath=db_filepath)
+    assert 'ix_workorders_arrangement_id' in {index['name'] for index in inspect(engine).get_indexes('workorders')}
+
+
+def test_engines_share_one_session_factory_and_are_still_collected():
+    engine = make_engine()
+    with ThreadedSession(engine) as session:
+        assert session.bind is engine
+    assert session_factory(engine) is session_factory(engine)
+
+    # The factory doesn't keep its engine alive once nothing else does.
+    engine_reference = weakref.ref(engine)
+    del engine, session
+    gc.collect()
+    assert engine_reference() is None
+
+
+def test_sessions_take_turns_on_an_in_memory_datastore(tmpdir):
+    engine = make_engine()
+    test_keystore = keystore.KeyStore(engine)
+    bob_verifying_key = bytes(keypairs.SigningKeypair(generate_keys_if_needed=True).pubkey)
+    began_writing, may_roll_back = Event(), Event()
+
+    def write_then_roll_back():
+        with ThreadedSession(engine) as session:
+            session.execute("DELETE FROM workorders")
+            began_writing.set()
+            may_roll_back.wait()
+            session.rollback()
+
+    def save():
+        with ThreadedSession(engine) as session:
+            test_keystore.save_workorders([(bob_verifying_key, b'saved', b'test')], session=session)
+
+    rolling_back, saving = Thread(target=write_then_roll_back), Thread(target=save)
+    rolling_back.start()
+    began_writing.wait()
+
+    # Every thread shares the one connection, so another thread's session waits its turn...
+    saving.start()
+    saving.join(timeout=0.5)
+    assert saving.is_alive()
+    may_roll_back.set()
+    rolling_back.join()
+    saving.join()
+
+    # ...and a rollback can't undo what it writes.
+    assert len(test_keystore.get_workorders(b'test')) == 1
+
+    # Sessions on a datastore on disk each get a connection of their own, and don't wait.
+    assert session_lock(make_engine(db_filepath=str(tmpdir.join('datastore.db')))) is None
+
+
+def test_expired_policies_are_reaped(tmpdir):
+    test_keystore = keystore.KeyStore(make_engine(db_filepath=str(tmpdir.join('reaper.db'))))
+    alice_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    bob_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    yesterday, tomorrow = datetime.utcnow() - timedelta(days=1), datetime.utcnow() + timedelta(days=1)
+
+    # Arrangements are kept by their hex ID; work orders refer to them by their raw ID.
+    for arrangement_id, expiration in ((b'expired', yesterday), (b'current', tomorrow)):
+        test_keystore.add_policy_arrangement(expiration, arrangement_id.hex().encode(),
+                                             alice_verifying_key=alice_keypair_sig.pubkey)
+        test_keystore.save_workorders([(bytes(bob_keypair_sig.pubkey), arrangement_id + b'-signature', arrangement_id)])
+
+    kfrags = KFragCache()
+    for arrangement_id, expiration in ((b'expired', yesterday), (b'current', tomorrow)):
+        kfrags._entries[arrangement_id] = KFragCache.Entry(kfrag=object(),
+                                                           alice_verifying_key=object(),
+                                                           alice_address=b'',
+                                                           expiration=maya.MayaDT.from_datetime(expiration))
+    treasure_maps = TreasureMapCache()
+    treasure_maps[b'map'] = 'a map'
+
+    reaper = PolicyReaper(datastore=test_keystore, kfrags=kfrags, treasure_maps=treasure_maps)
+    reclaimed = reaper.prune()
+    assert reclaimed == dict(arrangements=1, workorders=1, kfrags=1, treasure_maps=0)
+
+    # Only what has expired is gone
+    with pytest.raises(keystore.NotFound):
+        test_keystore.get_policy_arrangement(b'expired'.hex().encode())
+    assert test_keystore.get_policy_arrangement(b'current'.hex().encode())
+    assert len(test_keystore.get_workorders(b'expired')) == 0
+    assert len(test_keystore.get_workorders(b'current')) == 1
+    assert kfrags.get(b'current') and len(kfrags) == 1
+
+    # A second pass has nothing left to reclaim, and the counters add up every pass.
+    assert not any(reaper.prune().values())
+    assert reaper.stats == dict(passes=2,
+                                arrangements_deleted=1,
+                                workorders_deleted=1,
+                                kfrags_evicted=1,
+                                treasure_maps_evicted=0,
+                                treasure_maps_evicted_lru=0)
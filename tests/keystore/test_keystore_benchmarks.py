@@ -0,0 +1,130 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+#
+# Throughput of the KeyStore's hot paths, on a datastore on disk as Ursula keeps it.
+# Requires the 'benchmark' extra:  pip install -e .[benchmark]
+#
+
+from datetime import datetime, timedelta
+from itertools import count
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from nucypher.keystore import keypairs, keystore
+from nucypher.keystore.db import make_engine
+
+PREPOPULATED = 1000
+
+
+@pytest.fixture(scope='module')
+def benchmark_keystore(tmpdir_factory):
+    db_filepath = str(tmpdir_factory.mktemp('benchmarks').join('keystore.db'))
+    yield keystore.KeyStore(make_engine(db_filepath=db_filepath))
+
+
+@pytest.fixture(scope='module')
+def alice_verifying_key():
+    return keypairs.SigningKeypair(generate_keys_if_needed=True).pubkey
+
+
+@pytest.fixture(scope='module')
+def bob_verifying_key():
+    return keypairs.SigningKeypair(generate_keys_if_needed=True).pubkey
+
+
+@pytest.fixture(scope='module')
+def saved_arrangement_ids(benchmark_keystore, alice_verifying_key):
+    expiration = datetime.utcnow() + timedelta(days=1)
+    arrangement_ids = [b'saved-arrangement-%d' % i for i in range(PREPOPULATED)]
+    for arrangement_id in arrangement_ids:
+        benchmark_keystore.add_policy_arrangement(expiration, arrangement_id, alice_verifying_key=alice_verifying_key)
+    return arrangement_ids
+
+
+@pytest.fixture(scope='module')
+def saved_workorder_arrangement_ids(benchmark_keystore, bob_verifying_key):
+    arrangement_ids = [b'workorder-arrangement-%d' % i for i in range(PREPOPULATED // 10)]
+    benchmark_keystore.save_workorders((bytes(bob_verifying_key), b'saved-signature-%d' % i, arrangement_id)
+                                       for i, arrangement_id in enumerate(arrangement_ids * 10))
+    return arrangement_ids
+
+
+def test_add_policy_arrangement_throughput(benchmark, benchmark_keystore, alice_verifying_key):
+    expiration = datetime.utcnow() + timedelta(days=1)
+    ids = count()
+
+    def add_arrangement():
+        arrangement_id = b'added-arrangement-%d' % next(ids)
+        benchmark_keystore.add_policy_arrangement(expiration, arrangement_id, alice_verifying_key=alice_verifying_key)
+
+    benchmark(add_arrangement)
+
+
+def test_get_policy_arrangement_throughput(benchmark, benchmark_keystore, saved_arrangement_ids):
+    ids = count()
+
+    def get_arrangement():
+        arrangement_id = saved_arrangement_ids[next(ids) % len(saved_arrangement_ids)]
+        return benchmark_keystore.get_policy_arrangement(arrangement_id)
+
+    assert benchmark(get_arrangement)
+
+
+def test_del_policy_arrangement_throughput(benchmark, benchmark_keystore, alice_verifying_key):
+    expiration = datetime.utcnow() + timedelta(days=1)
+    ids = count()
+
+    def setup():
+        arrangement_id = b'deleted-arrangement-%d' % next(ids)
+        benchmark_keystore.add_policy_arrangement(expiration, arrangement_id, alice_verifying_key=alice_verifying_key)
+        return (arrangement_id, ), {}
+
+    benchmark.pedantic(benchmark_keystore.del_policy_arrangement, setup=setup, rounds=PREPOPULATED // 10)
+
+
+def test_save_workorder_throughput(benchmark, benchmark_keystore, bob_verifying_key):
+    signatures = count()
+
+    def save_workorder():
+        signature = b'signature-%d' % next(signatures)
+        benchmark_keystore.save_workorder(bob_verifying_key, signature, b'saved-workorder-arrangement')
+
+    benchmark(save_workorder)
+
+
+def test_save_workorders_in_batches_throughput(benchmark, benchmark_keystore, bob_verifying_key):
+    batches = count()
+
+    def save_batch():
+        batch = next(batches)
+        benchmark_keystore.save_workorders((bytes(bob_verifying_key), b'batch-%d-signature-%d' % (batch, i), b'batch')
+                                           for i in range(100))
+
+    benchmark(save_batch)
+
+
+def test_get_workorders_throughput(benchmark, benchmark_keystore, saved_workorder_arrangement_ids):
+    ids = count()
+
+    def get_workorders():
+        arrangement_id = saved_workorder_arrangement_ids[next(ids) % len(saved_workorder_arrangement_ids)]
+        return benchmark_keystore.get_workorders(arrangement_id)
+
+    assert len(benchmark(get_workorders)) == 10
@@ -1,5 +1,8 @@
 import os
+import time
 from collections import namedtuple
+from functools import partial
+from threading import Event, Lock, Thread
 
 import pytest
 from eth_utils.address import to_checksum_address
@@ -8,10 +11,14 @@ from twisted.logger import globalLogPublisher, LogLevel
 from bytestring_splitter import VariableLengthBytestring
 from constant_sorrow.constants import NOT_SIGNED
 
+from nucypher.blockchain.eth.agents import ContractAgency, StakingEscrowAgent
+from nucypher.blockchain.eth.interfaces import BlockchainInterface
 from nucypher.characters.base import Character
 from nucypher.crypto.powers import TransactingPower
 from nucypher.network.nicknames import nickname_from_seed
-from nucypher.network.nodes import FleetStateTracker
+from nucypher.characters.lawful import Ursula
+from nucypher.network.nodes import FleetStateTracker, StakerValidationCache
+from nucypher.utilities.concurrency import WorkerPool
 from nucypher.utilities.sandbox.middleware import MockRestMiddleware
 from nucypher.utilities.sandbox.ursula import make_federated_ursulas, make_ursula_for_staker
 
@@ -249,3 +256,138 @@ def test_node_posts_future_version(federated_ursulas):
     middleware.get_nodes_via_rest(node=ursula,
                                   announce_nodes=(future_node_bytes,))
     assert len(warnings) == 2
+
+
+def test_unresponsive_node_does_not_stall_verification_of_others(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    teacher = lonely_ursula_maker().pop()
+    blackholed_node, *responsive_nodes = list(federated_ursulas)[:4]
+    for node in (blackholed_node, *responsive_nodes):
+        teacher.remember_node(node)
+
+    class BlackholeMiddleware(MockRestMiddleware):
+        def node_information(self, host, port, certificate_filepath=None, certificate=None):
+            if port == blackholed_node.rest_interface.port:
+                time.sleep(5)
+            return super().node_information(host, port, certificate_filepath=certificate_filepath, certificate=certificate)
+
+    learner = lonely_ursula_maker(known_nodes=[teacher], network_middleware=BlackholeMiddleware()).pop()
+    learner.NODE_VERIFICATION_TIMEOUT = 0.5
+
+    started = time.monotonic()
+    new_nodes = learner.learn_from_teacher_node(eager=True)
+    assert time.monotonic() - started < 5
+
+    # Everyone but the blackholed node was verified and remembered.
+    new_addresses = {node.checksum_address for node in new_nodes}
+    assert {node.checksum_address for node in responsive_nodes} <= new_addresses
+    assert blackholed_node.checksum_address not in learner.known_nodes
+
+
+def test_values_queued_behind_blackholed_ones_are_timed_out_too():
+    blackholed, responsive = 3, 0
+    worker_pool = WorkerPool(worker=time.sleep, max_workers=2, value_timeout=0.5, timeout=1)
+
+    started = time.monotonic()
+    outcomes = list(worker_pool.as_completed([blackholed, blackholed, blackholed, responsive]))
+    assert time.monotonic() - started < blackholed
+
+    # Abandoned workers keep their slots, so the values queued behind the first two blackholes
+    # were timed out with the batch, not waited on.
+    assert len(outcomes) == 4
+    assert all(isinstance(outcome.exception, WorkerPool.TimedOut) for outcome in outcomes)
+
+
+def test_worker_pool_never_exceeds_max_workers_when_values_time_out():
+    lock = Lock()
+    running, most_running = 0, 0
+
+    def worker(seconds):
+        nonlocal running, most_running
+        with lock:
+            running += 1
+            most_running = max(most_running, running)
+        try:
+            time.sleep(seconds)
+        finally:
+            with lock:
+                running -= 1
+
+    worker_pool = WorkerPool(worker=worker, max_workers=2, value_timeout=0.1)
+    outcomes = list(worker_pool.as_completed([0.5, 0.5, 0.5, 0.5, 0]))
+
+    # Values were picked up as abandoned workers finished, never more than two at a time.
+    assert most_running == 2
+    assert [outcome.value for outcome in outcomes if outcome.exception is None] == [0]
+    assert len([outcome for outcome in outcomes if isinstance(outcome.exception, WorkerPool.TimedOut)]) == 4
+
+
+def test_staker_validation_is_answered_from_cache_within_a_period(blockchain_ursulas, test_registry, mocker):
+    ursula = list(blockchain_ursulas)[0]
+    staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=test_registry)
+
+    # The first validation this period may go to the blockchain...
+    assert ursula._worker_is_bonded_to_staker(registry=test_registry)
+    assert ursula._staker_is_really_staking(registry=test_registry)
+
+    # ...but subsequent ones, by anyone using the same registry, don't.
+    mocker.patch.object(staking_agent, 'get_staker_from_worker', side_effect=AssertionError("Asked the chain"))
+    mocker.patch.object(staking_agent, 'get_locked_tokens', side_effect=AssertionError("Asked the chain"))
+    stranger = Ursula.from_bytes(bytes(ursula), registry=test_registry)
+    assert stranger._worker_is_bonded_to_staker(registry=test_registry)
+    assert stranger._staker_is_really_staking(registry=test_registry)
+    assert StakerValidationCache.for_registry(test_registry) is StakerValidationCache.for_registry(test_registry)
+
+
+def test_staker_validation_on_a_chain_without_stakers(mocker):
+    staking_agent = mocker.Mock()
+    staking_agent.get_current_period.return_value = 1
+    staking_agent.get_staker_population.return_value = 0
+    staking_agent.get_all_active_stakers.side_effect = ValueError("getActiveStakers reverted")
+    staking_agent.get_staker_from_worker.return_value = BlockchainInterface.NULL_ADDRESS
+    mocker.patch.object(StakerValidationCache, 'staking_agent', new_callable=mocker.PropertyMock,
+                        return_value=staking_agent)
+
+    # The worker is detached, rather than the cache failing to prefetch active stakers.
+    cache = StakerValidationCache(registry=mocker.Mock())
+    assert cache.staker_from_worker(worker_address=to_checksum_address(os.urandom(20))) == BlockchainInterface.NULL_ADDRESS
+    assert not staking_agent.get_all_active_stakers.called
+
+
+def test_staker_validation_does_not_wait_for_another_thread_to_check_the_period(mocker):
+    staking_agent = mocker.Mock()
+    staking_agent.get_staker_population.return_value = 0
+    mocker.patch.object(StakerValidationCache, 'staking_agent', new_callable=mocker.PropertyMock,
+                        return_value=staking_agent)
+    cache = StakerValidationCache(registry=mocker.Mock())
+    cache.PERIOD_REFRESH_INTERVAL = 0
+
+    staking_agent.get_current_period.return_value = 1
+    assert cache.current_period() == 1
+
+    # While one thread waits for the chain to tell it the period...
+    chain_answers = Event()
+
+    def slow_current_period():
+        chain_answers.wait(timeout=10)
+        return 2
+
+    staking_agent.get_current_period.side_effect = slow_current_period
+    checking_thread = Thread(target=cache.current_period)
+    checking_thread.start()
+    try:
+        while not staking_agent.get_current_period.called:
+            time.sleep(0.01)
+
+        # ...others carry on with the period they know.
+        started = time.monotonic()
+        assert cache.current_period() == 1
+        assert time.monotonic() - started < 1
+    finally:
+        chain_answers.set()
+        checking_thread.join()
+
+    assert staking_agent.get_current_period.call_count == 2
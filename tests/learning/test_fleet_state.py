@@ -1,9 +1,16 @@
 from constant_sorrow.constants import FLEET_STATES_MATCH, NO_KNOWN_NODES
 from hendrix.experience import crosstown_traffic
 from hendrix.utils.test_utils import crosstownTaskListDecoratorFactory
+from nucypher.characters.lawful import Ursula
+from nucypher.crypto.api import keccak_digest
+from nucypher.crypto.signing import signature_splitter
+from nucypher.network.nodes import FleetStateTracker
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware
 from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 from functools import partial
 
+import requests
+
 
 def test_learning_from_node_with_no_known_nodes(ursula_federated_test_config):
     lonely_ursula_maker = partial(make_federated_ursulas,
@@ -106,3 +113,250 @@ def test_state_is_recorded_after_learning(federated_ursulas, ursula_federated_te
 
     assert len(states[0].nodes) == 2  # This and one other.
     assert len(states[1].nodes) == len(federated_ursulas) + 1  # Again, accounting for this Learner.
+
+
+def test_fleet_state_checksum_is_independent_of_learning_order(federated_ursulas):
+    ursulas = sorted(federated_ursulas, key=lambda u: u.checksum_address)
+
+    forwards, backwards = FleetStateTracker(), FleetStateTracker()
+    for ursula in ursulas:
+        forwards[ursula.checksum_address] = ursula
+    for ursula in reversed(ursulas):
+        backwards[ursula.checksum_address] = ursula
+
+    forwards.record_fleet_state()
+    backwards.record_fleet_state()
+    assert forwards.checksum == backwards.checksum
+
+
+def test_fleet_state_checksum_tracks_replacements_and_resets(federated_ursulas):
+    ursulas = list(federated_ursulas)
+    tracker = FleetStateTracker()
+    for ursula in ursulas[:-1]:
+        tracker[ursula.checksum_address] = ursula
+    tracker.record_fleet_state()
+    checksum_before = tracker.checksum
+
+    # Re-remembering an identical node doesn't change the fleet state...
+    tracker[ursulas[0].checksum_address] = ursulas[0]
+    assert tracker.record_fleet_state() is None
+    assert tracker.checksum == checksum_before
+
+    # ...but a new node does.
+    tracker[ursulas[-1].checksum_address] = ursulas[-1]
+    tracker.record_fleet_state()
+    assert tracker.checksum != checksum_before
+
+    # Wholesale replacement of the node collection is reflected in the digest as well.
+    digest_root = tracker._digest.root
+    tracker._nodes = {u.checksum_address: u for u in ursulas}
+    assert tracker._digest.root == digest_root
+    tracker._nodes = {u.checksum_address: u for u in ursulas[:-1]}
+    assert tracker._digest.root != digest_root
+    assert tracker.serialized(ursulas[0]) == bytes(ursulas[0])
+
+
+def test_fleet_state_checksum_is_the_flat_checksum_of_every_version(federated_ursulas):
+    tracker = FleetStateTracker()
+    for ursula in federated_ursulas:
+        tracker[ursula.checksum_address] = ursula
+    tracker.record_fleet_state()
+
+    # Nodes which don't maintain a digest compute the checksum over all of the sorted nodes.
+    flat_checksum = keccak_digest(b"".join(bytes(node) for node in tracker.sorted())).hex()
+    assert tracker.checksum == flat_checksum
+
+
+def test_fleet_state_checksum_follows_changes_to_nodes_tracked_in_addition(federated_ursulas):
+    class ThisNode:
+        checksum_address = '0x' + 'ab' * 20
+        metadata = b'first interface'
+
+        def __bytes__(self):
+            return self.metadata
+
+    this_node = ThisNode()
+    tracker = FleetStateTracker()
+    for ursula in federated_ursulas:
+        tracker[ursula.checksum_address] = ursula
+    tracker.record_fleet_state(additional_nodes_to_track=[this_node])
+    checksum_before = tracker.checksum
+
+    # This node's own metadata changes (say, a new interface) without it being re-remembered.
+    this_node.metadata = b'second interface'
+    tracker.record_fleet_state()
+    assert tracker.checksum != checksum_before
+    assert tracker.checksum == keccak_digest(b"".join(bytes(node) for node in tracker.sorted())).hex()
+
+
+def test_teacher_sends_only_nodes_updated_since_learners_last_view(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    teacher = lonely_ursula_maker().pop()
+    first_node, second_node = list(federated_ursulas)[:2]
+
+    teacher.remember_node(first_node)
+    state_seen_by_learner = teacher.known_nodes.checksum
+    teacher.remember_node(second_node)
+
+    assert teacher.known_nodes.nodes_updated_since(state_seen_by_learner) == [second_node]
+    assert teacher.known_nodes.nodes_updated_since("not-a-state-we-remember") is None
+
+    def nodes_in_response(response):
+        signature, payload = signature_splitter(response.content, return_remainder=True)
+        _checksum, _updated, node_payload = FleetStateTracker.snapshot_splitter(payload, return_remainder=True)
+        return Ursula.batch_from_bytes(node_payload, federated_only=True)
+
+    # A learner who has seen the previous state only gets the difference...
+    middleware = MockRestMiddleware()
+    response = middleware.get_nodes_via_rest(node=teacher, teacher_fleet_checksum=state_seen_by_learner)
+    assert [n.checksum_address for n in nodes_in_response(response)] == [second_node.checksum_address]
+
+    # ...whereas a learner referencing an unknown state gets everything, including the teacher.
+    response = middleware.get_nodes_via_rest(node=teacher, teacher_fleet_checksum="deadbeef")
+    addresses = {n.checksum_address for n in nodes_in_response(response)}
+    assert addresses == {first_node.checksum_address, second_node.checksum_address, teacher.checksum_address}
+
+
+def test_node_metadata_is_signed_once_per_fleet_state(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    teacher = lonely_ursula_maker().pop()
+    first_node, second_node = list(federated_ursulas)[:2]
+    teacher.remember_node(first_node)
+
+    middleware = MockRestMiddleware()
+    first_response = middleware.get_nodes_via_rest(node=teacher)
+    second_response = middleware.get_nodes_via_rest(node=teacher)
+
+    # Signatures are randomized, so identical payloads mean the response was served from cache.
+    assert first_response.content == second_response.content
+
+    # Once the teacher's fleet state changes, the payload is rebuilt.
+    teacher.remember_node(second_node)
+    third_response = middleware.get_nodes_via_rest(node=teacher)
+    assert third_response.content != first_response.content
+    signature, payload = signature_splitter(third_response.content, return_remainder=True)
+    assert payload.startswith(teacher.known_nodes.snapshot())
+
+
+def test_learning_from_several_teachers_in_one_round(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    first_node, second_node = list(federated_ursulas)[:2]
+
+    # Each teacher knows about a different node.
+    first_teacher = lonely_ursula_maker().pop()
+    first_teacher.remember_node(first_node)
+    second_teacher = lonely_ursula_maker().pop()
+    second_teacher.remember_node(second_node)
+
+    learner = lonely_ursula_maker(known_nodes=[first_teacher, second_teacher], teachers_per_round=2).pop()
+    states_before = len(learner.known_nodes.states)
+
+    new_nodes = learner.learn_from_teacher_node()
+
+    # Both teachers were consulted in a single round, and the fleet state was recorded once.
+    assert learner._learning_round == 1
+    new_addresses = {node.checksum_address for node in new_nodes}
+    assert {first_node.checksum_address, second_node.checksum_address} <= new_addresses
+    assert first_node.checksum_address in learner.known_nodes
+    assert second_node.checksum_address in learner.known_nodes
+    assert len(learner.known_nodes.states) == states_before + 1
+
+
+def test_learner_retries_nodes_it_failed_to_reach_without_asking_for_everything_again(federated_ursulas,
+                                                                                      ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    teacher = lonely_ursula_maker().pop()
+    flaky_node, steady_node = list(federated_ursulas)[:2]
+    teacher.remember_node(flaky_node)
+    teacher.remember_node(steady_node)
+
+    class FlakyMiddleware(MockRestMiddleware):
+        flaky = True
+        deltas_since = []
+
+        def get_nodes_via_rest(self, *args, teacher_fleet_checksum=None, **kwargs):
+            self.deltas_since.append(teacher_fleet_checksum)
+            return super().get_nodes_via_rest(*args, teacher_fleet_checksum=teacher_fleet_checksum, **kwargs)
+
+        def node_information(self, host, port, *args, **kwargs):
+            if self.flaky and port == flaky_node.rest_interface.port:
+                raise requests.exceptions.ConnectionError("Flaky node is down")
+            return super().node_information(host, port, *args, **kwargs)
+
+    middleware = FlakyMiddleware()
+    learner = lonely_ursula_maker(known_nodes=[teacher], network_middleware=middleware).pop()
+
+    def learn_from_teacher():
+        learner._current_teacher_node = teacher
+        learner.learn_from_teacher_node(eager=True)
+
+    # The flaky node can't be reached this round, so it's kept as pending...
+    learn_from_teacher()
+    assert flaky_node.checksum_address not in learner.known_nodes
+    assert steady_node.checksum_address in learner.known_nodes
+    assert set(teacher.pending_nodes) == {flaky_node.checksum_address}
+
+    # ...and retried directly next round, which is still only a delta.
+    middleware.flaky = False
+    learn_from_teacher()
+    assert middleware.deltas_since[0] is None
+    assert middleware.deltas_since[1] is not None
+    assert flaky_node.checksum_address in learner.known_nodes
+    assert not teacher.pending_nodes
+
+
+def test_teacher_with_an_invalid_node_still_serves_deltas(federated_ursulas, ursula_federated_test_config, mocker):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    teacher = lonely_ursula_maker().pop()
+    invalid_node, valid_node = list(federated_ursulas)[:2]
+    teacher.remember_node(invalid_node)
+    teacher.remember_node(valid_node)
+
+    class DeltaTrackingMiddleware(MockRestMiddleware):
+        deltas_since = []
+
+        def get_nodes_via_rest(self, *args, teacher_fleet_checksum=None, **kwargs):
+            self.deltas_since.append(teacher_fleet_checksum)
+            return super().get_nodes_via_rest(*args, teacher_fleet_checksum=teacher_fleet_checksum, **kwargs)
+
+    verify_node = Ursula.verify_node
+
+    def reject_invalid_node(node, *args, **kwargs):
+        if node.checksum_address == invalid_node.checksum_address:
+            raise node.InvalidNode("Wrong cryptographic material for this node.")
+        return verify_node(node, *args, **kwargs)
+
+    mocker.patch.object(Ursula, 'verify_node', autospec=True, side_effect=reject_invalid_node)
+
+    middleware = DeltaTrackingMiddleware()
+    learner = lonely_ursula_maker(known_nodes=[teacher], network_middleware=middleware).pop()
+
+    def learn_from_teacher():
+        learner._current_teacher_node = teacher
+        learner.learn_from_teacher_node(eager=True)
+
+    learn_from_teacher()
+    assert invalid_node.checksum_address not in learner.known_nodes
+    assert valid_node.checksum_address in learner.known_nodes
+
+    # The invalid node is rejected for good; it doesn't keep the teacher from settling.
+    assert not teacher.pending_nodes
+    settled_checksum = teacher.learned_fleet_state_checksum
+    assert settled_checksum is not None
+    learn_from_teacher()
+    assert middleware.deltas_since == [None, settled_checksum]
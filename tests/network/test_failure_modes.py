@@ -2,10 +2,11 @@ import datetime
 import maya
 import pytest
 
+from nucypher.crypto.api import keccak_digest
 from nucypher.network.nodes import Learner
 from nucypher.policy.collections import TreasureMap
 from nucypher.policy.policies import Policy
-from nucypher.utilities.sandbox.middleware import NodeIsDownMiddleware
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware, NodeIsDownMiddleware
 from functools import partial
 
 
@@ -14,8 +15,9 @@ def test_bob_does_not_let_a_connection_error_stop_him(enacted_federated_policy,
                                                       federated_bob,
                                                       federated_alice):
     assert len(federated_bob.known_nodes) == 0
-    ursula1 = list(federated_ursulas)[0]
-    ursula2 = list(federated_ursulas)[1]
+    # The first two Ursulas in line to store the TreasureMap.
+    treasure_map_id = enacted_federated_policy.treasure_map.public_id()
+    ursula1, ursula2 = TreasureMap.rank_nodes(map_id=treasure_map_id, nodes=federated_ursulas)[:2]
 
     federated_bob.remember_node(ursula1)
 
@@ -122,3 +124,58 @@ def test_node_has_changed_cert(federated_alice, federated_ursulas):
 
     # Cool - we didn't crash because of SSLError.
     # TODO: Assertions and such.
+
+
+def test_bob_does_not_ask_again_for_a_treasure_map_nodes_do_not_have(federated_bob, federated_ursulas, mocker):
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    middleware = MockRestMiddleware()
+    map_request = mocker.spy(middleware, 'get_treasure_map_from_node')
+    unpublished_map_id = keccak_digest(b"a map nobody has").hex()
+
+    with pytest.raises(TreasureMap.NowhereToBeFound):
+        federated_bob.get_treasure_map_from_known_ursulas(middleware, unpublished_map_id)
+    assert map_request.call_count == len(federated_bob.known_nodes)
+
+    # Every node already said it doesn't have this map; nobody is asked again.
+    with pytest.raises(TreasureMap.NowhereToBeFound):
+        federated_bob.get_treasure_map_from_known_ursulas(middleware, unpublished_map_id)
+    assert map_request.call_count == len(federated_bob.known_nodes)
+
+
+def test_bob_asks_the_responsible_nodes_for_a_treasure_map_first(enacted_federated_policy,
+                                                                  federated_bob,
+                                                                  federated_ursulas,
+                                                                  mocker):
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+
+    middleware = MockRestMiddleware()
+    map_request = mocker.spy(middleware, 'get_treasure_map_from_node')
+    map_id = enacted_federated_policy.treasure_map.public_id()
+
+    treasure_map = federated_bob.get_treasure_map_from_known_ursulas(middleware, map_id)
+    assert treasure_map.public_id() == map_id
+
+    # The nodes which store the TreasureMap have it, so nobody further down the line is asked.
+    responsible_nodes = TreasureMap.rank_nodes(map_id=map_id, nodes=federated_bob.known_nodes)[:TreasureMap.RESPONSIBLE_NODES]
+    asked_nodes = [call[1]['node'] for call in map_request.call_args_list]
+    assert 0 < len(asked_nodes) <= TreasureMap.RESPONSIBLE_NODES
+    assert set(asked_nodes) <= set(responsible_nodes)
+    assert map_id not in federated_bob._treasure_map_misses
+
+
+def test_bob_remembers_treasure_map_misses_for_a_bounded_number_of_maps(federated_bob, federated_ursulas, mocker):
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+    mocker.patch.object(federated_bob._treasure_map_misses, 'max_entries', 2)
+
+    middleware = MockRestMiddleware()
+    unpublished_map_ids = [keccak_digest(b"a map nobody has #%d" % i).hex() for i in range(3)]
+    for map_id in unpublished_map_ids:
+        with pytest.raises(TreasureMap.NowhereToBeFound):
+            federated_bob.get_treasure_map_from_known_ursulas(middleware, map_id)
+
+    assert len(federated_bob._treasure_map_misses) == 2
+    assert unpublished_map_ids[0] not in federated_bob._treasure_map_misses
@@ -16,6 +16,9 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+import datetime
+
+import maya
 import pytest
 from binascii import unhexlify
 from hendrix.experience import crosstown_traffic
@@ -25,8 +28,13 @@ from nucypher.characters.lawful import Ursula
 from nucypher.characters.unlawful import Vladimir
 from nucypher.crypto.api import keccak_digest
 from nucypher.crypto.powers import SigningPower
+from nucypher.keystore.db import make_engine
+from nucypher.keystore.keystore import KeyStore
+from nucypher.network.middleware import NodeSessionPool, NucypherMiddlewareClient, RestMiddleware
 from nucypher.network.nicknames import nickname_from_seed
 from nucypher.network.nodes import FleetStateTracker
+from nucypher.network.server import KFragCache, TreasureMapCache, TreasureMapStore
+from nucypher.policy.collections import TreasureMap
 from nucypher.utilities.sandbox.constants import INSECURE_DEVELOPMENT_PASSWORD
 from nucypher.utilities.sandbox.middleware import MockRestMiddleware
 
@@ -78,10 +86,21 @@ def test_alice_sets_treasure_map(enacted_federated_policy, federated_ursulas):
     """
     enacted_federated_policy.publish_treasure_map(network_middleware=MockRestMiddleware())
     treasure_map_index = bytes.fromhex(enacted_federated_policy.treasure_map.public_id())
-    treasure_map_as_set_on_network = list(federated_ursulas)[0].treasure_maps[treasure_map_index]
+    responsible_ursula = TreasureMap.rank_nodes(map_id=treasure_map_index.hex(), nodes=federated_ursulas)[0]
+    treasure_map_as_set_on_network = responsible_ursula.treasure_maps[treasure_map_index]
     assert treasure_map_as_set_on_network == enacted_federated_policy.treasure_map
 
 
+def test_treasure_map_is_stored_only_by_responsible_ursulas(enacted_federated_policy, federated_ursulas):
+    treasure_map_index = bytes.fromhex(enacted_federated_policy.treasure_map.public_id())
+    ranked_ursulas = TreasureMap.rank_nodes(map_id=treasure_map_index.hex(), nodes=federated_ursulas)
+    responsible_ursulas = ranked_ursulas[:TreasureMap.RESPONSIBLE_NODES]
+    other_ursulas = ranked_ursulas[TreasureMap.RESPONSIBLE_NODES:]
+
+    assert all(treasure_map_index in ursula.treasure_maps for ursula in responsible_ursulas)
+    assert not any(treasure_map_index in ursula.treasure_maps for ursula in other_ursulas)
+
+
 def test_treasure_map_stored_by_ursula_is_the_correct_one_for_bob(federated_alice, federated_bob, federated_ursulas,
                                                                   enacted_federated_policy):
     """
@@ -89,7 +108,8 @@ def test_treasure_map_stored_by_ursula_is_the_correct_one_for_bob(federated_alic
     """
 
     treasure_map_index = bytes.fromhex(enacted_federated_policy.treasure_map.public_id())
-    treasure_map_as_set_on_network = list(federated_ursulas)[0].treasure_maps[treasure_map_index]
+    responsible_ursula = TreasureMap.rank_nodes(map_id=treasure_map_index.hex(), nodes=federated_ursulas)[0]
+    treasure_map_as_set_on_network = responsible_ursula.treasure_maps[treasure_map_index]
 
     hrac_by_bob = federated_bob.construct_policy_hrac(federated_alice.stamp, enacted_federated_policy.label)
     assert enacted_federated_policy.hrac() == hrac_by_bob
@@ -231,3 +251,130 @@ def test_alice_does_not_update_with_old_ursula_info(federated_alice, federated_u
 
     new_metadata = bytes(federated_alice.known_nodes[ursula.checksum_address])
     assert new_metadata != old_metadata
+
+
+def test_kfrag_cache_evicts_least_recently_used_and_expired_entries():
+    kfrags = KFragCache(max_entries=2)
+    tomorrow = maya.now() + datetime.timedelta(days=1)
+
+    def entry(expiration=tomorrow):
+        return KFragCache.Entry(kfrag=object(), alice_verifying_key=object(), alice_address=b'', expiration=expiration)
+
+    kfrags.put(b'first', entry())
+    kfrags.put(b'second', entry())
+    assert kfrags.get(b'first')  # Now "second" is the least recently used...
+
+    kfrags.put(b'third', entry())  # ...so it makes room for this one.
+    assert kfrags.get(b'second') is None
+    assert kfrags.get(b'first') and kfrags.get(b'third')
+
+    # Revoked arrangements are evicted...
+    kfrags.evict(b'first')
+    assert kfrags.get(b'first') is None
+
+    # ...and expired ones are neither served nor cached.
+    kfrags.put(b'expired', entry(expiration=maya.now() - datetime.timedelta(seconds=1)))
+    assert kfrags.get(b'expired') is None
+    assert len(kfrags) == 1
+
+
+def test_treasure_map_cache_evicts_least_recently_used_and_expired_maps(mocker):
+    treasure_maps = TreasureMapCache(max_entries=2, max_age=60)
+
+    treasure_maps[b'first'] = 'first map'
+    treasure_maps[b'second'] = 'second map'
+    assert treasure_maps[b'first'] == 'first map'  # Now "second" is the least recently used...
+
+    treasure_maps[b'third'] = 'third map'  # ...so it makes room for this one.
+    assert b'second' not in treasure_maps
+    assert treasure_maps.lru_evictions == 1
+    with pytest.raises(KeyError):
+        _map = treasure_maps[b'second']
+
+    # Once their time is up, maps are neither served...
+    a_minute_later = maya.now() + datetime.timedelta(seconds=61)
+    mocker.patch('maya.now', return_value=a_minute_later)
+    assert treasure_maps.get(b'first') is None
+
+    # ...nor kept.
+    assert treasure_maps.prune() == 1
+    assert len(treasure_maps) == 0
+
+
+def test_treasure_maps_outlive_memory_and_restarts(enacted_federated_policy, tmpdir):
+    db_filepath = str(tmpdir.join('treasure-maps.db'))
+    treasure_map = enacted_federated_policy.treasure_map
+    map_id = bytes.fromhex(treasure_map.public_id())
+
+    treasure_maps = TreasureMapStore(datastore=KeyStore(make_engine(db_filepath=db_filepath)), max_entries=1)
+    treasure_maps[map_id] = treasure_map
+    treasure_maps[b'another map'] = treasure_map  # Makes room in memory for itself...
+    assert treasure_maps.lru_evictions == 1 and len(treasure_maps) == 1
+
+    # ...but the first map is still served, from disk, and is hot again.
+    assert treasure_maps[map_id] == treasure_map
+    assert treasure_maps[map_id] == treasure_map
+    assert treasure_maps.disk_reads == 1
+
+    # After a restart, nothing is in memory but every map is there.
+    restarted_treasure_maps = TreasureMapStore(datastore=KeyStore(make_engine(db_filepath=db_filepath)))
+    assert len(restarted_treasure_maps) == 0
+    assert restarted_treasure_maps[map_id] == treasure_map
+    assert b'another map' in restarted_treasure_maps
+    assert b'no such map' not in restarted_treasure_maps
+
+
+def test_treasure_maps_on_disk_are_capped_oldest_first(enacted_federated_policy, tmpdir):
+    db_filepath = str(tmpdir.join('treasure-maps.db'))
+    treasure_map = enacted_federated_policy.treasure_map
+
+    treasure_maps = TreasureMapStore(datastore=KeyStore(make_engine(db_filepath=db_filepath)), max_rows=2)
+    now = maya.now()
+    for days, map_id in enumerate((b'oldest map', b'older map', b'newest map'), start=1):
+        treasure_maps.put(map_id, treasure_map, expiration=now.add(days=days))
+
+    # Nothing has expired, but there's one map too many on disk.
+    assert treasure_maps.prune() == 1
+
+    restarted_treasure_maps = TreasureMapStore(datastore=KeyStore(make_engine(db_filepath=db_filepath)))
+    assert b'oldest map' not in restarted_treasure_maps
+    assert b'older map' in restarted_treasure_maps
+    assert b'newest map' in restarted_treasure_maps
+
+
+def test_middleware_client_reuses_one_session_per_node(mocker):
+    client = NucypherMiddlewareClient(sessions=NodeSessionPool(max_entries=2))
+
+    _host, _cert, session = client.parse_node_or_host_and_port(node=None, host='1.2.3.4', port=9151)
+    _host, _cert, same_session = client.parse_node_or_host_and_port(node=None, host='1.2.3.4', port=9151)
+    assert same_session is session
+
+    # A node at another address, or pinned to another certificate, gets a session of its own...
+    close = mocker.spy(session, 'close')
+    other_session = client.sessions.session('5.6.7.8:9151', certificate_filepath='/certs/other.pem')
+    assert other_session is not session
+    assert not close.called
+
+    # ...and the least recently contacted node's session is dropped to make room,
+    # but not closed, since another thread may be in the middle of a request with it.
+    renewed_session = client.sessions.session('5.6.7.8:9151', certificate_filepath='/certs/renewed.pem')
+    assert renewed_session is not other_session
+    assert not close.called
+    assert len(client.sessions) == 2
+    assert '1.2.3.4:9151' not in {host for host, _pin in client.sessions}
+
+
+def test_work_order_timeout_grows_with_its_capsules(mocker):
+    middleware = RestMiddleware()
+    post = mocker.patch.object(middleware.client, 'post')
+
+    def work_order_with(number_of_tasks):
+        return mocker.Mock(tasks=[mocker.Mock()] * number_of_tasks, arrangement_id=b'arrangement-id')
+
+    middleware.send_work_order_payload_to_ursula(work_order_with(1))
+    _args, kwargs = post.call_args
+    single_capsule_timeout = kwargs['timeout']
+
+    middleware.send_work_order_payload_to_ursula(work_order_with(100))
+    _args, kwargs = post.call_args
+    assert kwargs['timeout'] == single_capsule_timeout + 99 * RestMiddleware.WORK_ORDER_TIMEOUT_PER_TASK
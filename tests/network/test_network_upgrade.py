@@ -15,12 +15,15 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import os
+import pytest
 import pytest_twisted
 import requests
 from cryptography.hazmat.primitives import serialization
-from twisted.internet import threads
+from twisted.internet import defer, threads
+from twisted.internet.ssl import Certificate
 
 from nucypher.characters.lawful import Ursula
+from nucypher.network.middleware import AsyncRestMiddleware, NotFound, NucypherMiddlewareClient
 from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 
 
@@ -58,3 +61,94 @@ def test_federated_nodes_connect_via_tls_and_verify(ursula_federated_test_config
         yield threads.deferToThread(check_node_with_cert, node, "test-cert")
     finally:
         os.remove("test-cert")
+
+
+@pytest_twisted.inlineCallbacks
+def test_federated_nodes_are_reached_asynchronously_via_tls(ursula_federated_test_config):
+    node = make_federated_ursulas(ursula_config=ursula_federated_test_config, quantity=1).pop()
+    node_deployer = node.get_deployer()
+
+    node_deployer.addServices()
+    node_deployer.catalogServers(node_deployer.hendrix)
+    node_deployer.start()
+
+    cert = node_deployer.cert.to_cryptography()
+    cert_bytes = cert.public_bytes(serialization.Encoding.PEM)
+    host, port = node.rest_interface.host, node.rest_interface.port
+    middleware = AsyncRestMiddleware()
+
+    try:
+        with open("test-async-cert", "wb") as f:
+            f.write(cert_bytes)
+
+        node_bytes = yield middleware.node_information(host, port, certificate_filepath="test-async-cert")
+        assert Ursula.from_bytes(node_bytes, federated_only=True) == node
+
+        # Many requests can be in flight at once, without a thread each.
+        requests_in_flight = [middleware.node_information(host, port, certificate_filepath="test-async-cert")
+                              for _ in range(20)]
+        all_node_bytes = yield defer.gatherResults(requests_in_flight, consumeErrors=True)
+        assert set(all_node_bytes) == {node_bytes}
+
+        # Failures are reported as the blocking middleware raises them.
+        with pytest.raises(NotFound):
+            yield middleware.client.get(host=host, port=port,
+                                        certificate_filepath="test-async-cert",
+                                        path=f"treasure_map/{'00' * 32}")
+    finally:
+        os.remove("test-async-cert")
+
+
+@pytest_twisted.inlineCallbacks
+def test_federated_nodes_are_reached_via_tls_pinned_to_their_certificate(ursula_federated_test_config):
+    node, impostor = make_federated_ursulas(ursula_config=ursula_federated_test_config, quantity=2)
+    node_deployer = node.get_deployer()
+
+    node_deployer.addServices()
+    node_deployer.catalogServers(node_deployer.hendrix)
+    node_deployer.start()
+
+    host, port = node.rest_interface.host, node.rest_interface.port
+    client = NucypherMiddlewareClient()
+
+    def check_node_with_pinned_cert(certificate):
+        response = client.get(path="public_information", host=host, port=port, certificate=certificate)
+        assert Ursula.from_bytes(response.content, federated_only=True) == node
+
+    # The node's own certificate, pinned in memory, is accepted...
+    yield threads.deferToThread(check_node_with_pinned_cert, node.certificate)
+
+    # ...and any other is rejected, though it's valid and self-signed too.
+    with pytest.raises(requests.exceptions.SSLError):
+        yield threads.deferToThread(check_node_with_pinned_cert, impostor.certificate)
+
+
+def test_async_middleware_repins_a_node_when_its_certificate_is_stored(ursula_federated_test_config, tmpdir, mocker):
+    node, impostor = make_federated_ursulas(ursula_config=ursula_federated_test_config, quantity=2)
+    host, port = node.rest_interface.host, node.rest_interface.port
+
+    # Each middleware makes its own client, rather than one being made at import.
+    middleware = AsyncRestMiddleware()
+    assert middleware.client is not AsyncRestMiddleware().client
+    tls_policy = middleware.client.tls_policy
+
+    def pinned_pem():
+        _source, certificate = tls_policy._pins.get((host, port))
+        return certificate.dumpPEM()
+
+    certificate_filepath = str(tmpdir.join('certificate.pem'))
+    with open(certificate_filepath, 'wb') as certificate_file:
+        certificate_file.write(impostor.certificate.public_bytes(serialization.Encoding.PEM))
+    tls_policy.pin(host, port, certificate_filepath=certificate_filepath)
+    assert pinned_pem() == impostor.certificate.public_bytes(serialization.Encoding.PEM)
+
+    # Pinning the certificate it's already pinned to is a lookup in memory...
+    loadPEM = mocker.spy(Certificate, 'loadPEM')
+    tls_policy.pin(host, port, certificate=node.certificate)
+    tls_policy.pin(host, port, certificate=node.certificate)
+    assert loadPEM.call_count == 1
+
+    # ...and storing a node's certificate repins its address to it.
+    tls_policy.pin(host, port, certificate_filepath=certificate_filepath)
+    middleware.remember_certificate(node)
+    assert pinned_pem() == node.certificate.public_bytes(serialization.Encoding.PEM)
@@ -15,11 +15,16 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import os
+
 import maya
 import pytest
 import pytest_twisted as pt
+from constant_sorrow.constants import CERTIFICATE_NOT_SAVED
 from twisted.internet.threads import deferToThread
 
+from nucypher.config.storages import ForgetfulNodeStorage
+from nucypher.network.middleware import NucypherMiddlewareClient, PinnedCertificateAdapter
 from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 
 
@@ -53,3 +58,36 @@ def test_one_node_stores_a_bunch_of_others(federated_ursulas, ursula_federated_t
     assert list(newcomer.known_nodes)
     assert len(list(newcomer.known_nodes)) == len(list(newcomer.node_storage.all(True)))
     assert set(list(newcomer.known_nodes)) == set(list(newcomer.node_storage.all(True)))
+
+
+def test_forgetful_node_storage_keeps_certificates_in_memory(federated_ursulas):
+    node = list(federated_ursulas)[0]
+
+    node_storage = ForgetfulNodeStorage(federated_only=True)
+    assert node_storage.store_node_certificate(certificate=node.certificate) is CERTIFICATE_NOT_SAVED
+    assert not os.listdir(node_storage._temp_certificates_dir)
+    stored_certificate = node_storage.get(checksum_address=node.checksum_address,
+                                          federated_only=True,
+                                          certificate_only=True)
+    assert stored_certificate == node.certificate
+
+    # Writing them to disk is optional.
+    persisting_node_storage = ForgetfulNodeStorage(federated_only=True, persist_certificates=True)
+    certificate_filepath = persisting_node_storage.store_node_certificate(certificate=node.certificate)
+    assert os.path.isfile(certificate_filepath)
+
+
+def test_middleware_client_pins_node_certificates_from_memory(federated_ursulas):
+    node = list(federated_ursulas)[0]
+    client = NucypherMiddlewareClient()
+
+    _host, _certificate_filepath, session = client.parse_node_or_host_and_port(node=node, host=None, port=None)
+    adapter = session.get_adapter(f"https://{node.rest_url()}/")
+    assert isinstance(adapter, PinnedCertificateAdapter)
+
+    # The node's certificate is the only one trusted for it...
+    assert adapter.ssl_context.cert_store_stats()['x509'] == 1
+
+    # ...and its SSL context is made once, not on every request.
+    _host, _certificate_filepath, same_session = client.parse_node_or_host_and_port(node=node, host=None, port=None)
+    assert same_session is session